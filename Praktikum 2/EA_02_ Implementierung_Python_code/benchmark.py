@@ -0,0 +1,253 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+from ga_basic import genetic_algorithm_basic
+from test import queens_fitness, QueensState, MapIndex, MapColoringState, COLORS
+
+
+# Benchmark für den Genetischen Algorithmus
+#
+# Läuft über ein Raster aus Problemgröße x Populationsgröße x Engine und misst
+# Generationen/s, Fitnessbewertungen/s, Zeit bis zur ersten Lösung und den
+# Speicher-Spitzenwert. Jede Zeile der Ausgabe ist ein JSON-Objekt; mit
+# --compare werden zwei solche Dateien gegeneinander geprüft.
+#
+#   python benchmark.py --queens 8 16 32 --maps 1000 --pop-sizes 50 --output neu.jsonl
+#   python benchmark.py --compare alt.jsonl neu.jsonl
+
+ENGINES = ("basic", "delta", "numpy")
+DEFAULT_QUEENS = [8, 16, 32, 64, 128, 256, 512]
+DEFAULT_MAPS = [100, 1000, 5000]
+DEFAULT_POP_SIZES = [50, 200]
+
+
+# Problemgeneratoren
+
+def random_planar_map(regions, seed=0):
+    """
+    Zufällige planare Karte: Regionen auf einem Gitter, Kanten zu rechtem und
+    unterem Nachbarn plus je Gitterzelle eine zufällige Diagonale (Triangulierung).
+    """
+    rng = random.Random(seed)
+    width = math.ceil(math.sqrt(regions))
+    names = [f"R{i}" for i in range(regions)]
+    neighbors = {name: set() for name in names}
+
+    def connect(a, b):
+        if a < regions and b < regions:
+            neighbors[names[a]].add(names[b])
+            neighbors[names[b]].add(names[a])
+
+    for i in range(regions):
+        row, col = divmod(i, width)
+        right = i + 1 if col + 1 < width else regions
+        down = i + width
+        connect(i, right)
+        connect(i, down)
+        if col + 1 < width:
+            if rng.random() < 0.5:
+                connect(i, down + 1)
+            else:
+                connect(right, down)
+    return {name: sorted(adjacent) for name, adjacent in neighbors.items()}
+
+
+class MapFitness:
+    """map_fitness für beliebige Karten (picklebar, damit auch Prozess-Pools gehen)."""
+    def __init__(self, neighbors):
+        self.index = MapIndex(neighbors, list(neighbors))
+
+    def __call__(self, ind):
+        return MapColoringState(self.index, ind).fitness()
+
+
+def queens_problem(n):
+    return {
+        "problem": "queens",
+        "size": n,
+        "gene_pool": list(range(1, n + 1)),
+        "state_length": n,
+        "fitness_fn": queens_fitness,
+        "delta_fitness": QueensState,
+        "p_mutation": 1.0 / n,
+        "target": 1.0,  # keine Konflikte
+        "batch": lambda: _numpy_batch("queens"),
+    }
+
+
+def map_problem(regions, seed=0):
+    neighbors = random_planar_map(regions, seed)
+    fitness = MapFitness(neighbors)
+    return {
+        "problem": "map",
+        "size": regions,
+        "gene_pool": COLORS,
+        "state_length": regions,
+        "fitness_fn": fitness,
+        "delta_fitness": fitness.index.state,
+        "p_mutation": 1.0 / regions,
+        "target": 1.0 / (1 + 0.1 * len(COLORS)),  # keine Konflikte, egal wie viele Farben
+        "batch": lambda: _numpy_batch("map", neighbors),
+    }
+
+
+def _numpy_batch(problem, neighbors=None):
+    import ga_numpy
+    if problem == "queens":
+        return ga_numpy.queens_fitness_batch
+    return ga_numpy.make_map_fitness_batch(neighbors, list(neighbors))[1]
+
+
+def numpy_available():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Messung
+
+def _run_engine(engine, problem, pop_size, generations, seed, callbacks):
+    common = dict(gene_pool=problem["gene_pool"], state_length=problem["state_length"],
+                  pop_size=pop_size, generations=generations, p_crossover=0.75,
+                  p_mutation=problem["p_mutation"], seed=seed, callbacks=callbacks)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if engine == "basic":
+            genetic_algorithm_basic(fitness_fn=problem["fitness_fn"], **common)
+        elif engine == "delta":
+            genetic_algorithm_basic(fitness_fn=None, delta_fitness=problem["delta_fitness"], **common)
+        elif engine == "numpy":
+            from ga_numpy import genetic_algorithm_numpy
+            genetic_algorithm_numpy(batch_fitness_fn=problem["batch"](), verbose=False, **common)
+        else:
+            raise ValueError(f"Unbekannte Engine: {engine!r} (erlaubt: {ENGINES})")
+
+
+def run_case(engine, problem, pop_size, generations, seed=1, memory=True):
+    """Ein Messpunkt. Der Speicherlauf (tracemalloc) ist ein zweiter Lauf mit gleichem Seed."""
+    last = {}
+    first_solution = None
+
+    def observe(record):
+        nonlocal first_solution
+        last.update(record)
+        if first_solution is None and record["best"] >= problem["target"]:
+            first_solution = record["wall_time"]
+        return False
+
+    start = time.perf_counter()
+    _run_engine(engine, problem, pop_size, generations, seed, [observe])
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            _run_engine(engine, problem, pop_size, generations, seed, None)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    done = last.get("generation", -1) + 1
+    return {
+        "engine": engine,
+        "problem": problem["problem"],
+        "size": problem["size"],
+        "pop_size": pop_size,
+        "generations": done,
+        "seed": seed,
+        "seconds": elapsed,
+        "generations_per_sec": done / elapsed if elapsed else None,
+        "evals_per_sec": last.get("evaluations", 0) / elapsed if elapsed else None,
+        "time_to_solution": first_solution,
+        "best": last.get("best"),
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_grid(engines, queens_sizes, map_sizes, pop_sizes, generations, seed=1, memory=True, out=sys.stdout):
+    problems = [queens_problem(n) for n in queens_sizes] + [map_problem(r, seed) for r in map_sizes]
+    results = []
+    for problem in problems:
+        for pop_size in pop_sizes:
+            for engine in engines:
+                result = run_case(engine, problem, pop_size, generations, seed, memory)
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+                results.append(result)
+    return results
+
+
+# Vergleich zweier Läufe
+
+def _key(result):
+    return (result["engine"], result["problem"], result["size"], result["pop_size"], result["seed"])
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(old, new, tolerance=0.10):
+    """
+    Vergleicht Generationen/s je Konfiguration. Rückgabe: Liste von
+    (Schlüssel, alt, neu, Verhältnis, Regression?) – Regression, wenn neu
+    mehr als tolerance langsamer ist.
+    """
+    old_by_key = {_key(r): r for r in old}
+    rows = []
+    for result in new:
+        before = old_by_key.get(_key(result))
+        if before is None or not before["generations_per_sec"] or not result["generations_per_sec"]:
+            continue
+        ratio = result["generations_per_sec"] / before["generations_per_sec"]
+        rows.append((_key(result), before["generations_per_sec"], result["generations_per_sec"],
+                     ratio, ratio < 1 - tolerance))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark für genetic_algorithm_basic und die anderen Engines")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=None)
+    parser.add_argument("--queens", nargs="*", type=int, default=DEFAULT_QUEENS, help="N für N-Queens")
+    parser.add_argument("--maps", nargs="*", type=int, default=DEFAULT_MAPS, help="Anzahl Regionen zufälliger Karten")
+    parser.add_argument("--pop-sizes", nargs="+", type=int, default=DEFAULT_POP_SIZES)
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="JSON-Lines-Datei (Standard: stdout)")
+    parser.add_argument("--no-memory", action="store_true", help="keinen zweiten Lauf für den Speicher-Spitzenwert")
+    parser.add_argument("--compare", nargs=2, metavar=("ALT", "NEU"), help="zwei Ergebnisdateien vergleichen")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="erlaubte Verlangsamung beim Vergleich")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        rows = compare(load_results(args.compare[0]), load_results(args.compare[1]), args.tolerance)
+        regressions = 0
+        for key, before, after, ratio, regression in rows:
+            regressions += regression
+            mark = "  REGRESSION" if regression else ""
+            print(f"{'/'.join(map(str, key)):40s} {before:10.1f} -> {after:10.1f} gen/s  x{ratio:.2f}{mark}")
+        return 1 if regressions else 0
+
+    engines = args.engines or [e for e in ENGINES if e != "numpy" or numpy_available()]
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        run_grid(engines, args.queens, args.maps, args.pop_sizes, args.generations,
+                 args.seed, not args.no_memory, out)
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
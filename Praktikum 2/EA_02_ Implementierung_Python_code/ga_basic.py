@@ -1,76 +1,292 @@
-import random
-
-
-# Grundstruktur des Genetischen Algorithmus
-def genetic_algorithm_basic(
-    fitness_fn,           # Bewertungsfunktion
-    gene_pool,            # mögliche Werte für Gene (z. B. [0,1] oder Farben)
-    state_length,         # Länge eines Individuums
-    pop_size=50,          # Größe der Population
-    generations=500,      # Anzahl der Generationen
-    p_crossover=0.7,      # Wahrscheinlichkeit für Crossover
-    p_mutation=0.01       # Wahrscheinlichkeit für Mutation
-):
-    """
-    Einfache Implementierung des Genetischen Algorithmus.
-    Er verwendet Selektion, Crossover und Mutation, um bessere Lösungen zu finden.
-    """
-
-    # Startpopulation erzeugen (zufällige Individuen)
-    population = [
-        [random.choice(gene_pool) for _ in range(state_length)]
-        for _ in range(pop_size)
-    ]
-
-    # Hilfsfunktionen
-
-    # Fitness-basiertes Auswählen von zwei Eltern (Roulette Wheel)
-    def select_parents(population):
-        fitness_values = [fitness_fn(ind) for ind in population]
-        total = sum(fitness_values)
-        if total == 0:
-            # Wenn alle gleich schlecht sind, wähle zufällig
-            return random.sample(population, 2)
-        probs = [f / total for f in fitness_values]
-        parents = random.choices(population, weights=probs, k=2)
-        return parents
-
-    # Einfache Ein-Punkt-Crossover-Funktion
-    def crossover(parent1, parent2):
-        if random.random() > p_crossover:
-            return parent1[:], parent2[:]
-        point = random.randint(1, state_length - 1)
-        child1 = parent1[:point] + parent2[point:]
-        child2 = parent2[:point] + parent1[point:]
-        return child1, child2
-
-    # Mutation: zufällige Veränderung eines Gens
-    def mutate(individual):
-        for i in range(state_length):
-            if random.random() < p_mutation:
-                individual[i] = random.choice(gene_pool)
-        return individual
-
-    # Wiederhole über mehrere Generationen
-    for gen in range(generations):
-        new_population = []
-
-        # Erzeuge Nachkommen bis zur Populationsgröße
-        while len(new_population) < pop_size:
-            parent1, parent2 = select_parents(population)
-            child1, child2 = crossover(parent1, parent2)
-            new_population.append(mutate(child1))
-            if len(new_population) < pop_size:
-                new_population.append(mutate(child2))
-
-        # Neue Generation ersetzt alte
-        population = new_population
-
-        # Optional: den besten Fitnesswert pro Generation ausgeben
-        if gen % 50 == 0 or gen == generations - 1:
-            best = max(population, key=fitness_fn)
-            print(f"Generation {gen:3d} | Beste Fitness: {fitness_fn(best):.4f}")
-
-    #Beste gefundene Lösung zurückgeben
-    best_solution = max(population, key=fitness_fn)
-    return best_solution
+import os
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from ga_selection import get_selection, elite_indices
+
+
+# Fitness-Cache: jedes Genom wird nur einmal bewertet
+class FitnessCache:
+    """
+    Merkt sich Fitnesswerte pro Genom (Schlüssel: Tupel der Gene).
+    maxsize begrenzt die Anzahl der Einträge (LRU), None = unbegrenzt.
+    """
+
+    def __init__(self, fitness_fn, maxsize=10000):
+        self.fitness_fn = fitness_fn
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+    def __len__(self):
+        return len(self._store)
+
+    def __call__(self, individual):
+        return self.evaluate([individual])[0]
+
+    def _put(self, key, value):
+        if self.maxsize == 0:
+            return
+        self._store[key] = value
+        if self.maxsize is not None and len(self._store) > self.maxsize:
+            self._store.popitem(last=False)  # ältesten Eintrag verdrängen
+
+    def evaluate(self, population, executor=None, chunksize=None):
+        """
+        Fitnessvektor einer ganzen Population (jedes neue Genom genau einmal).
+        Mit executor werden die neuen Genome parallel bewertet; executor.map
+        liefert die Ergebnisse in Eingabereihenfolge, das Ergebnis ist also
+        unabhängig von der Anzahl der Worker.
+        """
+        keys = [tuple(ind) for ind in population]
+        values = {}
+        todo = []
+        for key in keys:
+            if key in values:
+                self.hits += 1
+            elif key in self._store:
+                self.hits += 1
+                self._store.move_to_end(key)
+                values[key] = self._store[key]
+            else:
+                self.misses += 1
+                values[key] = None
+                todo.append(key)
+        if executor is None or len(todo) < 2:
+            results = [self.fitness_fn(list(key)) for key in todo]
+        else:
+            if chunksize is None:
+                workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+                chunksize = max(1, len(todo) // (4 * workers))
+            results = executor.map(self.fitness_fn, [list(key) for key in todo], chunksize=chunksize)
+        for key, value in zip(todo, results):
+            values[key] = value
+            self._put(key, value)
+        return [values[key] for key in keys]
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# Pool für parallele Fitnessbewertung
+def make_executor(kind="process", workers=None):
+    """
+    "process": ProcessPoolExecutor (fitness_fn muss picklebar sein, also auf Modulebene definiert)
+    "thread":  ThreadPoolExecutor (nur sinnvoll, wenn fitness_fn den GIL freigibt, z. B. NumPy)
+    """
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    raise ValueError(f"Unbekannter Executor: {kind!r}")
+
+
+# Bausteine einer Generation (rng: random-Modul oder random.Random)
+
+def random_population(gene_pool, state_length, pop_size, rng=random):
+    return [
+        [rng.choice(gene_pool) for _ in range(state_length)]
+        for _ in range(pop_size)
+    ]
+
+# Einfache Ein-Punkt-Crossover-Funktion
+def crossover(parent1, parent2, p_crossover, rng=random):
+    if rng.random() > p_crossover:
+        return parent1[:], parent2[:]
+    point = rng.randint(1, len(parent1) - 1)
+    child1 = parent1[:point] + parent2[point:]
+    child2 = parent2[:point] + parent1[point:]
+    return child1, child2
+
+# Mutation: zufällige Veränderung eines Gens
+def mutate(individual, gene_pool, p_mutation, rng=random):
+    for i in range(len(individual)):
+        if rng.random() < p_mutation:
+            individual[i] = rng.choice(gene_pool)
+    return individual
+
+def breed(population, fitness_values, gene_pool, p_crossover, p_mutation, rng=random, timings=None,
+          selection="roulette", elitism=0):
+    """
+    Erzeugt Nachkommen bis zur Populationsgröße, phasenweise: erst alle
+    Eltern auf einmal wählen (selection, siehe ga_selection.py), dann
+    Crossover, dann Mutation. Die elitism besten Individuen werden unverändert
+    übernommen. Rückgabe: Kinder und je Kind der Index des Elternteils, von dem
+    sein Anfang stammt. Mit timings (dict) wird die Zeit pro Phase aufsummiert.
+    """
+    pop_size = len(population)
+    t0 = time.perf_counter()
+    elites = elite_indices(fitness_values, min(elitism, pop_size))
+    n_children = pop_size - len(elites)
+    selected = get_selection(selection)(fitness_values, 2 * ((n_children + 1) // 2), rng)
+    t1 = time.perf_counter()
+    children, parents = [], []
+    for i1, i2 in zip(selected[0::2], selected[1::2]):
+        children.extend(crossover(population[i1], population[i2], p_crossover, rng))
+        parents += (i1, i2)
+    del children[n_children:], parents[n_children:]
+    t2 = time.perf_counter()
+    for child in children:
+        mutate(child, gene_pool, p_mutation, rng)
+    children += [population[i][:] for i in elites]
+    parents += elites
+    t3 = time.perf_counter()
+    if timings is not None:
+        timings["selection"] = timings.get("selection", 0.0) + t1 - t0
+        timings["crossover"] = timings.get("crossover", 0.0) + t2 - t1
+        timings["mutation"] = timings.get("mutation", 0.0) + t3 - t2
+    return children, parents
+
+def next_generation(population, fitness_values, gene_pool, p_crossover, p_mutation, rng=random, timings=None,
+                    selection="roulette", elitism=0):
+    """Erzeugt Nachkommen (Selektion, Crossover, Mutation) bis zur Populationsgröße."""
+    return breed(population, fitness_values, gene_pool, p_crossover, p_mutation, rng, timings,
+                 selection, elitism)[0]
+
+
+# Inkrementelle Fitness
+#
+# delta_fitness ist eine Funktion Individuum -> Zustand. Ein Zustand kennt sein
+# Individuum (state.individual) und bietet fitness(), copy() und change(i, wert);
+# change passt die Fitness nach Änderung eines einzelnen Gens an, ohne alles neu
+# zu berechnen (z. B. O(1) bei N-Queens, O(Grad) beim Landkarten-Färben).
+
+def derive_state(state, individual):
+    """Zustand eines Kindes aus dem Zustand des Elternteils (nur geänderte Gene)."""
+    state = state.copy()
+    for i, value in enumerate(individual):
+        if state.individual[i] != value:
+            state.change(i, value)
+    return state
+
+def next_generation_delta(population, states, fitness_values, gene_pool, p_crossover, p_mutation,
+                          rng=random, timings=None, selection="roulette", elitism=0):
+    """
+    Wie next_generation, aber jedes Kind übernimmt den Fitnesszustand des
+    Elternteils, von dem sein Anfang stammt, und aktualisiert nur die Gene,
+    die durch Crossover oder Mutation anders sind.
+    """
+    children, parents = breed(population, fitness_values, gene_pool, p_crossover, p_mutation, rng, timings,
+                              selection, elitism)
+    start = time.perf_counter()
+    new_states = [derive_state(states[parent], child) for child, parent in zip(children, parents)]
+    if timings is not None:
+        timings["evaluation"] = timings.get("evaluation", 0.0) + time.perf_counter() - start
+    return children, new_states
+
+
+# Kennzahlen einer Generation für Callbacks (siehe ga_telemetry.py)
+def generation_record(gen, population, fitness_values, evaluations, hit_rate, timings, started):
+    return {
+        "generation": gen,
+        "best": max(fitness_values),
+        "mean": sum(fitness_values) / len(fitness_values),
+        "worst": min(fitness_values),
+        "diversity": len(set(map(tuple, population))) / len(population),  # Anteil verschiedener Genome
+        "evaluations": evaluations,
+        "cache_hit_rate": hit_rate,
+        "time": dict(timings),
+        "wall_time": time.perf_counter() - started,
+    }
+
+
+# Grundstruktur des Genetischen Algorithmus
+def genetic_algorithm_basic(
+    fitness_fn,           # Bewertungsfunktion
+    gene_pool,            # mögliche Werte für Gene (z. B. [0,1] oder Farben)
+    state_length,         # Länge eines Individuums
+    pop_size=50,          # Größe der Population
+    generations=500,      # Anzahl der Generationen
+    p_crossover=0.7,      # Wahrscheinlichkeit für Crossover
+    p_mutation=0.01,      # Wahrscheinlichkeit für Mutation
+    cache=None,           # optional: eigener FitnessCache (z. B. um Zähler auszulesen)
+    cache_size=10000,     # maximale Anzahl gemerkter Fitnesswerte (None = unbegrenzt)
+    executor=None,        # None, "process", "thread" oder ein eigener concurrent.futures.Executor
+    workers=None,         # Anzahl Worker, falls der Pool hier erzeugt wird
+    chunksize=None,       # Batchgröße für executor.map (None = automatisch)
+    seed=None,            # Startwert für den Zufallsgenerator (reproduzierbare Läufe)
+    delta_fitness=None,   # optional: inkrementelle Fitness (Individuum -> Zustand), ersetzt fitness_fn
+    callbacks=None,       # optional: Liste von Funktionen record -> bool (True = Abbruch)
+    selection="roulette", # "roulette", "alias", "sus", "tournament" oder eigene Funktion
+    elitism=0             # Anzahl der besten Individuen, die unverändert überleben
+):
+    """
+    Einfache Implementierung des Genetischen Algorithmus.
+    Er verwendet Selektion, Crossover und Mutation, um bessere Lösungen zu finden.
+    Die Fitness jeder Generation wird genau einmal berechnet (über den FitnessCache),
+    auf Wunsch parallel. Ein hier erzeugter Pool wird für alle Generationen
+    wiederverwendet und am Ende geschlossen.
+    Mit delta_fitness wird die Fitness der Kinder aus den Zuständen der Eltern
+    fortgeschrieben (ohne Cache und Pool, da jede Änderung nur O(n) kostet).
+    Jeder Callback bekommt nach jeder Generation ein Dict mit Kennzahlen
+    (siehe generation_record); gibt einer True zurück, endet der Lauf.
+    Ohne Callbacks werden keine Kennzahlen berechnet.
+    Die Selektion zieht alle Eltern einer Generation auf einmal (O(pop_size)
+    bzw. O(pop_size log pop_size) statt O(pop_size²) pro Generation).
+    """
+    if delta_fitness is not None and executor is not None:
+        raise ValueError("delta_fitness und executor können nicht kombiniert werden")
+
+    get_selection(selection)  # unbekannte Namen sofort melden
+    if cache is None:
+        cache = FitnessCache(fitness_fn, maxsize=cache_size)
+    rng = random.Random(seed) if seed is not None else random
+    timings = {} if callbacks else None
+    started = time.perf_counter()
+
+    own_executor = isinstance(executor, str)
+    if own_executor:
+        executor = make_executor(executor, workers)
+    try:
+        # Startpopulation erzeugen (zufällige Individuen)
+        population = random_population(gene_pool, state_length, pop_size, rng)
+        if delta_fitness is None:
+            fitness_values = cache.evaluate(population, executor, chunksize)
+        else:
+            states = [delta_fitness(ind) for ind in population]
+            fitness_values = [state.fitness() for state in states]
+        evaluations = len(population)
+
+        # Wiederhole über mehrere Generationen
+        for gen in range(generations):
+            # Neue Generation ersetzt alte (und wird einmal bewertet)
+            if delta_fitness is None:
+                population = next_generation(population, fitness_values, gene_pool,
+                                             p_crossover, p_mutation, rng, timings, selection, elitism)
+                start = time.perf_counter()
+                fitness_values = cache.evaluate(population, executor, chunksize)
+                if timings is not None:
+                    timings["evaluation"] = timings.get("evaluation", 0.0) + time.perf_counter() - start
+            else:
+                population, states = next_generation_delta(population, states, fitness_values, gene_pool,
+                                                           p_crossover, p_mutation, rng, timings,
+                                                           selection, elitism)
+                fitness_values = [state.fitness() for state in states]
+                evaluations += len(population)
+
+            stop = False
+            if callbacks:
+                record = generation_record(
+                    gen, population, fitness_values,
+                    cache.misses if delta_fitness is None else evaluations,
+                    cache.hit_rate() if delta_fitness is None else None,
+                    timings, started)
+                timings.clear()
+                stop = any([callback(record) for callback in callbacks])
+
+            # Optional: den besten Fitnesswert pro Generation ausgeben
+            if gen % 50 == 0 or gen == generations - 1 or stop:
+                print(f"Generation {gen:3d} | Beste Fitness: {max(fitness_values):.4f}")
+            if stop:
+                break
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    #Beste gefundene Lösung zurückgeben
+    best_index = max(range(len(population)), key=fitness_values.__getitem__)
+    return population[best_index]
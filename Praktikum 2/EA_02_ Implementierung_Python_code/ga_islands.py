@@ -0,0 +1,208 @@
+import multiprocessing as mp
+import random
+
+from ga_basic import FitnessCache, random_population, next_generation
+
+
+# Insel-Modell: mehrere Teilpopulationen entwickeln sich getrennt
+# (je ein Prozess) und tauschen alle migration_interval Generationen
+# ihre besten Individuen aus.
+
+TOPOLOGIES = ("ring", "full")
+
+
+class Island:
+    """Eine Teilpopulation mit eigenem Zufallsgenerator und Fitness-Cache."""
+
+    def __init__(self, fitness_fn, gene_pool, state_length, pop_size,
+                 p_crossover, p_mutation, seed, cache_size=10000, selection="roulette", elitism=0):
+        self.gene_pool = gene_pool
+        self.selection = selection
+        self.elitism = elitism
+        self.p_crossover = p_crossover
+        self.p_mutation = p_mutation
+        self.rng = random.Random(seed)
+        self.cache = FitnessCache(fitness_fn, maxsize=cache_size)
+        self.population = random_population(gene_pool, state_length, pop_size, self.rng)
+        self.fitness_values = self.cache.evaluate(self.population)
+        self.generation = 0
+
+    def receive(self, immigrants):
+        """Einwanderer ersetzen die schlechtesten Individuen."""
+        if not immigrants:
+            return
+        worst_first = sorted(range(len(self.population)), key=self.fitness_values.__getitem__)
+        for index, (individual, _) in zip(worst_first, immigrants):
+            self.population[index] = list(individual)
+        self.fitness_values = self.cache.evaluate(self.population)
+
+    def evolve(self, generations):
+        for _ in range(generations):
+            self.population = next_generation(self.population, self.fitness_values, self.gene_pool,
+                                              self.p_crossover, self.p_mutation, self.rng,
+                                              selection=self.selection, elitism=self.elitism)
+            self.fitness_values = self.cache.evaluate(self.population)
+        self.generation += generations
+
+    def emigrants(self, count):
+        """Die count besten Individuen als (Individuum, Fitness)-Paare."""
+        best_first = sorted(range(len(self.population)), key=self.fitness_values.__getitem__, reverse=True)
+        return [(self.population[i][:], self.fitness_values[i]) for i in best_first[:count]]
+
+    def stats(self):
+        return {
+            "generation": self.generation,
+            "best": max(self.fitness_values),
+            "mean": sum(self.fitness_values) / len(self.fitness_values),
+            "evaluations": self.cache.misses,
+        }
+
+    def epoch(self, immigrants, generations, migrants):
+        self.receive(immigrants)
+        self.evolve(generations)
+        return self.emigrants(migrants), self.stats()
+
+
+def _island_process(conn, island_args):
+    # Befehle über die Pipe: ("epoch", (einwanderer, generationen, auswanderer)) oder ("stop", None)
+    island = Island(*island_args)
+    while True:
+        command, payload = conn.recv()
+        if command == "epoch":
+            conn.send(island.epoch(*payload))
+        elif command == "stop":
+            conn.send(island.emigrants(1)[0])
+            break
+    conn.close()
+
+
+def route_migrants(outgoing, topology, migrants):
+    """
+    Verteilt die Auswanderer jeder Insel:
+    "ring": Insel i bekommt die Besten von Insel i-1,
+    "full": Insel i bekommt die migrants Besten aller anderen Inseln.
+    """
+    n = len(outgoing)
+    if topology == "ring":
+        return [outgoing[(i - 1) % n] for i in range(n)]
+    if topology == "full":
+        incoming = []
+        for i in range(n):
+            pool = [m for j in range(n) if j != i for m in outgoing[j]]
+            pool.sort(key=lambda m: m[1], reverse=True)
+            incoming.append(pool[:migrants])
+        return incoming
+    raise ValueError(f"Unbekannte Topologie: {topology!r} (erlaubt: {TOPOLOGIES})")
+
+
+def island_model(
+    fitness_fn,              # Bewertungsfunktion (picklebar, also auf Modulebene)
+    gene_pool,               # mögliche Werte für Gene
+    state_length,            # Länge eines Individuums
+    islands=4,               # Anzahl der Inseln (je ein Prozess)
+    pop_size=50,             # Größe jeder Teilpopulation
+    generations=500,         # Anzahl der Generationen je Insel
+    p_crossover=0.7,         # Wahrscheinlichkeit für Crossover
+    p_mutation=0.01,         # Wahrscheinlichkeit für Mutation
+    migration_interval=25,   # alle K Generationen wandern Individuen aus
+    migrants=2,              # die M besten Individuen je Insel wandern
+    topology="ring",         # "ring" oder "full"
+    selection="roulette",    # Selektionsverfahren je Insel (Name aus ga_selection.SELECTIONS)
+    elitism=0,               # Anzahl der besten Individuen, die je Insel unverändert überleben
+    cache_size=10000,        # maximale Anzahl gemerkter Fitnesswerte je Insel (None = unbegrenzt)
+    seed=None,               # Startwert; jede Insel bekommt daraus einen eigenen
+    processes=True,          # False: alle Inseln nacheinander im aktuellen Prozess
+    verbose=True             # Fortschritt nach jeder Migration ausgeben
+):
+    """
+    Insel-Modell auf Basis der Schritte von genetic_algorithm_basic.
+    Rückgabe: (beste Lösung, beste Fitness, Verlauf) – der Verlauf enthält nach
+    jeder Migration einen Eintrag pro Insel (Generation, beste/mittlere Fitness,
+    Anzahl Bewertungen).
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unbekannte Topologie: {topology!r} (erlaubt: {TOPOLOGIES})")
+    master = random.Random(seed)
+    island_args = [
+        (fitness_fn, gene_pool, state_length, pop_size, p_crossover, p_mutation, master.getrandbits(32),
+         cache_size, selection, elitism)
+        for _ in range(islands)
+    ]
+
+    workers, conns, local = [], [], []
+    if processes:
+        for args in island_args:
+            parent_conn, child_conn = mp.Pipe()
+            worker = mp.Process(target=_island_process, args=(child_conn, args), daemon=True)
+            worker.start()
+            child_conn.close()
+            workers.append(worker)
+            conns.append(parent_conn)
+    else:
+        local = [Island(*args) for args in island_args]
+
+    history = []
+    immigrants = [[] for _ in range(islands)]
+    try:
+        done = 0
+        while done < generations:
+            step = min(migration_interval, generations - done)
+            if processes:
+                for conn, incoming in zip(conns, immigrants):
+                    conn.send(("epoch", (incoming, step, migrants)))
+                results = [conn.recv() for conn in conns]
+            else:
+                results = [island.epoch(incoming, step, migrants)
+                           for island, incoming in zip(local, immigrants)]
+            done += step
+
+            outgoing = [emigrants for emigrants, _ in results]
+            for i, (_, stats) in enumerate(results):
+                history.append({"island": i, **stats})
+            immigrants = route_migrants(outgoing, topology, migrants)
+
+            if verbose:
+                bests = " ".join(f"{stats['best']:.4f}" for _, stats in results)
+                print(f"Generation {done:4d} | Beste Fitness je Insel: {bests}")
+
+        # Ergebnis zusammenführen: bestes Individuum über alle Inseln
+        if processes:
+            for conn in conns:
+                conn.send(("stop", None))
+            finals = [conn.recv() for conn in conns]
+        else:
+            finals = [island.emigrants(1)[0] for island in local]
+    finally:
+        for conn in conns:
+            conn.close()
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    best_solution, best_fitness = max(finals, key=lambda m: m[1])
+    return best_solution, best_fitness, history
+
+
+# Ausführen
+
+if __name__ == "__main__":
+    from test import queens_fitness
+
+    n = 32
+    best, fitness, history = island_model(
+        fitness_fn=queens_fitness,
+        gene_pool=list(range(1, n + 1)),
+        state_length=n,
+        islands=4,
+        pop_size=60,
+        generations=300,
+        p_crossover=0.75,
+        p_mutation=1.0/n,
+        migration_interval=25,
+        migrants=2,
+        topology="ring",
+        seed=1
+    )
+    print(f"\n {n}-Queens (Insel-Modell) – beste gefundene Lösung:", best)
+    print("Konflikte:", int(round(1 / fitness - 1)))
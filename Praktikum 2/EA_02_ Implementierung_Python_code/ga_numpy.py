@@ -0,0 +1,178 @@
+import time
+
+import numpy as np
+
+
+# Vektorisierte Variante des Genetischen Algorithmus (NumPy)
+#
+# Die Population ist eine 2-D-Matrix (pop_size x state_length) mit Indizes in
+# gene_pool. Die Fitnessfunktion bekommt die ganze Matrix und liefert einen
+# Fitnessvektor zurück (eine Bewertung pro Zeile).
+
+def genetic_algorithm_numpy(
+    batch_fitness_fn,     # Bewertungsfunktion für die ganze Populationsmatrix
+    gene_pool,            # mögliche Werte für Gene
+    state_length,         # Länge eines Individuums
+    pop_size=50,          # Größe der Population
+    generations=500,      # Anzahl der Generationen
+    p_crossover=0.7,      # Wahrscheinlichkeit für Crossover
+    p_mutation=0.01,      # Wahrscheinlichkeit für Mutation
+    seed=None,            # Startwert für den Zufallsgenerator
+    verbose=True,         # Fortschritt alle 50 Generationen ausgeben
+    callbacks=None        # wie bei genetic_algorithm_basic: record -> bool (True = Abbruch)
+):
+    """
+    Gleicher Ablauf wie genetic_algorithm_basic, aber pro Generation nur
+    Matrixoperationen: Roulette-Selektion über kumulierte Summen, Ein-Punkt-
+    Crossover über Masken und Mutation über eine Bernoulli-Maske.
+    Rückgabe: bestes Individuum als Liste von Werten aus gene_pool.
+    """
+    started = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    n_genes = len(gene_pool)
+    n_pairs = (pop_size + 1) // 2
+    columns = np.arange(state_length)
+
+    # Startpopulation erzeugen (zufällige Indizes in gene_pool)
+    population = rng.integers(0, n_genes, size=(pop_size, state_length), dtype=np.int32)
+    fitness_values = np.asarray(batch_fitness_fn(population), dtype=float)
+
+    for gen in range(generations):
+        # Selektion (Roulette Wheel über kumulierte Summe)
+        cumulative = np.cumsum(fitness_values)
+        total = cumulative[-1]
+        if total > 0:
+            r = rng.random(2 * n_pairs) * total
+            parents = np.searchsorted(cumulative, r, side="right")
+            np.minimum(parents, pop_size - 1, out=parents)
+        else:
+            # Wenn alle gleich schlecht sind, wähle zufällig
+            parents = rng.integers(0, pop_size, size=2 * n_pairs)
+        mothers = population[parents[0::2]]
+        fathers = population[parents[1::2]]
+
+        # Ein-Punkt-Crossover: Maske "Gen stammt vom ersten Elternteil"
+        points = rng.integers(1, state_length, size=n_pairs)
+        no_cross = rng.random(n_pairs) > p_crossover
+        points[no_cross] = state_length
+        mask = columns[None, :] < points[:, None]
+        children = np.empty((2 * n_pairs, state_length), dtype=population.dtype)
+        children[0::2] = np.where(mask, mothers, fathers)
+        children[1::2] = np.where(mask, fathers, mothers)
+        population = children[:pop_size]
+
+        # Mutation: Bernoulli-Maske für die ganze Generation
+        mutation_mask = rng.random(population.shape) < p_mutation
+        population[mutation_mask] = rng.integers(0, n_genes, size=int(mutation_mask.sum()))
+
+        fitness_values = np.asarray(batch_fitness_fn(population), dtype=float)
+
+        stop = False
+        if callbacks:
+            record = {
+                "generation": gen,
+                "best": float(fitness_values.max()),
+                "mean": float(fitness_values.mean()),
+                "worst": float(fitness_values.min()),
+                "evaluations": (gen + 2) * pop_size,
+                "wall_time": time.perf_counter() - started,
+            }
+            stop = any([callback(record) for callback in callbacks])
+
+        if verbose and (gen % 50 == 0 or gen == generations - 1 or stop):
+            print(f"Generation {gen:3d} | Beste Fitness: {fitness_values.max():.4f}")
+        if stop:
+            break
+
+    best = population[int(np.argmax(fitness_values))]
+    return [gene_pool[i] for i in best]
+
+
+# Vektorisierte Fitnessfunktionen zu test.py
+
+def queens_conflicts_batch(population):
+    """
+    Konflikte je Zeile für N-Queens (Gen = Zeile der Dame in Spalte c).
+    Gleiche Zeile, Diagonale (Zeile - c) und Gegendiagonale (Zeile + c) werden
+    je Individuum sortiert; jede Gruppe aus L gleichen Werten ergibt L*(L-1)/2
+    Konfliktpaare. Das Ergebnis entspricht queens_fitness, ohne O(n²) Paare.
+    """
+    population = np.asarray(population)
+    m, n = population.shape
+    cols = np.arange(n, dtype=population.dtype)
+    conflicts = np.zeros(m, dtype=np.int64)
+    new_run = np.empty((m, n), dtype=bool)
+    new_run[:, 0] = True
+    for key in (population, population - cols, population + cols):
+        ordered = np.sort(key, axis=1)
+        np.not_equal(ordered[:, 1:], ordered[:, :-1], out=new_run[:, 1:])
+        # Position des ersten gleichen Werts; Abstand dazu = Paare mit Vorgängern
+        run_start = np.maximum.accumulate(np.where(new_run, cols, 0), axis=1)
+        conflicts += (cols - run_start).sum(axis=1)
+    return conflicts
+
+def queens_fitness_batch(population):
+    """Weniger Konflikte = bessere Fitness (maximieren)."""
+    return 1.0 / (1 + queens_conflicts_batch(population))
+
+def make_map_fitness_batch(neighbors, regions):
+    """
+    Erzeugt map_conflicts/map_fitness für eine Landkarte als Batch-Funktionen.
+    Die Kantenliste wird einmal vorberechnet (jede Kante nur einmal).
+    """
+    index = {r: i for i, r in enumerate(regions)}
+    edges = np.array(
+        [(index[r], index[n]) for r in regions for n in neighbors[r] if r < n],
+        dtype=np.intp
+    ).reshape(-1, 2)
+
+    def map_conflicts_batch(population):
+        population = np.asarray(population)
+        return (population[:, edges[:, 0]] == population[:, edges[:, 1]]).sum(axis=1)
+
+    def map_fitness_batch(population):
+        population = np.asarray(population)
+        conflicts = map_conflicts_batch(population)
+        ordered = np.sort(population, axis=1)
+        used_colors = 1 + (ordered[:, 1:] != ordered[:, :-1]).sum(axis=1)
+        return 1.0 / (1 + conflicts + 0.1 * used_colors)
+
+    return map_conflicts_batch, map_fitness_batch
+
+
+# Ausführen
+
+if __name__ == "__main__":
+    from test import NEIGHBORS, REGIONS, COLORS, queens_fitness, map_conflicts
+
+    n = 8
+    gene_pool = list(range(1, n + 1))
+    best_queens = genetic_algorithm_numpy(
+        batch_fitness_fn=queens_fitness_batch,
+        gene_pool=gene_pool,
+        state_length=n,
+        pop_size=60,
+        generations=600,
+        p_crossover=0.75,
+        p_mutation=1.0/n,
+        seed=1
+    )
+    print(" 8-Queens (NumPy) – beste gefundene Lösung:", best_queens)
+    print("Konflikte:", int((1 / queens_fitness(best_queens)) - 1))
+
+    _, map_fitness_batch = make_map_fitness_batch(NEIGHBORS, REGIONS)
+    best_map = genetic_algorithm_numpy(
+        batch_fitness_fn=map_fitness_batch,
+        gene_pool=COLORS,
+        state_length=len(REGIONS),
+        pop_size=80,
+        generations=800,
+        p_crossover=0.75,
+        p_mutation=0.05,
+        seed=1
+    )
+    print("\n Landkarten-Färben (NumPy) – beste gefundene Lösung:")
+    for i, r in enumerate(REGIONS):
+        print(f"{r}: {best_map[i]}")
+    print("Konflikte:", map_conflicts(best_map))
+    print("Verwendete Farben:", len(set(best_map)))
@@ -0,0 +1,108 @@
+import random
+from bisect import bisect_right
+from itertools import accumulate
+
+
+# Selektionsverfahren: einmal pro Generation aufbauen, dann alle Eltern
+# auf einmal ziehen. Signatur: select(fitness_values, k, rng) -> k Indizes.
+
+def _uniform(n, k, rng):
+    # Wenn alle gleich schlecht sind, wähle zufällig
+    return [rng.randrange(n) for _ in range(k)]
+
+
+def roulette_selection(fitness_values, k, rng=random):
+    """Roulette Wheel: kumulierte Summe einmal bilden, dann k-mal binär suchen – O(n + k log n)."""
+    cumulative = list(accumulate(fitness_values))
+    total = cumulative[-1]
+    if total == 0:
+        return _uniform(len(fitness_values), k, rng)
+    last = len(cumulative) - 1
+    return [min(bisect_right(cumulative, rng.random() * total), last) for _ in range(k)]
+
+
+def alias_selection(fitness_values, k, rng=random):
+    """Alias-Methode nach Vose: Tabelle in O(n), jede Ziehung in O(1)."""
+    n = len(fitness_values)
+    total = sum(fitness_values)
+    if total == 0:
+        return _uniform(n, k, rng)
+    scaled = [f * n / total for f in fitness_values]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Reste (Rundungsfehler) behalten Wahrscheinlichkeit 1
+    result = []
+    for _ in range(k):
+        i = rng.randrange(n)
+        result.append(i if rng.random() < prob[i] else alias[i])
+    return result
+
+
+def sus_selection(fitness_values, k, rng=random):
+    """
+    Stochastic Universal Sampling: k gleichmäßig verteilte Zeiger mit einem
+    Zufallsstart – O(n + k). Danach gemischt, damit Paare nicht nur Nachbarn sind.
+    """
+    if k == 0:
+        return []  # z. B. elitism >= pop_size: keine Eltern nötig
+    total = sum(fitness_values)
+    if total == 0:
+        return _uniform(len(fitness_values), k, rng)
+    step = total / k
+    pointer = rng.random() * step
+    result = []
+    cumulative = 0.0
+    i = 0
+    last = len(fitness_values) - 1
+    for _ in range(k):
+        while i < last and cumulative + fitness_values[i] <= pointer:
+            cumulative += fitness_values[i]
+            i += 1
+        result.append(i)
+        pointer += step
+    rng.shuffle(result)
+    return result
+
+
+def tournament_selection(size=2):
+    """Turnierselektion: bester von size zufällig gezogenen Individuen – O(k * size)."""
+    def select(fitness_values, k, rng=random):
+        n = len(fitness_values)
+        return [
+            max((rng.randrange(n) for _ in range(size)), key=fitness_values.__getitem__)
+            for _ in range(k)
+        ]
+    return select
+
+
+SELECTIONS = {
+    "roulette": roulette_selection,
+    "alias": alias_selection,
+    "sus": sus_selection,
+    "tournament": tournament_selection(2),
+}
+
+
+def get_selection(selection):
+    """Name aus SELECTIONS oder eigene Funktion (fitness_values, k, rng) -> Indizes."""
+    if callable(selection):
+        return selection
+    try:
+        return SELECTIONS[selection]
+    except KeyError:
+        raise ValueError(f"Unbekannte Selektion: {selection!r} (erlaubt: {sorted(SELECTIONS)})") from None
+
+
+def elite_indices(fitness_values, count):
+    """Indizes der count besten Individuen (Elitismus)."""
+    if count <= 0:
+        return []
+    return sorted(range(len(fitness_values)), key=fitness_values.__getitem__, reverse=True)[:count]
@@ -0,0 +1,51 @@
+import json
+
+
+# Callbacks für genetic_algorithm_basic(callbacks=[...])
+#
+# Jeder Callback bekommt nach jeder Generation ein Dict (siehe
+# ga_basic.generation_record) und gibt True zurück, wenn der Lauf enden soll.
+
+class JsonLinesSink:
+    """Schreibt jede Generation als eine JSON-Zeile (Datei oder offener Stream)."""
+
+    def __init__(self, target):
+        self._own = isinstance(target, str)
+        self.stream = open(target, "w", encoding="utf-8") if self._own else target
+
+    def __call__(self, record):
+        self.stream.write(json.dumps(record) + "\n")
+        return False
+
+    def close(self):
+        if self._own:
+            self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def stop_at_fitness(target=1.0):
+    """Abbruch, sobald die beste Fitness target erreicht (1.0 = keine Konflikte)."""
+    def callback(record):
+        return record["best"] >= target
+    return callback
+
+
+def stop_on_stagnation(window=100, min_delta=0.0):
+    """Abbruch, wenn sich die beste Fitness window Generationen lang nicht um mehr als min_delta verbessert."""
+    best = None
+    since = 0
+
+    def callback(record):
+        nonlocal best, since
+        if best is None or record["best"] > best + min_delta:
+            best = record["best"]
+            since = 0
+        else:
+            since += 1
+        return since >= window
+    return callback
@@ -1,4 +1,8 @@
+import random
+from collections import Counter
+
 from ga_basic import genetic_algorithm_basic  # deine GA-Implementierung importieren
+from ga_telemetry import stop_at_fitness
 
 
 # 1) 8-Queens-Problem
@@ -16,7 +20,47 @@ def queens_fitness(ind):
                 conflicts += 1
     return 1.0 / (1 + conflicts)
 
-def solve_queens(n=8):
+class QueensState:
+    """
+    Inkrementelle Variante von queens_fitness: zählt Damen pro Zeile,
+    Diagonale und Gegendiagonale. Ein geändertes Gen kostet O(1).
+    """
+    def __init__(self, ind):
+        self.individual = list(ind)
+        self.lines = Counter()
+        self.conflicts = 0
+        for c, r in enumerate(self.individual):
+            self._add(c, r)
+
+    def _keys(self, c, r):
+        return ("row", r), ("diag", r - c), ("anti", r + c)
+
+    def _add(self, c, r):
+        for key in self._keys(c, r):
+            self.conflicts += self.lines[key]
+            self.lines[key] += 1
+
+    def _remove(self, c, r):
+        for key in self._keys(c, r):
+            self.lines[key] -= 1
+            self.conflicts -= self.lines[key]
+
+    def change(self, c, r):
+        self._remove(c, self.individual[c])
+        self.individual[c] = r
+        self._add(c, r)
+
+    def copy(self):
+        other = QueensState.__new__(QueensState)
+        other.individual = self.individual[:]
+        other.lines = self.lines.copy()
+        other.conflicts = self.conflicts
+        return other
+
+    def fitness(self):
+        return 1.0 / (1 + self.conflicts)
+
+def solve_queens(n=8, executor=None, incremental=False):
     # Gene: erlaubte Zeilenpositionen (1..n)
     gene_pool = list(range(1, n + 1))
     best = genetic_algorithm_basic(
@@ -26,7 +70,10 @@ def solve_queens(n=8):
         pop_size=60,
         generations=600,
         p_crossover=0.75,
-        p_mutation=1.0/n  # Daumenregel: ~1/m
+        p_mutation=1.0/n,  # Daumenregel: ~1/m
+        executor=executor,  # z. B. "process" für parallele Fitnessbewertung
+        delta_fitness=QueensState if incremental else None,
+        callbacks=[stop_at_fitness(1.0)]  # keine Konflikte mehr -> fertig
     )
     return best
 
@@ -55,13 +102,75 @@ def map_conflicts(coloring):
                 conflicts += 1
     return conflicts
 
+class MapIndex:
+    """Vorberechneter Nachbarschaftsindex (Regionen als Zahlen) für MapColoringState."""
+    def __init__(self, neighbors, regions):
+        index = {r: i for i, r in enumerate(regions)}
+        adjacent = [set() for _ in regions]
+        for r in regions:
+            for n in neighbors[r]:
+                adjacent[index[r]].add(index[n])
+                adjacent[index[n]].add(index[r])
+        self.adjacent = [sorted(a) for a in adjacent]
+
+    def state(self, ind):
+        return MapColoringState(self, ind)
+
+class MapColoringState:
+    """
+    Inkrementelle Variante von map_fitness: Konflikte pro Region und Anzahl
+    Regionen pro Farbe. Ein geändertes Gen kostet O(Grad der Region).
+    """
+    def __init__(self, index, ind):
+        self.index = index
+        self.individual = list(ind)
+        self.region_conflicts = [
+            sum(self.individual[j] == self.individual[i] for j in index.adjacent[i])
+            for i in range(len(self.individual))
+        ]
+        self.conflicts = sum(self.region_conflicts) // 2
+        self.color_counts = Counter(self.individual)
+
+    def change(self, i, color):
+        old = self.individual[i]
+        if old == color:
+            return
+        for j in self.index.adjacent[i]:
+            if self.individual[j] == old:
+                self.region_conflicts[j] -= 1
+                self.region_conflicts[i] -= 1
+                self.conflicts -= 1
+            elif self.individual[j] == color:
+                self.region_conflicts[j] += 1
+                self.region_conflicts[i] += 1
+                self.conflicts += 1
+        self.individual[i] = color
+        self.color_counts[old] -= 1
+        if not self.color_counts[old]:
+            del self.color_counts[old]
+        self.color_counts[color] += 1
+
+    def copy(self):
+        other = MapColoringState.__new__(MapColoringState)
+        other.index = self.index
+        other.individual = self.individual[:]
+        other.region_conflicts = self.region_conflicts[:]
+        other.conflicts = self.conflicts
+        other.color_counts = self.color_counts.copy()
+        return other
+
+    def fitness(self):
+        return 1.0 / (1 + self.conflicts + 0.1 * len(self.color_counts))
+
+MAP_INDEX = MapIndex(NEIGHBORS, REGIONS)
+
 def map_fitness(ind):
     """Gute Lösungen haben wenige Konflikte und benutzen wenig Farben."""
     conflicts = map_conflicts(ind)
     used_colors = len(set(ind))
     return 1.0 / (1 + conflicts + 0.1 * used_colors)
 
-def solve_map_coloring():
+def solve_map_coloring(executor=None, incremental=False):
     best = genetic_algorithm_basic(
         fitness_fn=map_fitness,
         gene_pool=COLORS,
@@ -69,14 +178,37 @@ def solve_map_coloring():
         pop_size=80,
         generations=800,
         p_crossover=0.75,
-        p_mutation=0.05
+        p_mutation=0.05,
+        executor=executor,
+        delta_fitness=MAP_INDEX.state if incremental else None
     )
     return best
 
 
+# Inkrementelle Fitness gegen die vollständige Neuberechnung prüfen
+
+def check_incremental(trials=200, seed=0):
+    rng = random.Random(seed)
+    n = 12
+    queens = QueensState([rng.randint(1, n) for _ in range(n)])
+    coloring = MAP_INDEX.state([rng.choice(COLORS) for _ in REGIONS])
+    for _ in range(trials):
+        queens.change(rng.randrange(n), rng.randint(1, n))
+        assert queens.fitness() == queens_fitness(queens.individual)
+        coloring.change(rng.randrange(len(REGIONS)), rng.choice(COLORS))
+        assert coloring.conflicts == map_conflicts(coloring.individual)
+        assert coloring.fitness() == map_fitness(coloring.individual)
+        copy = coloring.copy()
+        copy.change(0, rng.choice(COLORS))
+        assert coloring.fitness() == map_fitness(coloring.individual)
+    return True
+
+
 # Ausführen
 
 if __name__ == "__main__":
+    check_incremental()
+
     # 8-Queens
     best_queens = solve_queens(n=8)
     print(" 8-Queens – beste gefundene Lösung:", best_queens)
@@ -18,45 +18,63 @@ attr_values = {
     "Bildung": {"Abitur", "Bachelor", "Master"},
 }
 
+# Standardwerte für die Parameter target/attr_values unten: das Beispiel oben.
+# Statt einer Liste von Dicts geht auch ein dataset.Dataset (z. B. aus
+# dataset.load("../DTL_03/zoo.csv")) – dann kommen Ziel und Werte aus dem Datensatz.
+def _values(values): return attr_values if values is None else values
+
+def _is_dataset(examples): return hasattr(examples, "columns")
+
 # Bäume ausgeben
-def print_tree(node, indent=""):
+def print_tree(node, indent="", attr_values=None):
     if isinstance(node, str):
         print(indent + "→ " + node); return
     if node["type"] == "leaf":
         counts = node["counts"]; total = sum(counts.values())
         print(indent + f"* n={total} {dict(counts)}"); return
     print(indent + f"{node['attr']}?")
-    for val in sorted(attr_values[node["attr"]]):
+    for val in sorted(_values(attr_values)[node["attr"]]):
         print(indent + f"├─ {val}")
-        print_tree(node["children"][val], indent + "│  ")
+        print_tree(node["children"][val], indent + "│  ", attr_values)
 
 # ID3
 def entropy(labels):
     n=len(labels);
     return 0.0 if n==0 else -sum((c/n)*math.log2(c/n) for c in Counter(labels).values())
 
-def information_gain(examples, attr):
-    H = entropy([e["Kandidat"] for e in examples]); n=len(examples)
-    R = sum((len(Sv)/n)*entropy([e["Kandidat"] for e in Sv])
-            for v in attr_values[attr]
+def information_gain(examples, attr, target="Kandidat", attr_values=None):
+    H = entropy([e[target] for e in examples]); n=len(examples)
+    R = sum((len(Sv)/n)*entropy([e[target] for e in Sv])
+            for v in _values(attr_values)[attr]
             for Sv in [[e for e in examples if e[attr]==v]])
     return H - R
 
-def id3(examples, attrs):
-    labels = [e["Kandidat"] for e in examples]
+def id3(examples, attrs, target="Kandidat", attr_values=None):
+    if _is_dataset(examples):  # spaltenweise: gleicher Baum über Zähltabellen
+        from id3_counts import id3_counts
+        return id3_counts(examples, attrs)
+    values = _values(attr_values)
+    labels = [e[target] for e in examples]
     if len(set(labels))==1: return labels[0]
     if not attrs: return Counter(labels).most_common(1)[0][0]
-    best = max(attrs, key=lambda a: information_gain(examples,a))
+    best = max(attrs, key=lambda a: information_gain(examples,a,target,values))
     node = {"type":"test","attr":best,"children":{}}
-    for v in attr_values[best]:
+    for v in values[best]:
         Sv = [e for e in examples if e[best]==v]
-        node["children"][v] = id3(Sv, [a for a in attrs if a!=best]) if Sv else Counter(labels).most_common(1)[0][0]
+        node["children"][v] = id3(Sv, [a for a in attrs if a!=best], target, values) if Sv else Counter(labels).most_common(1)[0][0]
     return node
 
 # CAL3 (S1,S2) – zyklisch
 FEATURE_ORDER = ["Alter","Einkommen","Bildung"]
 
-def cal3_train(data, S1=4, S2=0.7, max_epochs=50):
+def cal3_train(data, S1=4, S2=0.7, max_epochs=50, target="Kandidat", attr_values=None, feature_order=None):
+    # data: Liste von Dicts oder Dataset (wird in jedem Durchlauf Zeile für Zeile gelesen)
+    if _is_dataset(data):
+        target = data.target
+        if attr_values is None: attr_values = data.attr_values
+        if feature_order is None: feature_order = data.attrs
+    attr_values = _values(attr_values)
+    if feature_order is None: feature_order = FEATURE_ORDER
     root = {"type":"leaf","counts":Counter()}
     logs = []
     def find_leaf_with_parents(example):
@@ -66,7 +84,7 @@ def cal3_train(data, S1=4, S2=0.7, max_epochs=50):
             parents.append(node); node=node["children"][example[node["attr"]]]
     def next_unused(parents):
         used=[p["attr"] for p in parents]
-        for a in FEATURE_ORDER:
+        for a in feature_order:
             if a not in used: return a
         return None
     def make_test(attr):
@@ -77,7 +95,7 @@ def cal3_train(data, S1=4, S2=0.7, max_epochs=50):
         for i,ex in enumerate(data, start=1):
             parents,node = find_leaf_with_parents(ex)
             if isinstance(node,str): logs.append(f"Bsp {i}: festes Blatt {node}"); continue
-            node["counts"][ex["Kandidat"]]+=1; total=sum(node["counts"].values())
+            node["counts"][ex[target]]+=1; total=sum(node["counts"].values())
             logs.append(f"Bsp {i}: Zähler {dict(node['counts'])} (n={total})")
             if total>=S1:
                 counts=node["counts"]; maj,majc=counts.most_common(1)[0]
@@ -91,7 +109,7 @@ def cal3_train(data, S1=4, S2=0.7, max_epochs=50):
                     na=next_unused(parents)
                     if na is not None:
                         test=make_test(na)
-                        test["children"][ex[na]]["counts"][ex["Kandidat"]]+=1
+                        test["children"][ex[na]]["counts"][ex[target]]+=1
                         if parents: parents[-1]["children"][ex[parents[-1]["attr"]]]=test
                         else: root=test
                         logs.append(f"  Differenzierung: ersetze Blatt durch Test '{na}', Beispiel in Ast {na}={ex[na]}")
@@ -102,14 +120,15 @@ def cal3_train(data, S1=4, S2=0.7, max_epochs=50):
     return root, logs
 
 # Ausführen
-cal3_tree, cal3_logs = cal3_train(data, S1=4, S2=0.7)
-id3_tree = id3(data, ["Alter","Einkommen","Bildung"])
+if __name__ == "__main__":
+    cal3_tree, cal3_logs = cal3_train(data, S1=4, S2=0.7)
+    id3_tree = id3(data, ["Alter","Einkommen","Bildung"])
 
-print("=== CAL3 Handsimulation (S1=4, S2=0.7) ===")
-for line in cal3_logs: print(line)
+    print("=== CAL3 Handsimulation (S1=4, S2=0.7) ===")
+    for line in cal3_logs: print(line)
 
-print("\n=== CAL3 Baum ===")
-print_tree(cal3_tree)
+    print("\n=== CAL3 Baum ===")
+    print_tree(cal3_tree)
 
-print("\n=== ID3 Baum ===")
-print_tree(id3_tree)
+    print("\n=== ID3 Baum ===")
+    print_tree(id3_tree)
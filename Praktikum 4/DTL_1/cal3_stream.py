@@ -0,0 +1,168 @@
+import os
+import pickle
+from collections import Counter
+
+# CAL3 als Online-Lerner
+#
+# cal3_train (DTL01.py) läuft in Durchläufen über eine feste Liste und
+# schreibt für jedes Beispiel eine Log-Zeile. Cal3Learner verarbeitet ein
+# Beispiel nach dem anderen (update: Weg zum Blatt, Zähler erhöhen, eventuell
+# abschließen oder differenzieren – O(Tiefe)), liest beliebige Iteratoren und
+# meldet Ereignisse nur, wenn ein Callback gesetzt ist. Der Baum hat dasselbe
+# Format wie bei cal3_train (print_tree und compile_tree funktionieren), der
+# Zustand lässt sich speichern und später weiterlernen.
+#
+# Ereignisse (Dicts): {"type": "count", "n", "i", "counts"}, {"type": "closed",
+# "n", "i", "label", "share"}, {"type": "split", "n", "i", "attr", "value"},
+# {"type": "fixed", "n", "i", "label"} und bei fit_epochs {"type": "epoch", "n",
+# "epoch"}; n ist die laufende Nummer des Beispiels über alle Durchläufe, i die
+# Nummer im aktuellen Durchlauf (fit beginnt wieder bei 1, wie "Bsp i" in den
+# Logs von cal3_train).
+
+def format_event(event):
+    """Ereignis als Text wie in den Logs von cal3_train."""
+    kind = event["type"]
+    if kind == "epoch": return f"--- Durchlauf {event['epoch']} ---"
+    if kind == "fixed": return f"Bsp {event['i']}: festes Blatt {event['label']}"
+    if kind == "count":
+        return f"Bsp {event['i']}: Zähler {event['counts']} (n={sum(event['counts'].values())})"
+    if kind == "closed":
+        majc, total = event["share"]
+        return f"  Abschluss: setze auf {event['label']} (Anteil {majc}/{total})"
+    return f"  Differenzierung: ersetze Blatt durch Test '{event['attr']}', Beispiel in Ast {event['attr']}={event['value']}"
+
+def _leaf():
+    return {"type":"leaf","counts":Counter()}
+
+class Cal3Learner:
+    def __init__(self, S1=4, S2=0.7, target="Kandidat", attr_values=None, feature_order=None, on_event=None):
+        if attr_values is None:
+            import DTL01
+            attr_values = DTL01.attr_values
+        self.S1, self.S2 = S1, S2
+        self.target = target
+        self.attr_values = attr_values
+        self.feature_order = list(attr_values) if feature_order is None else list(feature_order)
+        self.on_event = on_event  # None = keine Ereignisse (auch keine Dicts bauen)
+        self.root = _leaf()
+        self.seen = 0             # verarbeitete Beispiele insgesamt
+        self.position = 0         # Beispiele im aktuellen Durchlauf (fit)
+
+    @classmethod
+    def from_dataset(cls, dataset, **kwargs):
+        """Ziel, Wertebereiche und Attributreihenfolge aus einem dataset.Dataset."""
+        return cls(target=dataset.target, attr_values=dataset.attr_values,
+                   feature_order=dataset.attrs, **kwargs)
+
+    @property
+    def tree(self):
+        return self.root
+
+    def _replace(self, parents, example, node):
+        if parents: parents[-1]["children"][example[parents[-1]["attr"]]] = node
+        else: self.root = node
+
+    def update(self, example):
+        """Ein Beispiel lernen. Rückgabe: True, wenn sich der Baum geändert hat."""
+        self.seen += 1
+        self.position += 1
+        emit = self.on_event
+        parents, node = [], self.root
+        while not isinstance(node, str) and node["type"] != "leaf":
+            parents.append(node); node = node["children"][example[node["attr"]]]
+        if isinstance(node, str):
+            if emit: emit({"type":"fixed","n":self.seen,"i":self.position,"label":node})
+            return False
+        label = example[self.target]
+        counts = node["counts"]; counts[label] += 1; total = sum(counts.values())
+        if emit: emit({"type":"count","n":self.seen,"i":self.position,"counts":dict(counts)})
+        if total < self.S1: return False
+        maj, majc = counts.most_common(1)[0]
+        unique = list(counts.values()).count(majc) == 1
+        if unique and majc/total >= self.S2:
+            self._replace(parents, example, maj)
+            if emit: emit({"type":"closed","n":self.seen,"i":self.position,"label":maj,"share":(majc,total)})
+            return True
+        used = [p["attr"] for p in parents]
+        attr = next((a for a in self.feature_order if a not in used), None)
+        if attr is None: return False
+        test = {"type":"test","attr":attr,"children":{v: _leaf() for v in self.attr_values[attr]}}
+        test["children"][example[attr]]["counts"][label] += 1
+        self._replace(parents, example, test)
+        if emit: emit({"type":"split","n":self.seen,"i":self.position,"attr":attr,"value":example[attr]})
+        return True
+
+    def fit(self, examples, checkpoint=None, every=100000):
+        """
+        Beispiele aus einem beliebigen Iterable einmal lernen (ein Strom, kein
+        Zurückspulen). checkpoint: Datei, in die alle every Beispiele und am
+        Ende gespeichert wird. Rückgabe: Anzahl der Änderungen am Baum.
+        """
+        changes = 0
+        self.position = 0
+        for i, example in enumerate(examples, start=1):
+            changes += self.update(example)
+            if checkpoint and i % every == 0: self.save(checkpoint)
+        if checkpoint: self.save(checkpoint)
+        return changes
+
+    def fit_epochs(self, data, max_epochs=50):
+        """Wie cal3_train: Durchläufe über data, bis sich der Baum nicht mehr ändert."""
+        for epoch in range(1, max_epochs+1):
+            if self.on_event: self.on_event({"type":"epoch","n":self.seen,"epoch":epoch})
+            if not self.fit(data): break
+        return self.root
+
+    def save(self, path):
+        # Callback nicht mitspeichern (oft nicht picklebar); erst Hilfsdatei, dann umbenennen
+        state = dict(self.__dict__, on_event=None)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, on_event=None):
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        learner = cls.__new__(cls)
+        learner.__dict__.update(state, on_event=on_event)
+        return learner
+
+# Demo
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+    import DTL01
+    from dataset import load
+
+    # 1) gleicher Baum wie cal3_train auf dem Beispiel aus DTL01.py
+    lines = []
+    learner = Cal3Learner(S1=4, S2=0.7, feature_order=DTL01.FEATURE_ORDER,
+                          on_event=lambda e: lines.append(format_event(e)))
+    learner.fit_epochs(DTL01.data)
+    tree, logs = DTL01.cal3_train(DTL01.data, S1=4, S2=0.7)
+    assert learner.tree == tree
+    assert lines == [line for line in logs if not line.startswith("Abbruch")]  # auch nach Durchlauf 1
+    print("\n".join(lines))
+    print("\n=== CAL3 Baum (Online-Lerner) ===")
+    DTL01.print_tree(learner.tree)
+
+    # 2) Strom aus restaurant.arff: Zufallsbeispiele ohne Ende, mit Zwischenstand
+    folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "DTL_03")
+    ds = load(os.path.join(folder, "restaurant.arff"))
+    rows = list(ds.rows())
+    rng = random.Random(0)
+    stream = (rng.choice(rows) for _ in iter(int, 1))  # unendlicher Generator
+    path = os.path.join(tempfile.gettempdir(), "cal3_restaurant.pkl")
+    learner = Cal3Learner.from_dataset(ds, S1=8, S2=0.9)
+    t0 = time.perf_counter()
+    learner.fit((next(stream) for _ in range(500_000)), checkpoint=path, every=100_000)
+    t1 = time.perf_counter()
+    resumed = Cal3Learner.load(path)
+    resumed.fit(next(stream) for _ in range(500_000))
+    print(f"\nrestaurant als Strom: 500000 Beispiele in {t1 - t0:.2f}s "
+          f"({500_000 / (t1 - t0):,.0f}/s), nach Laden weitere 500000, insgesamt {resumed.seen}")
+    DTL01.print_tree(resumed.tree, attr_values=ds.attr_values)
@@ -0,0 +1,215 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Entscheidungsbäume für die Vorhersage in flache Arrays übersetzen
+#
+# Bäume aus id3 / cal3_train (DTL01.py) sind verschachtelte Dicts mit Strings
+# als Blättern. compile_tree legt die Knoten in Breitensuche-Reihenfolge in
+# Arrays ab:
+#   feature[k]  Index des getesteten Attributs (-1 = Blatt)
+#   offset[k]   Beginn der Kindertabelle von k in child
+#   width[k]    Anzahl Einträge der Kindertabelle (= Anzahl Codes des Attributs)
+#   child[offset[k] + code]  Knoten für den Wert mit diesem Code
+#   leaf[k]     Klassencode des Blatts (-1 = unbekannt)
+# Der letzte Knoten ist ein Blatt "unbekannt" für Werte ohne Ast. Codes sind
+# die des Datasets beim Übersetzen (dataset.py), Klassencodes die von
+# dataset.labels. predict_batch läuft mit NumPy Ebene für Ebene über alle
+# Zeilen gleichzeitig; hat der Stapel andere Codes (eigene categories), wird
+# vorher je Spalte einmal umcodiert. predict für einzelne Zeilen baut daraus
+# einmal je Knoten ein Dict Rohwert -> Kindknoten und spart so das Codieren.
+
+UNKNOWN = -1
+
+class CompiledTree:
+    def __init__(self, attrs, categories, labels):
+        self.attrs = list(attrs)
+        self.categories = {a: list(categories[a]) for a in attrs}
+        self.codes = {a: {v: i for i, v in enumerate(categories[a])} for a in attrs}
+        self.labels = list(labels)
+        self.feature = array('h')
+        self.offset = array('i')
+        self.width = array('i')
+        self.leaf = array('h')
+        self.child = array('i')
+        self.unknown = None  # Index des Blatts "unbekannt"
+        self._steps = None   # Tabellen für predict, beim ersten Aufruf aus den Arrays gebaut
+
+    def __len__(self):
+        return len(self.feature)
+
+    def _label_code(self, label):
+        if label is None: return UNKNOWN
+        if label not in self.labels: self.labels.append(label)
+        return self.labels.index(label)
+
+    def _build_steps(self):
+        # je Knoten ein Tupel: (Attribut, Wert -> Kindknoten) oder bei Blättern (None, Klassenname)
+        steps = []
+        for k in range(len(self.feature)):
+            f = self.feature[k]
+            if f < 0:
+                label = self.leaf[k]
+                steps.append((None, None if label == UNKNOWN else self.labels[label]))
+            else:
+                a, start, width = self.attrs[f], self.offset[k], self.width[k]
+                steps.append((a, {v: self.child[start + c] for v, c in self.codes[a].items() if c < width}))
+        self._steps = steps
+        return steps
+
+    def predict(self, example):
+        """Eine Zeile (Dict wie in DTL01.data) -> Klassenname oder None."""
+        steps = self._steps or self._build_steps()
+        unknown = self.unknown
+        attr, nxt = steps[0]
+        while attr is not None:
+            attr, nxt = steps[nxt.get(example[attr], unknown)]
+        return nxt
+
+    def _recode(self, dataset, a):
+        # Codes des Stapels -> Codes beim Übersetzen (None, wenn sie übereinstimmen)
+        values = dataset.categories[a]
+        if values[:len(self.categories[a])] == self.categories[a]:
+            return None  # gleiche Codes (neue Werte hinten sind ohnehin unbekannt)
+        missing = len(self.categories[a])  # >= width: führt zum Blatt "unbekannt"
+        return [self.codes[a].get(v, missing) for v in values]
+
+    def predict_batch(self, dataset):
+        """
+        Alle Zeilen eines Datasets auf einmal. Rückgabe: Klassencodes (Index in
+        self.labels, -1 = unbekannt) als NumPy-Array, ohne NumPy als array('h').
+        """
+        if np is None:
+            return self._predict_batch_python(dataset)
+        n = len(dataset)
+        X = np.empty((len(self.attrs), n), dtype=np.int64)
+        for j, a in enumerate(self.attrs):
+            X[j] = np.asarray(dataset.columns[a])
+            mapping = self._recode(dataset, a)
+            if mapping is not None: X[j] = np.asarray(mapping, dtype=np.int64)[X[j]]
+        feature = np.asarray(self.feature, dtype=np.int64)
+        offset = np.asarray(self.offset, dtype=np.int64)
+        width = np.asarray(self.width, dtype=np.int64)
+        child = np.asarray(self.child, dtype=np.int64)
+        leaf = np.asarray(self.leaf, dtype=np.int16)
+        node = np.zeros(n, dtype=np.int64)
+        rows = np.arange(n)
+        while len(rows):
+            f = feature[node[rows]]
+            inner = f >= 0
+            rows, f = rows[inner], f[inner]  # Zeilen, die noch in einem Testknoten stehen
+            current = node[rows]
+            code = X[f, rows]
+            known = code < width[current]
+            node[rows] = np.where(known, child[np.where(known, offset[current] + code, 0)], self.unknown)
+        return leaf[node]
+
+    def _predict_batch_python(self, dataset):
+        feature, offset, width, child, leaf = self.feature, self.offset, self.width, self.child, self.leaf
+        columns = []
+        for a in self.attrs:
+            mapping = self._recode(dataset, a)
+            columns.append(dataset.columns[a] if mapping is None else [mapping[c] for c in dataset.columns[a]])
+        result = array('h')
+        for i in range(len(dataset)):
+            node = 0
+            f = feature[0]
+            while f >= 0:
+                code = columns[f][i]
+                node = child[offset[node] + code] if code < width[node] else self.unknown
+                f = feature[node]
+            result.append(leaf[node])
+        return result
+
+    def decode(self, codes):
+        return [None if c == UNKNOWN else self.labels[c] for c in codes]
+
+def _leaf_label(node):
+    # Blatt aus id3 (String) oder cal3_train ({"type":"leaf","counts":...}; Mehrheit, leer = unbekannt)
+    if isinstance(node, str): return node
+    counts = node["counts"]
+    return counts.most_common(1)[0][0] if counts else None
+
+def compile_tree(tree, dataset):
+    """Baum aus id3 / cal3_train übersetzen; dataset liefert Attribute, Codes und Klassen."""
+    compiled = CompiledTree(dataset.attrs, dataset.categories, dataset.labels)
+    index = {a: j for j, a in enumerate(dataset.attrs)}
+    queue = [tree]
+    for node in queue:  # queue wächst beim Durchlaufen: Breitensuche
+        if isinstance(node, str) or node["type"] == "leaf":
+            compiled.feature.append(-1); compiled.offset.append(0); compiled.width.append(0)
+            compiled.leaf.append(compiled._label_code(_leaf_label(node)))
+            continue
+        attr = node["attr"]
+        size = len(dataset.categories[attr])
+        compiled.feature.append(index[attr]); compiled.offset.append(len(compiled.child))
+        compiled.width.append(size); compiled.leaf.append(UNKNOWN)
+        slots = [UNKNOWN] * size
+        for value, sub in node["children"].items():
+            code = compiled.codes[attr].get(value)
+            if code is not None:
+                slots[code] = len(queue)
+                queue.append(sub)
+        compiled.child.extend(slots)
+    # Werte ohne Ast zeigen auf das Blatt "unbekannt"
+    compiled.unknown = len(compiled.feature)
+    compiled.feature.append(-1); compiled.offset.append(0); compiled.width.append(0)
+    compiled.leaf.append(UNKNOWN)
+    for j, c in enumerate(compiled.child):
+        if c == UNKNOWN: compiled.child[j] = compiled.unknown
+    return compiled
+
+# Demo
+
+if __name__ == "__main__":
+    import os
+    import random
+    import time
+    import DTL01
+    from dataset import Dataset, load
+    from id3_counts import id3_counts
+
+    def walk(tree, example):
+        # rekursiver Weg durch die Dicts – zum Vergleich
+        while not isinstance(tree, str):
+            if tree["type"] == "leaf": return _leaf_label(tree)
+            tree = tree["children"][example[tree["attr"]]]
+        return tree
+
+    folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "DTL_03")
+    for name in ("restaurant.arff", "zoo.arff"):
+        ds = load(os.path.join(folder, name))
+        for label, tree in (("ID3", DTL01.id3(ds, ds.attrs)), ("CAL3", DTL01.cal3_train(ds, S1=2, S2=0.9)[0])):
+            compiled = compile_tree(tree, ds)
+            batch = compiled.decode(compiled.predict_batch(ds))
+            rows = list(ds.rows())
+            assert batch == [compiled.predict(r) for r in rows] == [walk(tree, r) for r in rows]
+            correct = sum(p == r[ds.target] for p, r in zip(batch, rows))
+            print(f"{name} {label}: {len(compiled)} Knoten, {correct}/{len(ds)} richtig")
+
+    # Durchsatz: Baum aus 100000 synthetischen Zeilen, Vorhersage für 1 Mio. Zeilen
+    rng = random.Random(0)
+    attrs = [f"a{j}" for j in range(8)]
+    def synthetic(n):
+        for _ in range(n):
+            e = {a: rng.randrange(4) for a in attrs}
+            e["y"] = "ja" if (e["a0"] >= 2) != (e["a3"] == 1 and e["a5"] < 2) else "nein"
+            if rng.random() < 0.05: e["y"] = "nein" if e["y"] == "ja" else "ja"
+            yield e
+    train = Dataset.from_records(synthetic(100_000), attrs, "y")
+    tree = id3_counts(train)
+    compiled = compile_tree(tree, train)
+    test = Dataset.from_records(synthetic(1_000_000), attrs, "y")
+    rows = [test.row(i) for i in range(100_000)]
+    t0 = time.perf_counter()
+    for r in rows: walk(tree, r)
+    t1 = time.perf_counter()
+    for r in rows: compiled.predict(r)
+    t2 = time.perf_counter()
+    codes = compiled.predict_batch(test)
+    t3 = time.perf_counter()
+    print(f"\n{len(compiled)} Knoten; Dicts rekursiv {len(rows) / (t1 - t0):,.0f} Zeilen/s, "
+          f"predict {len(rows) / (t2 - t1):,.0f} Zeilen/s, predict_batch {len(test) / (t3 - t2):,.0f} Zeilen/s")
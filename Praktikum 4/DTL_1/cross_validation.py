@@ -0,0 +1,163 @@
+import os
+import random
+import statistics
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from dataset import Dataset
+from id3_counts import id3_counts
+from cal3_stream import Cal3Learner
+from compiled_tree import compile_tree
+
+# k-fache Kreuzvalidierung und Gittersuche für ID3 und CAL3
+#
+# Jede Kombination (Konfiguration, Fold) ist eine Aufgabe im Prozess-Pool.
+# Der codierte Datensatz liegt einmal in einem SharedMemory-Block (alle
+# Spalten hintereinander als uint16, mit einer 'I'-Spalte alle als uint32);
+# die Worker hängen sich beim Start daran und lesen die Spalten als
+# memoryview – nichts wird pro Aufgabe kopiert oder gepickelt außer den
+# Fold-Indizes.
+#
+#   grid = {"id3": [{}], "cal3": [{"S1": s1, "S2": s2} for s1 in (2, 4) for s2 in (0.7, 0.9)]}
+#   for r in grid_search(load("zoo.csv", exclude=("animal",)), grid, k=10): print(r)
+
+def folds(n, k=10, seed=0):
+    """Zeilen 0..n-1 gemischt in k etwa gleich große Teile (Testmengen)."""
+    if not 2 <= k <= n:
+        raise ValueError(f"k muss zwischen 2 und {n} liegen, nicht {k}")
+    order = list(range(n))
+    random.Random(seed).shuffle(order)
+    return [sorted(order[j::k]) for j in range(k)]
+
+# Trainieren und Bewerten einer Aufgabe
+
+def train(dataset, learner, params, rows):
+    if learner == "id3":
+        return id3_counts(dataset, rows=rows)
+    if learner == "cal3":
+        params = dict(params)
+        max_epochs = params.pop("max_epochs", 50)
+        model = Cal3Learner.from_dataset(dataset, **params)
+        return model.fit_epochs([dataset.row(i) for i in rows], max_epochs)
+    raise ValueError(f"Unbekannter Lerner: {learner!r} (erlaubt: 'id3', 'cal3')")
+
+def evaluate_fold(dataset, learner, params, test):
+    """Auf allen Zeilen außer test trainieren, auf test messen. Rückgabe: (Trefferquote, Trainingszeit, Testzeit)."""
+    test_set = set(test)
+    train_rows = [i for i in range(len(dataset)) if i not in test_set]
+    t0 = time.perf_counter()
+    tree = train(dataset, learner, params, train_rows)
+    t1 = time.perf_counter()
+    test_data = dataset.take(test)
+    predicted = compile_tree(tree, dataset).predict_batch(test_data)
+    t2 = time.perf_counter()
+    truth = test_data.columns[dataset.target]
+    correct = sum(int(p) == y for p, y in zip(predicted, truth))  # Klassencodes = dataset.labels
+    return correct / len(test), t1 - t0, t2 - t1
+
+# gemeinsamer Speicher
+
+def share(dataset):
+    """Spalten in einen SharedMemory-Block kopieren. Rückgabe: (Block, Beschreibung für attach)."""
+    names = dataset.attrs + [dataset.target]
+    n = len(dataset)
+    formats = [memoryview(dataset.columns[a]).format for a in names]
+    code = 'I' if 'I' in formats else 'H'
+    size = 4 if code == 'I' else 2
+    shm = shared_memory.SharedMemory(create=True, size=max(1, size * n * len(names)))
+    view = shm.buf.cast(code)
+    for j, (a, fmt) in enumerate(zip(names, formats)):
+        view[j*n:(j+1)*n] = dataset.columns[a] if fmt == code else array(code, dataset.columns[a])
+    view.release()
+    return shm, (shm.name, n, dataset.attrs, dataset.target, dataset.categories, code)
+
+def attach(description):
+    """Gegenstück zu share im Worker: Dataset, dessen Spalten im gemeinsamen Block liegen."""
+    name, n, attrs, target, categories, code = description
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast(code)
+    columns = {a: view[j*n:(j+1)*n] for j, a in enumerate(attrs + [target])}
+    return shm, Dataset(attrs, target, categories, columns)
+
+_shared = None  # (Block, Dataset) im Worker
+
+def _init_worker(description):
+    global _shared
+    _shared = attach(description)
+
+def _run(learner, params, test):
+    return evaluate_fold(_shared[1], learner, params, test)
+
+# Gittersuche
+
+def _configs(grid):
+    return [(learner, dict(params)) for learner, options in grid.items() for params in options]
+
+def grid_search(dataset, grid, k=10, seed=0, workers=None):
+    """
+    grid: Lerner ("id3" / "cal3") -> Liste von Parameter-Dicts. Jede
+    Konfiguration wird mit denselben k Folds bewertet. workers: Anzahl
+    Prozesse (None = alle Kerne, 0 = seriell ohne Pool).
+    Rückgabe: Liste von Dicts (learner, params, accuracy, std, train_time,
+    test_time, seconds), beste Trefferquote zuerst.
+    """
+    configs = _configs(grid)
+    parts = folds(len(dataset), k, seed)
+    tasks = [(learner, params, test) for learner, params in configs for test in parts]
+    started = time.perf_counter()
+    if workers == 0:
+        outcomes = [evaluate_fold(dataset, *task) for task in tasks]
+    else:
+        workers = workers or os.cpu_count() or 1
+        shm, description = share(dataset)
+        try:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(description,)) as pool:
+                outcomes = list(pool.map(_run, *zip(*tasks), chunksize=max(1, len(tasks) // (4 * workers))))
+        finally:
+            shm.close()
+            shm.unlink()
+    elapsed = time.perf_counter() - started
+
+    results = []
+    for c, (learner, params) in enumerate(configs):
+        scores = outcomes[c*k:(c+1)*k]
+        accuracy = [s[0] for s in scores]
+        results.append({
+            "learner": learner,
+            "params": params,
+            "accuracy": statistics.mean(accuracy),
+            "std": statistics.stdev(accuracy),
+            "train_time": sum(s[1] for s in scores),
+            "test_time": sum(s[2] for s in scores),
+        })
+    results.sort(key=lambda r: -r["accuracy"])
+    for r in results: r["seconds"] = elapsed  # Gesamtzeit der Suche
+    return results
+
+def cross_validate(dataset, learner="id3", params=None, k=10, seed=0, workers=None):
+    """Eine Konfiguration, k Folds. Rückgabe: ein Dict wie bei grid_search."""
+    return grid_search(dataset, {learner: [params or {}]}, k, seed, workers)[0]
+
+# Demo
+
+if __name__ == "__main__":
+    from dataset import load
+
+    folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "DTL_03")
+    grid = {
+        "id3": [{}],
+        "cal3": [{"S1": s1, "S2": s2} for s1 in (2, 4, 8) for s2 in (0.6, 0.7, 0.8, 0.9, 1.0)],
+    }
+    for name, exclude, k in (("zoo.csv", ("animal",), 10), ("restaurant.csv", (), 4)):
+        ds = load(os.path.join(folder, name), exclude=exclude)
+        print(f"=== {name}: {len(ds)} Beispiele, {k}-fache Kreuzvalidierung ===")
+        for workers in (0, None):
+            results = grid_search(ds, grid, k=k, workers=workers)
+            print(f"{'seriell' if workers == 0 else 'Prozess-Pool'}: {results[0]['seconds']:.2f}s")
+        for r in results:
+            params = ", ".join(f"{key}={value}" for key, value in r["params"].items()) or "-"
+            print(f"  {r['learner']:4s} {params:16s} Trefferquote {r['accuracy']:.3f} ± {r['std']:.3f}  "
+                  f"Training {r['train_time']*1000:6.1f} ms, Test {r['test_time']*1000:5.1f} ms")
+        print()
@@ -0,0 +1,214 @@
+import csv
+import os
+from array import array
+
+# Spaltenweise, ganzzahlig codierte Datensätze für die Entscheidungsbäume
+#
+# Statt einer Liste von Dicts (wie data in DTL01.py) hält Dataset pro Attribut
+# eine Spalte array('H') mit Codes; categories[attr][code] ist der Wert dazu.
+# Ein Beispiel kostet so 2 Byte pro Attribut statt eines ganzen Dicts. Hat ein
+# Attribut mehr als 65536 Werte (z. B. eine ID- oder Zahlenspalte), wird seine
+# Spalte beim Laden auf array('I') umgestellt.
+#
+# load_csv / load_arff lesen Dateien zeilenweise in ein Dataset, iter_chunks
+# liefert große Dateien in Stücken zu chunk_size Zeilen. Alle Stücke einer
+# Datei teilen sich dieselben categories (werden nur hinten ergänzt), die
+# Codes bleiben also über alle Stücke gleich.
+
+class Dataset:
+    def __init__(self, attrs, target, categories, columns):
+        self.attrs = list(attrs)          # Merkmale (ohne Zielattribut)
+        self.target = target              # Zielattribut, z. B. "Kandidat"
+        self.categories = categories      # attr -> Liste der Werte (Index = Code)
+        self.columns = columns            # attr -> array('H') (bzw. 'I') mit Codes
+
+    def __len__(self):
+        return len(self.columns[self.target])
+
+    def __iter__(self):
+        return self.rows()
+
+    @property
+    def attr_values(self):
+        """Wertebereiche im Format von DTL01.attr_values."""
+        return {a: set(self.categories[a]) for a in self.attrs}
+
+    @property
+    def labels(self):
+        return self.categories[self.target]
+
+    def row(self, i):
+        """Beispiel i als Dict wie in DTL01.data."""
+        return {a: self.categories[a][self.columns[a][i]] for a in self.attrs + [self.target]}
+
+    def rows(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def take(self, indices):
+        """Neues Dataset mit den Zeilen indices (Kopie der Codes, gleiche categories)."""
+        columns = {a: array(_typecode(self.categories[a]), (col[i] for i in indices))
+                   for a, col in self.columns.items()}
+        return Dataset(self.attrs, self.target, self.categories, columns)
+
+    @classmethod
+    def from_records(cls, examples, attrs, target, attr_values=None):
+        """Liste von Dicts codieren. attr_values legt die Reihenfolge der Codes fest (sonst erstes Auftreten)."""
+        names = list(attrs) + [target]
+        declared = {a: sorted(attr_values[a]) for a in names if attr_values and a in attr_values}
+        rows = ([e[a] for a in names] for e in examples)
+        return next(_encode(names, rows, target, (), declared, None))
+
+def _typecode(values):
+    # Codes 0..65535 passen in 'H', sonst 4 Byte pro Code
+    return 'H' if len(values) <= 0x10000 else 'I'
+
+def _encode(header, rows, target, exclude, declared, chunk_size):
+    # rows: Listen von Werten in der Reihenfolge von header; liefert Datasets
+    target = header[-1] if target is None else target
+    if target not in header:
+        raise ValueError(f"Zielattribut {target!r} nicht in {header}")
+    attrs = [h for h in header if h != target and h not in exclude]
+    names = attrs + [target]
+    positions = [header.index(a) for a in names]
+    categories = {a: list(declared.get(a, ())) for a in names}
+    codes = {a: {v: i for i, v in enumerate(categories[a])} for a in names}
+    slots = [(codes[a], categories[a], a) for a in names]
+
+    columns = {a: array(_typecode(categories[a])) for a in names}
+    n = 0
+    for row in rows:
+        for (code_of, values, a), p in zip(slots, positions):
+            v = row[p]
+            code = code_of.get(v)
+            if code is None:
+                code = code_of[v] = len(values)
+                values.append(v)
+                if code == 0x10000:
+                    columns[a] = array('I', columns[a])  # erster Code, der nicht mehr in 'H' passt
+            columns[a].append(code)
+        n += 1
+        if n == chunk_size:
+            yield Dataset(attrs, target, categories, columns)
+            columns = {a: array(_typecode(categories[a])) for a in names}
+            n = 0
+    if n or not chunk_size:
+        yield Dataset(attrs, target, categories, columns)
+
+# CSV: erste Zeile sind die Spaltennamen
+
+def _csv_source(path):
+    f = open(path, newline="", encoding="utf-8")
+    reader = csv.reader(f)
+    header = next(reader)
+    return f, header, (row for row in reader if row)
+
+# ARFF: @attribute-Zeilen geben Namen und (bei {...}) die Werte vor. numeric-
+# Attribute werden wie nominale behandelt (jede vorkommende Zahl ist ein Wert),
+# "?" (fehlender Wert) ist ein eigener Wert. Sparse-ARFF wird nicht unterstützt.
+
+def _arff_values(spec):
+    return [v.strip().strip("'\"") for v in next(csv.reader([spec], quotechar="'", skipinitialspace=True))]
+
+def _arff_source(path):
+    f = open(path, newline="", encoding="utf-8")
+    header, declared = [], {}
+    for line in f:
+        line = line.strip()
+        if not line or line.startswith("%"):
+            continue
+        keyword = line.split(None, 1)[0].lower()
+        if keyword == "@attribute":
+            rest = line.split(None, 1)[1]
+            if rest[0] in "'\"":
+                end = rest.index(rest[0], 1)
+                name, spec = rest[1:end], rest[end + 1:].strip()
+            else:
+                name, spec = rest.split(None, 1)
+            header.append(name)
+            if spec.startswith("{"):
+                declared[name] = _arff_values(spec[1:spec.rindex("}")])
+        elif keyword == "@data":
+            break
+
+    def rows():
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("%"):
+                continue
+            if line.startswith("{"):
+                raise ValueError("Sparse-ARFF wird nicht unterstützt")
+            yield _arff_values(line)
+    return f, header, rows(), declared
+
+def _source(path):
+    if os.path.splitext(path)[1].lower() == ".arff":
+        return _arff_source(path)
+    return _csv_source(path) + ({},)
+
+def iter_chunks(path, chunk_size=100000, target=None, exclude=()):
+    """
+    CSV- oder ARFF-Datei (nach Endung) in Datasets zu je chunk_size Zeilen.
+    target: Zielattribut (Standard: letzte Spalte), exclude: ausgelassene Spalten.
+    """
+    f, header, rows, declared = _source(path)
+    with f:
+        yield from _encode(header, rows, target, exclude, declared, chunk_size)
+
+def load(path, target=None, exclude=()):
+    """Ganze Datei als ein Dataset (Parameter wie iter_chunks)."""
+    f, header, rows, declared = _source(path)
+    with f:
+        return next(_encode(header, rows, target, exclude, declared, None))
+
+def load_csv(path, target=None, exclude=()):
+    f, header, rows = _csv_source(path)
+    with f:
+        return next(_encode(header, rows, target, exclude, {}, None))
+
+def load_arff(path, target=None, exclude=()):
+    f, header, rows, declared = _arff_source(path)
+    with f:
+        return next(_encode(header, rows, target, exclude, declared, None))
+
+# Demo
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import DTL01
+
+    folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "DTL_03")
+    for name, exclude in (("restaurant.csv", ()), ("restaurant.arff", ()), ("zoo.csv", ("animal",)), ("zoo.arff", ())):
+        ds = load(os.path.join(folder, name), exclude=exclude)
+        tree = DTL01.id3(ds, ds.attrs)
+        cal3_tree, _ = DTL01.cal3_train(ds)
+        cal3_root = cal3_tree if isinstance(cal3_tree, str) else cal3_tree.get("attr", "Blatt")
+        print(f"{name}: {len(ds)} Beispiele, Ziel {ds.target!r}, {len(ds.attrs)} Merkmale, "
+              f"ID3-Wurzel {tree['attr']!r}, CAL3-Wurzel {cal3_root!r}")
+    print("\n=== ID3 Baum restaurant.arff ===")
+    ds = load(os.path.join(folder, "restaurant.arff"))
+    DTL01.print_tree(DTL01.id3(ds, ds.attrs), attr_values=ds.attr_values)
+
+    # Speicher pro Zeile: Dict-Zeilen gegen Spalten
+    rows = list(ds.rows()) * 1000
+    dict_bytes = sum(sys.getsizeof(r) for r in rows) + sys.getsizeof(rows)
+    big = Dataset.from_records(rows, ds.attrs, ds.target)
+    column_bytes = sum(sys.getsizeof(c) for c in big.columns.values())
+    print(f"\n{len(rows)} Zeilen: Liste von Dicts {dict_bytes / len(rows):.0f} Byte/Zeile, "
+          f"Spalten {column_bytes / len(rows):.1f} Byte/Zeile")
+
+    # große Datei in Stücken lesen
+    path = os.path.join(tempfile.gettempdir(), "restaurant_gross.csv")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(ds.attrs + [ds.target])
+        for r in rows:
+            writer.writerow([r[a] for a in ds.attrs + [ds.target]])
+    sizes = [len(chunk) for chunk in iter_chunks(path, chunk_size=5000)]
+    print(f"{path}: {len(sizes)} Stücke mit {sizes} Zeilen")
+
+    # ID-artige Spalte mit mehr als 65536 Werten: die Spalte wird auf 'I' umgestellt
+    ids = Dataset.from_records(({"id": i, "k": i % 2} for i in range(70000)), ["id"], "k")
+    assert ids.columns["id"].typecode == 'I' and ids.columns["k"].typecode == 'H'
+    assert ids.row(69999) == {"id": 69999, "k": 1}
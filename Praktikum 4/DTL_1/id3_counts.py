@@ -0,0 +1,165 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ID3 über Häufigkeitstabellen
+#
+# Gleiches Ergebnis wie id3 aus DTL01.py, aber auf einem Dataset (dataset.py):
+# Pro Knoten wird in einem Durchlauf für jedes Attribut eine Tabelle
+# Wert x Klasse gezählt, Entropie und Informationsgewinn kommen nur noch aus
+# diesen Zahlen. Die Beispiele eines Knotens sind eine Liste von Zeilen-
+# indizes; beim Aufteilen werden nur Indizes verteilt, keine Zeilen kopiert.
+# Mit NumPy zählt np.bincount jede Spalte auf einmal (Millionen Zeilen),
+# ohne NumPy läuft dieselbe Rechnung in reinem Python. Kleine Knoten (tief im
+# Baum) rechnet auch die NumPy-Variante in reinem Python – dort überwiegt
+# sonst der Aufwand pro NumPy-Aufruf.
+
+SMALL_NODE = 2048  # ab hier (weniger Beispiele im Knoten) reines Python
+
+def entropy_counts(counts, n):
+    return 0.0 if n == 0 else -sum((c/n)*math.log2(c/n) for c in counts if c)
+
+def gain_from_table(table, class_counts, n):
+    """Informationsgewinn aus der Tabelle table[Wert][Klasse] eines Attributs."""
+    R = 0.0
+    for row in table:
+        nv = sum(row)
+        if nv: R += (nv/n)*entropy_counts(row, nv)
+    return entropy_counts(class_counts, n) - R
+
+def _majority(class_counts, first_seen):
+    # wie Counter.most_common: bei Gleichstand die Klasse, die zuerst vorkommt
+    best = max(class_counts)
+    return min((first_seen[c], c) for c, k in enumerate(class_counts) if k == best)[1]
+
+# reines Python
+
+def _tables_python(idx, columns, y, attrs, sizes, K):
+    class_counts = [0]*K
+    first_seen = {}
+    tables = {a: [[0]*K for _ in range(sizes[a])] for a in attrs}
+    cols = [(tables[a], columns[a]) for a in attrs]
+    for pos, i in enumerate(idx):
+        c = y[i]
+        class_counts[c] += 1
+        if c not in first_seen: first_seen[c] = pos
+        for table, col in cols:
+            table[col[i]][c] += 1
+    return class_counts, first_seen, tables
+
+def _split_python(idx, col, size):
+    parts = [[] for _ in range(size)]
+    for i in idx:
+        parts[col[i]].append(i)
+    return parts
+
+# NumPy
+
+def _tables_numpy(idx, columns, y, attrs, sizes, K):
+    y_node = y[idx]
+    class_counts = np.bincount(y_node, minlength=K).tolist()
+    first_seen = {c: int(np.argmax(y_node == c)) for c in range(K) if class_counts[c]}
+    tables = {a: np.bincount(columns[a][idx].astype(np.int64)*K + y_node, minlength=sizes[a]*K)
+                   .reshape(sizes[a], K).tolist()
+              for a in attrs}
+    return class_counts, first_seen, tables
+
+def _split_numpy(idx, col, size):
+    values = col[idx]
+    order = np.argsort(values, kind="stable")  # stabil: Indizes bleiben aufsteigend
+    bounds = np.cumsum(np.bincount(values, minlength=size))
+    return np.split(idx[order], bounds[:-1])
+
+def id3_counts(dataset, attrs=None, use_numpy=None, rows=None):
+    """
+    ID3 auf einem Dataset. attrs: zu verwendende Merkmale (Standard: alle).
+    use_numpy: None = NumPy, wenn installiert. rows: nur diese Zeilenindizes
+    (aufsteigend) verwenden, z. B. die Trainingsfolds einer Kreuzvalidierung.
+    Rückgabe: Baum im Format von DTL01.id3 (Test-Knoten als Dict, Blätter als
+    Klassenname).
+    """
+    attrs = list(dataset.attrs if attrs is None else attrs)
+    if use_numpy is None: use_numpy = np is not None
+    labels = dataset.labels
+    K = len(labels)
+    sizes = {a: len(dataset.categories[a]) for a in attrs}
+    python = (dataset.columns, dataset.columns[dataset.target], _tables_python, _split_python)
+    if use_numpy:
+        numpy = ({a: np.asarray(dataset.columns[a]) for a in attrs},
+                 np.asarray(dataset.columns[dataset.target]).astype(np.int64),
+                 _tables_numpy, _split_numpy)
+        root = np.arange(len(dataset)) if rows is None else np.asarray(rows, dtype=np.int64)
+    else:
+        root = range(len(dataset)) if rows is None else list(rows)
+
+    def build(idx, attrs):
+        if use_numpy and isinstance(idx, np.ndarray) and len(idx) < SMALL_NODE:
+            idx = idx.tolist()  # kleiner Knoten: ab hier reines Python
+        columns, y, tables_fn, split_fn = numpy if use_numpy and isinstance(idx, np.ndarray) else python
+        class_counts, first_seen, tables = tables_fn(idx, columns, y, attrs, sizes, K)
+        present = [c for c, k in enumerate(class_counts) if k]
+        if len(present) == 1: return labels[present[0]]
+        majority = labels[_majority(class_counts, first_seen)]
+        if not attrs: return majority
+        n = len(idx)
+        best = max(attrs, key=lambda a: gain_from_table(tables[a], class_counts, n))
+        node = {"type":"test","attr":best,"children":{}}
+        rest = [a for a in attrs if a != best]
+        for code, part in enumerate(split_fn(idx, columns[best], sizes[best])):
+            node["children"][dataset.categories[best][code]] = build(part, rest) if len(part) else majority
+        return node
+
+    if not len(root):
+        raise ValueError("Leerer Datensatz")
+    return build(root, attrs)
+
+# Demo
+
+if __name__ == "__main__":
+    import csv
+    import os
+    import random
+    import time
+    import DTL01
+    from dataset import Dataset
+
+    # 1) Beispiel aus DTL01.py: gleicher Baum wie id3
+    ds = Dataset.from_records(DTL01.data, ["Alter","Einkommen","Bildung"], "Kandidat", DTL01.attr_values)
+    tree = id3_counts(ds)
+    assert tree == DTL01.id3(DTL01.data, ["Alter","Einkommen","Bildung"])
+    assert tree == id3_counts(ds, use_numpy=False)
+    print("=== ID3 (Zähltabellen) auf DTL01.data ===")
+    DTL01.print_tree(tree)
+
+    # 2) zoo.csv und restaurant.csv
+    folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "DTL_03")
+    for name, target, skip in (("restaurant.csv", "WillWait", ()), ("zoo.csv", "class", ("animal",))):
+        with open(os.path.join(folder, name), newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        attrs = [a for a in rows[0] if a != target and a not in skip]
+        ds = Dataset.from_records(rows, attrs, target)
+        tree = id3_counts(ds)
+        assert tree == id3_counts(ds, use_numpy=False)
+        print(f"\n{name}: {len(ds)} Beispiele, Wurzeltest {tree['attr']!r}")
+
+    # 3) synthetische Daten: 8 Attribute mit je 4 Werten, Klasse aus einer Regel plus 5 % Rauschen
+    rng = random.Random(0)
+    attrs = [f"a{j}" for j in range(8)]
+    def synthetic(n):
+        for _ in range(n):
+            e = {a: rng.randrange(4) for a in attrs}
+            label = "ja" if (e["a0"] >= 2) != (e["a3"] == 1 and e["a5"] < 2) else "nein"
+            if rng.random() < 0.05: label = "nein" if label == "ja" else "ja"
+            e["y"] = label
+            yield e
+    for n in (100_000, 1_000_000):
+        ds = Dataset.from_records(synthetic(n), attrs, "y")
+        engines = [("numpy", True)] if np is not None else []
+        if n <= 100_000: engines.append(("python", False))
+        for label, flag in engines:
+            t0 = time.perf_counter()
+            id3_counts(ds, use_numpy=flag)
+            print(f"synthetisch n={n}: {label} {time.perf_counter() - t0:.2f}s")
@@ -0,0 +1,279 @@
+import heapq
+from collections import deque
+
+# Constraint Satisfaction mit Backtracking
+#
+# Ein CSP hat Variablen 0..n-1 (Namen in variables), eine gemeinsame
+# Werteliste values und binäre Constraints zwischen Nachbarn. Domänen sind
+# Bitmengen (int, Bit i = values[i]); Streichen ist ein &~, die Domänengröße
+# ein bit_count. Constraints:
+#   - conflicts=None: Nachbarn müssen verschiedene Werte haben (Kartenfärben),
+#   - sonst conflicts(i, a, j) -> Bitmaske der Werte von j, die mit i=a
+#     unverträglich sind (z. B. Zeile und Diagonalen bei N-Damen).
+#
+# solve() sucht iterativ (eigener Stapel statt Rekursion, also auch für
+# zehntausende Variablen) mit
+#   - MRV, bei Gleichstand Grad: Heap mit (Domänengröße, -Grad, Variable),
+#     veraltete Einträge werden beim Herausnehmen übersprungen,
+#   - LCV: Werte, die bei den Nachbarn am wenigsten streichen, zuerst,
+#   - Forward Checking und optional AC-3 (MAC) mit Kanten-Warteschlange,
+#   - einem Trail: jede Domänenänderung wird gemerkt und beim Backtracking
+#     zurückgenommen, statt Domänen zu kopieren.
+#
+#   csp = map_coloring(NEIGHBORS, COLORS)
+#   coloring = solve(csp)              # Liste wie ein GA-Individuum, None = unlösbar
+
+class CSP:
+    def __init__(self, variables, values, neighbors, conflicts=None):
+        """neighbors: Liste (Index -> Nachbarindizes) oder Dict (Name -> Nachbarnamen)."""
+        self.variables = list(variables)
+        self.values = list(values)
+        index = {v: i for i, v in enumerate(self.variables)}
+        adjacent = [set() for _ in self.variables]
+        for i, v in enumerate(self.variables):
+            for w in (neighbors[v] if isinstance(neighbors, dict) else neighbors[i]):
+                j = index[w] if isinstance(neighbors, dict) else w
+                if j != i:
+                    adjacent[i].add(j)
+                    adjacent[j].add(i)  # Constraints gelten in beide Richtungen
+        self.neighbors = [sorted(a) for a in adjacent]
+        self.conflicts = conflicts
+        self.full = (1 << len(self.values)) - 1
+
+    def __len__(self):
+        return len(self.variables)
+
+    def domains(self):
+        return [self.full] * len(self.variables)
+
+    def decode(self, assignment):
+        """Wertindizes -> Werte (Reihenfolge wie variables)."""
+        return None if assignment is None else [self.values[a] for a in assignment]
+
+    def check(self, solution):
+        """Anzahl verletzter Constraints einer Lösung (Liste von Werten)."""
+        code = {v: i for i, v in enumerate(self.values)}
+        a = [code[v] for v in solution]
+        violated = 0
+        for i, adjacent in enumerate(self.neighbors):
+            for j in adjacent:
+                if i < j and (a[i] == a[j] if self.conflicts is None
+                              else self.conflicts(i, a[i], j) >> a[j] & 1):
+                    violated += 1
+        return violated
+
+# Probleme
+
+def map_coloring(neighbors, colors):
+    """Kartenfärben aus einem NEIGHBORS-Dict wie in test.py (Praktikum 2)."""
+    return CSP(list(neighbors), colors, neighbors)
+
+def n_queens(n):
+    """
+    N-Damen: Variable = Spalte, Wert = Zeile 1..n (wie die Gene bei
+    queens_fitness). Jede Spalte ist Nachbar jeder anderen.
+    """
+    def conflicts(i, a, j):
+        d = abs(i - j)
+        mask = 1 << a | 1 << (a + d)
+        if a >= d:
+            mask |= 1 << (a - d)
+        return mask & full
+    full = (1 << n) - 1
+    return CSP(range(n), range(1, n + 1), [[j for j in range(n) if j != i] for i in range(n)], conflicts)
+
+# Kantenkonsistenz
+
+def _bits(d):
+    while d:
+        low = d & -d
+        yield low.bit_length() - 1
+        d ^= low
+
+def revise(csp, domains, i, j):
+    """Werte von i ohne Unterstützung in j streichen. Rückgabe: neue Domäne von i."""
+    di, dj = domains[i], domains[j]
+    if csp.conflicts is None:
+        # bei != fehlt Unterstützung nur, wenn j genau einen Wert hat
+        return di & ~dj if dj & (dj - 1) == 0 else di
+    for a in _bits(di):
+        if not dj & ~csp.conflicts(i, a, j):
+            di &= ~(1 << a)
+    return di
+
+def ac3(csp, domains=None, queue=None):
+    """
+    AC-3 mit Kanten-Warteschlange (i, j). Ohne queue werden alle Kanten
+    geprüft. Ändert domains an Ort und Stelle; Rückgabe: False bei leerer Domäne.
+    """
+    if domains is None:
+        domains = csp.domains()
+    if queue is None:
+        queue = deque((i, j) for i in range(len(csp)) for j in csp.neighbors[i])
+    waiting = set(queue)
+    while queue:
+        arc = queue.popleft()
+        waiting.discard(arc)
+        i, j = arc
+        d = revise(csp, domains, i, j)
+        if d != domains[i]:
+            if not d:
+                return False
+            domains[i] = d
+            for k in csp.neighbors[i]:
+                if k != j and (k, i) not in waiting:
+                    waiting.add((k, i))
+                    queue.append((k, i))
+    return True
+
+# Suche
+
+def solve(csp, inference="fc", lcv=True, stats=None):
+    """
+    Backtracking-Suche. inference: "none" (nur Konsistenzprüfung der
+    Zuweisung), "fc" (Forward Checking) oder "mac" (Forward Checking, dann
+    AC-3 über die geänderten Variablen). stats: Dict für Zähler (assignments,
+    backtracks, prunings). Rückgabe: Liste der Werte oder None.
+    """
+    n = len(csp)
+    neighbors = csp.neighbors
+    conflicts = csp.conflicts
+    not_equal = conflicts is None
+    domains = csp.domains()
+    if stats is None:
+        stats = {}
+    stats.update(assignments=0, backtracks=0, prunings=0)
+    if inference == "mac" and not ac3(csp, domains):
+        return None
+    assignment = [-1] * n
+    rank = [-len(a) for a in neighbors]  # höherer Grad zuerst
+    heappush = heapq.heappush
+    trail = []   # (Variable, alte Domäne)
+    heap = [(domains[v].bit_count(), rank[v], v) for v in range(n)]
+    heapq.heapify(heap)
+
+    def select():
+        # MRV, dann Grad; veraltete Heap-Einträge überspringen
+        while heap:
+            size, _, v = heapq.heappop(heap)
+            if assignment[v] < 0 and domains[v].bit_count() == size:
+                return v
+        return None
+
+    def compact():
+        # zu viele veraltete Einträge: Heap aus den offenen Variablen neu aufbauen
+        if len(heap) > 8 * n + 64:
+            heap[:] = [(domains[u].bit_count(), rank[u], u) for u in range(n) if assignment[u] < 0]
+            heapq.heapify(heap)
+
+    def restrict(v, d):
+        trail.append((v, domains[v]))
+        domains[v] = d
+        heappush(heap, (d.bit_count(), rank[v], v))
+        stats["prunings"] += 1
+        compact()
+
+    def undo(mark):
+        while len(trail) > mark:
+            v, d = trail.pop()
+            domains[v] = d
+            if assignment[v] < 0:
+                heappush(heap, (d.bit_count(), rank[v], v))
+
+    def order(v):
+        values = list(_bits(domains[v]))
+        if not lcv or len(values) < 2:
+            return values
+        open_neighbors = [domains[j] for j in neighbors[v] if assignment[j] < 0]
+        if not_equal:
+            cost = lambda a: sum(d >> a & 1 for d in open_neighbors)
+        else:
+            open_ids = [j for j in neighbors[v] if assignment[j] < 0]
+            cost = lambda a: sum((domains[j] & conflicts(v, a, j)).bit_count() for j in open_ids)
+        return sorted(values, key=cost)
+
+    def consistent(v, a):
+        if not_equal:
+            return all(assignment[j] != a for j in neighbors[v])
+        return all(assignment[j] < 0 or not conflicts(v, a, j) >> assignment[j] & 1 for j in neighbors[v])
+
+    def propagate(v, a):
+        bit = 1 << a
+        # Forward Checking: unverträgliche Werte bei allen offenen Nachbarn streichen
+        changed = []
+        for j in neighbors[v]:
+            if assignment[j] < 0:
+                d = domains[j]
+                nd = d & ~bit if not_equal else d & ~conflicts(v, a, j)
+                if nd != d:
+                    if not nd:
+                        return False
+                    trail.append((j, d))
+                    domains[j] = nd
+                    heappush(heap, (nd.bit_count(), rank[j], j))
+                    changed.append(j)
+        stats["prunings"] += len(changed)
+        compact()
+        if inference != "mac":
+            return True
+        # AC-3 nur ab den geänderten Variablen
+        queue = deque((k, j) for j in changed for k in neighbors[j] if assignment[k] < 0)
+        waiting = set(queue)
+        while queue:
+            arc = queue.popleft()
+            waiting.discard(arc)
+            i, j = arc
+            d = revise(csp, domains, i, j)
+            if d != domains[i]:
+                if not d:
+                    return False
+                restrict(i, d)
+                for k in neighbors[i]:
+                    if k != j and assignment[k] < 0 and (k, i) not in waiting:
+                        waiting.add((k, i))
+                        queue.append((k, i))
+        return True
+
+    stack = []  # [Variable, Werte, nächster Index, Trail-Marke]
+    while True:
+        v = select()
+        if v is None:
+            return csp.decode(assignment)
+        stack.append([v, order(v), 0, len(trail)])
+        while True:
+            if not stack:
+                return None
+            frame = stack[-1]
+            v, values, i, mark = frame
+            undo(mark)
+            assignment[v] = -1
+            if i == len(values):
+                stack.pop()
+                heappush(heap, (domains[v].bit_count(), rank[v], v))
+                stats["backtracks"] += 1
+                continue
+            frame[2] = i + 1
+            a = values[i]
+            if inference == "none" and not consistent(v, a):
+                continue
+            stats["assignments"] += 1
+            assignment[v] = a
+            trail.append((v, domains[v]))
+            domains[v] = 1 << a
+            if inference == "none" or propagate(v, a):
+                break
+
+# Demo
+
+if __name__ == "__main__":
+    csp = map_coloring({
+        'A': ['B', 'C'], 'B': ['A', 'C', 'D'], 'C': ['A', 'B', 'D', 'E'],
+        'D': ['B', 'C', 'E', 'F'], 'E': ['C', 'D', 'F'], 'F': ['D', 'E'],
+    }, ['rot', 'grün', 'blau'])
+    coloring = solve(csp)
+    print("Karte mit 3 Farben:", dict(zip(csp.variables, coloring)), "Konflikte:", csp.check(coloring))
+    for n in (8, 30):
+        queens = n_queens(n)
+        stats = {}
+        rows = solve(queens, stats=stats)
+        print(f"{n}-Damen:", rows, "Konflikte:", queens.check(rows), stats)
@@ -0,0 +1,82 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+from csp import map_coloring, n_queens, solve
+
+# CSP-Löser gegen den Genetischen Algorithmus aus Praktikum 2
+#
+# Gleiche Probleme wie dort: die Karte NEIGHBORS mit COLORS aus test.py,
+# zufällige planare Karten aus benchmark.py und N-Damen (geprüft mit
+# queens_fitness). Der GA läuft mit seinen Standardparametern (80 x 800 bzw.
+# 60 x 600), der CSP-Löser bis zur exakten Lösung.
+#
+#   python csp_benchmark.py --regions 1000 10000 50000 --queens 8 32 64
+
+GA_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Praktikum 2",
+                         "EA_02_ Implementierung_Python_code")
+sys.path.insert(0, GA_FOLDER)  # test.py, ga_basic.py und benchmark.py liegen dort
+
+from test import NEIGHBORS, REGIONS, COLORS, map_conflicts, queens_fitness, solve_map_coloring, solve_queens
+from benchmark import random_planar_map
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # der GA schreibt pro Generation eine Zeile
+        result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def min_colors(neighbors, colors):
+    """Kleinste Farbanzahl, mit der die Karte färbbar ist (aufsteigend probieren)."""
+    for k in range(1, len(colors) + 1):
+        coloring = solve(map_coloring(neighbors, colors[:k]))
+        if coloring is not None:
+            return k, coloring
+    return None, None
+
+def report(label, seconds, conflicts, stats=None):
+    extra = ""
+    if stats:
+        extra = f"  Zuweisungen {stats['assignments']:6d}, Backtracks {stats['backtracks']:5d}"
+    print(f"  {label:34s} {seconds * 1000:9.1f} ms  Konflikte {conflicts}{extra}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSP-Löser gegen den GA")
+    parser.add_argument("--regions", type=int, nargs="+", default=[1000, 10000, 20000, 50000])
+    parser.add_argument("--queens", type=int, nargs="+", default=[8, 16, 32, 64])
+    parser.add_argument("--inference", nargs="+", default=["fc", "mac"], choices=["none", "fc", "mac"])
+    args = parser.parse_args(argv)
+
+    print(f"Karte aus test.py ({len(REGIONS)} Regionen, {len(COLORS)} Farben):")
+    best, seconds = timed(solve_map_coloring)
+    report("GA (80 x 800)", seconds, map_conflicts(best))
+    for inference in args.inference:
+        stats = {}
+        coloring, seconds = timed(solve, map_coloring(NEIGHBORS, COLORS), inference, stats=stats)
+        report(f"CSP ({inference})", seconds, map_conflicts(coloring), stats)
+    (k, coloring), seconds = timed(min_colors, NEIGHBORS, COLORS)
+    report(f"CSP, minimale Farbanzahl = {k}", seconds, map_conflicts(coloring))
+
+    for regions in args.regions:
+        neighbors = random_planar_map(regions)
+        csp = map_coloring(neighbors, COLORS)
+        print(f"\nZufällige planare Karte, {regions} Regionen, {len(COLORS)} Farben:")
+        for inference in args.inference:
+            stats = {}
+            coloring, seconds = timed(solve, csp, inference, stats=stats)
+            report(f"CSP ({inference})", seconds, csp.check(coloring), stats)
+
+    print("\nN-Damen:")
+    best, seconds = timed(solve_queens, 8)
+    report("GA 8-Damen (60 x 600)", seconds, round(1 / queens_fitness(best)) - 1)
+    for n in args.queens:
+        csp = n_queens(n)
+        stats = {}
+        rows, seconds = timed(solve, csp, "fc", stats=stats)
+        report(f"CSP {n}-Damen (fc)", seconds, round(1 / queens_fitness(rows)) - 1, stats)
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,7 @@ h_km = {
 # (Assume any single road edge on the map is <= 300 km.)
 h_steps = {n: math.ceil(h_km[n] / 300) for n in h_km}
 
-def dfs_graph(start, goal):
+def dfs_graph(start, goal, graph=G):
     #depht-first search (graph-search): uses a stack and a visited set
     stack = [(start, [start])]
     visited = set([start])
@@ -47,14 +47,14 @@ def dfs_graph(start, goal):
         if node == goal:
             return path, pops, max_ds
         # push neighbors in reverse alphabetical order so that pop() makes alphabetical first
-        for nb in sorted(G[node], reverse=True):
+        for nb in sorted(graph[node], reverse=True):
             if nb not in visited:
                 visited.add(nb)
                 stack.append((nb, path + [nb]))
         max_ds = max(max_ds, len(stack))
     return None, pops, max_ds
 
-def bfs_graph(start, goal):
+def bfs_graph(start, goal, graph=G):
     # breadth-first search (graph-search): uses a queue and a visited set
     q = deque([(start, [start])])
     visited = set([start])
@@ -65,14 +65,14 @@ def bfs_graph(start, goal):
         pops += 1
         if node == goal:
             return path, pops, max_q
-        for nb in sorted(G[node]):  # alphabetical enqueue
+        for nb in sorted(graph[node]):  # alphabetical enqueue
             if nb not in visited:
                 visited.add(nb)
                 q.append((nb, path + [nb]))
         max_q = max(max_q, len(q))
     return None, pops, max_q
 
-def astar_tree_no_cycles(start, goal, heuristic):
+def astar_tree_no_cycles(start, goal, heuristic, graph=G):
     # A* tree-search with no cycels: no revisit any node already on the current path
     counter = 0
     frontier = []
@@ -84,7 +84,7 @@ def astar_tree_no_cycles(start, goal, heuristic):
         pops += 1
         if node == goal:
             return path, pops, max_frontier
-        for nb in sorted(G[node]):  # alphabetical tiebreak
+        for nb in sorted(graph[node]):  # alphabetical tiebreak
             if nb in path:  # avoid any cycele
                 continue
             g2 = g + 1                      # unit step cost
@@ -94,35 +94,146 @@ def astar_tree_no_cycles(start, goal, heuristic):
         max_frontier = max(max_frontier, len(frontier))
     return None, pops, max_frontier
 
-# start all searchings
-dfs_path, dfs_pops, dfs_max = dfs_graph(start, goal)
-bfs_path, bfs_pops, bfs_max = bfs_graph(start, goal)
-astar_bad_path, astar_bad_pops, astar_bad_max = astar_tree_no_cycles(start, goal, h_km)
-astar_ok_path, astar_ok_pops, astar_ok_max = astar_tree_no_cycles(start, goal, h_steps)
-
-print("DFS (graph-search):")
-print("  Path:", " → ".join(dfs_path))
-print("  pops:", dfs_pops, " | max stack size:", dfs_max)
-print()
-
-print("BFS (graph-search):")
-print("  Path:", " → ".join(bfs_path))
-print("  pops:", bfs_pops, " | max queue size:", bfs_max)
-print()
-
-print("A* with given h_km (tree-search, no cycles):")
-print("  Path:", " → ".join(astar_bad_path))
-print("  pops:", astar_bad_pops, " | max frontier size:", astar_bad_max)
-print()
-
-print("A* with corrected h_steps = ceil(h_km/300) (tree-search, no cycles):")
-print("  Path:", " → ".join(astar_ok_path))
-print("  pops:", astar_ok_pops, " | max frontier size:", astar_ok_max)
-
-print()
-print()
-print("""
+# Parent-pointer variants: the frontier holds only nodes (plus f/g for A*),
+# each node's predecessor is stored once in a dict and the path is rebuilt
+# only when the goal is popped. Same expansion order and counters as above.
+
+def reconstruct(parent, goal):
+    path = [goal]
+    while parent[path[-1]] is not None:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+def dfs_graph_parents(start, goal, graph=G):
+    stack = [start]
+    parent = {start: None}  # doubles as visited set
+    max_ds = 1
+    pops = 0
+    while stack:
+        node = stack.pop()
+        pops += 1
+        if node == goal:
+            return reconstruct(parent, goal), pops, max_ds
+        for nb in sorted(graph[node], reverse=True):
+            if nb not in parent:
+                parent[nb] = node
+                stack.append(nb)
+        max_ds = max(max_ds, len(stack))
+    return None, pops, max_ds
+
+def bfs_graph_parents(start, goal, graph=G):
+    q = deque([start])
+    parent = {start: None}
+    max_q = 1
+    pops = 0
+    while q:
+        node = q.popleft()
+        pops += 1
+        if node == goal:
+            return reconstruct(parent, goal), pops, max_q
+        for nb in sorted(graph[node]):
+            if nb not in parent:
+                parent[nb] = node
+                q.append(nb)
+        max_q = max(max_q, len(q))
+    return None, pops, max_q
+
+def astar_graph(start, goal, heuristic, graph=G, cost=None):
+    # A* graph-search with a closed set and lazy deletion: a node is pushed again
+    # whenever a cheaper g is found, outdated heap entries of already closed
+    # nodes are skipped on pop. A closed node is reopened if a cheaper path to
+    # it turns up, so an admissible but inconsistent heuristic still gives an
+    # optimal path. cost(a, b) gives the edge cost (default: unit step cost).
+    counter = 0
+    frontier = [(heuristic[start], counter, start, 0)]  # (f, tiebreak, node, g)
+    best_g = {start: 0}
+    parent = {start: None}
+    closed = set()
+    max_frontier = 1
+    pops = 0
+    while frontier:
+        f, _, node, g = heappop(frontier)
+        if node in closed or g > best_g[node]:
+            continue  # stale entry, the node was already expanded with a cheaper g
+        pops += 1
+        if node == goal:
+            return reconstruct(parent, goal), pops, max_frontier
+        closed.add(node)
+        for nb in sorted(graph[node]):  # alphabetical tiebreak
+            g2 = g + (1 if cost is None else cost(node, nb))
+            if g2 >= best_g.get(nb, math.inf):
+                continue
+            best_g[nb] = g2
+            parent[nb] = node
+            closed.discard(nb)  # reopen
+            counter += 1
+            heappush(frontier, (g2 + heuristic[nb], counter, nb, g2))
+        max_frontier = max(max_frontier, len(frontier))
+    return None, pops, max_frontier
+
+if __name__ == "__main__":
+    # start all searchings
+    dfs_path, dfs_pops, dfs_max = dfs_graph(start, goal)
+    bfs_path, bfs_pops, bfs_max = bfs_graph(start, goal)
+    astar_bad_path, astar_bad_pops, astar_bad_max = astar_tree_no_cycles(start, goal, h_km)
+    astar_ok_path, astar_ok_pops, astar_ok_max = astar_tree_no_cycles(start, goal, h_steps)
+
+    print("DFS (graph-search):")
+    print("  Path:", " → ".join(dfs_path))
+    print("  pops:", dfs_pops, " | max stack size:", dfs_max)
+    print()
+
+    print("BFS (graph-search):")
+    print("  Path:", " → ".join(bfs_path))
+    print("  pops:", bfs_pops, " | max queue size:", bfs_max)
+    print()
+
+    print("A* with given h_km (tree-search, no cycles):")
+    print("  Path:", " → ".join(astar_bad_path))
+    print("  pops:", astar_bad_pops, " | max frontier size:", astar_bad_max)
+    print()
+
+    print("A* with corrected h_steps = ceil(h_km/300) (tree-search, no cycles):")
+    print("  Path:", " → ".join(astar_ok_path))
+    print("  pops:", astar_ok_pops, " | max frontier size:", astar_ok_max)
+
+    print()
+    print()
+    print("""
 Gegebene h(n) (in km) dürfen nicht für A* mit Schrittkosten=1 benutzt werden weil
 die Einheiten passen nicht, Heuristik überschätzt (z.B. Nürnberg 537 > 1). Man müsste machen: 
 h_steps = ceil(h_km / 300)
-""")
\ No newline at end of file
+""")
+
+    # Parent-pointer variants: same paths, no path copies in the frontier
+    print("Parent pointers / closed set:")
+    for name, (path, pops, max_f) in (
+            ("DFS", dfs_graph_parents(start, goal)),
+            ("BFS", bfs_graph_parents(start, goal)),
+            ("A* h_km (graph-search)", astar_graph(start, goal, h_km)),
+            ("A* h_steps (graph-search)", astar_graph(start, goal, h_steps))):
+        print(f"  {name}: {' → '.join(path)} | pops: {pops} | max frontier size: {max_f}")
+
+    # Larger graph: n x n grid, search from one corner to the other
+    # (astar_tree_no_cycles is left out: without a closed set it expands the
+    # many equally good grid paths separately and does not finish in time)
+    import time
+    import tracemalloc
+    n = 150
+    grid = {(r, c): {(r + dr, c + dc) for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                     if 0 <= r + dr < n and 0 <= c + dc < n}
+            for r in range(n) for c in range(n)}
+    manhattan = {(r, c): (n - 1 - r) + (n - 1 - c) for r, c in grid}
+    print(f"\n{n}x{n} grid ({len(grid)} nodes), corner to corner:")
+    for name, search in (("BFS  path copies  ", lambda: bfs_graph((0, 0), (n - 1, n - 1), grid)),
+                         ("BFS  parent dict  ", lambda: bfs_graph_parents((0, 0), (n - 1, n - 1), grid)),
+                         ("A*   closed set   ", lambda: astar_graph((0, 0), (n - 1, n - 1), manhattan, grid))):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        path, pops, max_f = search()
+        elapsed = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name}: length {len(path) - 1}, pops {pops}, max frontier {max_f}, "
+              f"{elapsed:.2f}s, peak memory {peak / 1e6:.1f} MB")
\ No newline at end of file
@@ -0,0 +1,308 @@
+import math
+import mmap
+import random
+import struct
+from array import array
+from heapq import heappush, heappop
+
+from road_graph import astar
+
+# ALT heuristic (A*, Landmarks, Triangle inequality) and bidirectional search
+#
+# Offline: pick k landmarks L and store d(L, v) and d(v, L) for every node v
+# (one Dijkstra per landmark and direction). Online, for any goal t the
+# triangle inequality gives
+#     d(v, t) >= d(L, t) - d(L, v)   and   d(v, t) >= d(v, L) - d(t, L)
+# so h_t(v) = max over L of both bounds is admissible and consistent, unlike
+# the hand-written h_km. Queries only look at the few landmarks that give the
+# best bound at the start node.
+#
+#   lm = Landmarks.build(graph, k=8)         # or Landmarks.load(path, graph)
+#   astar(graph, s, t, lm.to_target(t, s))   # unidirectional A*
+#   bidirectional(graph, s, t, lm)           # bidirectional A* (None: Dijkstra)
+
+MAGIC = b"ALTL0001"
+
+def distances(graph, source):
+    """Dijkstra from source over the whole graph: array of distances (inf = unreachable)."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = array("d", [math.inf]) * len(graph)
+    dist[source] = 0.0
+    frontier = [(0.0, source)]
+    while frontier:
+        d, node = heappop(frontier)
+        if d > dist[node]:
+            continue  # stale entry
+        for k in range(offsets[node], offsets[node + 1]):
+            nb = targets[k]
+            d2 = d + weights[k]
+            if d2 < dist[nb]:
+                dist[nb] = d2
+                heappush(frontier, (d2, nb))
+    return dist
+
+def _bound(rows):
+    # rows: (row_a, a_t, row_b, b_t); bound(v) = max(a_t - row_a[v], row_b[v] - b_t, 0)
+    def h(v):
+        best = 0.0
+        for row_a, a_t, row_b, b_t in rows:
+            d = a_t - row_a[v]
+            if d > best: best = d
+            d = row_b[v] - b_t
+            if d > best: best = d
+        return best
+    return h
+
+class Landmarks:
+    def __init__(self, graph, ids, dist_from, dist_to, directed):
+        self.graph = graph
+        self.ids = ids                # landmark node ids
+        self.dist_from = dist_from    # dist_from[i][v] = d(L_i, v)
+        self.dist_to = dist_to        # dist_to[i][v] = d(v, L_i) (same rows if undirected)
+        self.directed = directed
+
+    @classmethod
+    def build(cls, graph, k=8, directed=False, seed=0):
+        """
+        Farthest-point selection: start at a random node, then repeatedly take
+        the node farthest from all landmarks chosen so far. Once every node the
+        landmarks reach is a landmark, the selection restarts in a node they
+        do not reach (another component); if there is none, fewer than k
+        landmarks are returned. directed=True also runs Dijkstra on the
+        reversed graph for d(v, L).
+        """
+        n = len(graph)
+        k = min(k, n)
+        reverse = graph.reversed() if directed else None
+        nearest = array("d", [math.inf]) * n  # distance to the closest landmark
+        probe = distances(graph, random.Random(seed).randrange(n)) if n else None
+        ids, dist_from, dist_to = [], [], []
+        while len(ids) < k:
+            chosen = set(ids)
+            if probe is None:
+                candidates = [(d, v) for v, d in enumerate(nearest) if d < math.inf and v not in chosen]
+                if not candidates:
+                    unreached = next((v for v, d in enumerate(nearest) if d == math.inf), None)
+                    if unreached is None:
+                        break
+                    probe = distances(graph, unreached)
+            if probe is not None:
+                # first pick in a component: the node farthest from the probe node
+                candidates = [(d, v) for v, d in enumerate(probe) if d < math.inf and v not in chosen]
+                probe = None
+            best = max(candidates)[1]
+            ids.append(best)
+            dist_from.append(distances(graph, best))
+            dist_to.append(distances(reverse, best) if directed else dist_from[-1])
+            nearest = array("d", map(min, nearest, dist_from[-1]))
+        return cls(graph, ids, dist_from, dist_to, directed)
+
+    def _rows(self, t, s, active, to_target):
+        rows = []
+        for row_f, row_t in zip(self.dist_from, self.dist_to):
+            if row_f[t] == math.inf or row_t[t] == math.inf:
+                continue  # landmark gives no finite bound for this node
+            if to_target:
+                rows.append((row_f, row_f[t], row_t, row_t[t]))
+            else:
+                rows.append((row_t, row_t[t], row_f, row_f[t]))
+        if s is not None and len(rows) > active:
+            rows.sort(key=lambda r: -max(r[1] - r[0][s], r[2][s] - r[3]))
+            rows = rows[:active]
+        return rows
+
+    def to_target(self, t, s=None, active=4):
+        """Lower bound h(v) <= d(v, t); with s given, only the active best landmarks at s are used."""
+        return _bound(self._rows(t, s, active, True))
+
+    def from_source(self, s, t=None, active=4):
+        """Lower bound h(v) <= d(s, v) (for the backward search)."""
+        return _bound(self._rows(s, t, active, False))
+
+    def table(self, goal, start=None, active=4):
+        """Heuristic as a dict name -> estimate, usable with astar_* in algorithmus.py."""
+        g = self.graph
+        h = self.to_target(g.ids[goal], None if start is None else g.ids[start], active)
+        return {name: h(i) for i, name in enumerate(g.names)}
+
+    # binary format: magic, n, k, directed, landmark ids, then k rows d(L, .) (and k rows d(., L))
+
+    def save(self, path):
+        n, k = len(self.graph), len(self.ids)
+        with open(path, "wb") as f:
+            f.write(MAGIC + struct.pack("<qqq", n, k, self.directed))
+            ids = array("q", self.ids)
+            f.write(ids.tobytes())
+            for row in self.dist_from + (self.dist_to if self.directed else []):
+                f.write(row.tobytes() if isinstance(row, array) else bytes(row))
+
+    @classmethod
+    def load(cls, path, graph):
+        """Memory-map a file written by save(); rows are views into the mapping."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) < 32 or mm[:8] != MAGIC:
+            mm.close()
+            raise ValueError(f"{path} is not a landmark file")
+        n, k, directed = struct.unpack_from("<qqq", mm, 8)
+        if n != len(graph):
+            mm.close()
+            raise ValueError(f"{path} was built for {n} nodes, graph has {len(graph)}")
+        view = memoryview(mm)
+        ids = list(view[32:32 + 8 * k].cast("q"))
+        pos = 32 + 8 * k
+        rows = []
+        for _ in range(2 * k if directed else k):
+            rows.append(view[pos:pos + 8 * n].cast("d"))
+            pos += 8 * n
+        lm = cls(graph, ids, rows[:k], rows[k:] if directed else rows[:k], bool(directed))
+        lm._mmap = mm  # keep the mapping alive
+        return lm
+
+def alt_astar(graph, landmarks, start, goal, active=4):
+    """A* with the ALT heuristic; same return value as road_graph.astar."""
+    return astar(graph, start, goal, landmarks.to_target(goal, start, active))
+
+def bidirectional(graph, start, goal, landmarks=None, reverse=None, active=4):
+    """
+    Forward search from start and backward search from goal, always
+    expanding the smaller frontier. Without landmarks this is bidirectional
+    Dijkstra; with landmarks both searches use the average potential
+    p(v) = (h_goal(v) - h_start(v)) / 2 (forward +p, backward -p), which keeps
+    both consistent. Stops when the two smallest keys add up to the best
+    meeting cost mu. reverse: reversed graph for directed maps (default: the
+    graph itself, i.e. undirected). Dicts instead of arrays of size n, so a
+    query only touches what it explores.
+    Returns (path of ids, cost, pops, max frontier size) like road_graph.astar.
+    """
+    if start == goal:
+        return [start], 0.0, 1, 1
+    if landmarks is None:
+        p = lambda v: 0.0
+    else:
+        h_goal = landmarks.to_target(goal, start, active)
+        h_start = landmarks.from_source(start, goal, active)
+        p = lambda v: (h_goal(v) - h_start(v)) / 2
+    graphs = (graph, graph if reverse is None else reverse)
+    sign = (1, -1)
+    dist = ({start: 0.0}, {goal: 0.0})
+    parent = ({start: -1}, {goal: -1})
+    closed = (set(), set())
+    frontiers = ([(p(start), start)], [(-p(goal), goal)])
+    mu, meet = math.inf, -1
+    pops, max_frontier = 0, 2
+    while frontiers[0] and frontiers[1]:
+        if frontiers[0][0][0] + frontiers[1][0][0] >= mu:
+            break
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        _, node = heappop(frontiers[side])
+        if node in closed[side]:
+            continue  # stale entry
+        closed[side].add(node)
+        pops += 1
+        g = dist[side][node]
+        offsets, targets, weights = graphs[side].offsets, graphs[side].targets, graphs[side].weights
+        mine, other = dist[side], dist[1 - side]
+        for k in range(offsets[node], offsets[node + 1]):
+            nb = targets[k]
+            g2 = g + weights[k]
+            if g2 < mine.get(nb, math.inf):
+                mine[nb] = g2
+                parent[side][nb] = node
+                heappush(frontiers[side], (g2 + sign[side] * p(nb), nb))
+                if nb in other and g2 + other[nb] < mu:
+                    mu, meet = g2 + other[nb], nb
+        max_frontier = max(max_frontier, len(frontiers[0]) + len(frontiers[1]))
+    if meet < 0:
+        return None, math.inf, pops, max_frontier
+    path = [meet]
+    while parent[0][path[-1]] >= 0:
+        path.append(parent[0][path[-1]])
+    path.reverse()
+    while parent[1][path[-1]] >= 0:
+        path.append(parent[1][path[-1]])
+    return path, mu, pops, max_frontier
+
+# Demo
+
+if __name__ == "__main__":
+    import os
+    import statistics
+    import tempfile
+    import time
+    from algorithmus import G, h_km, h_steps, start, goal, astar_tree_no_cycles
+    from road_graph import load_csv, from_edges, synthetic_map
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    roads = load_csv(os.path.join(here, "staedte_km.csv"))
+    lm = Landmarks.build(roads, k=3)
+    s, t = roads.ids[start], roads.ids[goal]
+    print("Landmarks (km):", ", ".join(roads.names[i] for i in lm.ids))
+    h_alt = lm.table(goal, start)
+    true = {n: astar(roads, roads.ids[n], t)[1] for n in roads}
+    print(f"  {'city':10s} {'h_km':>5s} {'h_ALT':>6s} {'true':>5s}")
+    for n in sorted(roads):
+        print(f"  {n:10s} {h_km[n]:5d} {h_alt[n]:6.0f} {true[n]:5.0f}")
+    assert all(h_alt[n] <= true[n] for n in roads)
+
+    # disconnected map: landmarks in every component, never more than nodes
+    islands = from_edges([("a", "b", 1), ("c", "d", 1), ("e", "f", 1)])
+    for k in (2, 4, 6, 8):
+        lm_islands = Landmarks.build(islands, k=k)
+        assert len(lm_islands.ids) == min(k, 6) and len(set(lm_islands.ids)) == len(lm_islands.ids)
+        named = {islands.names[i] for i in lm_islands.ids}
+        covered = sum(1 for part in ({"a", "b"}, {"c", "d"}, {"e", "f"}) if part & named)
+        assert covered == min(3, (k + 1) // 2)  # a component is used up before the next one
+        for s_name, t_name, cost in (("a", "b", 1), ("c", "d", 1), ("a", "f", math.inf)):
+            s_id, t_id = islands.ids[s_name], islands.ids[t_name]
+            assert alt_astar(islands, lm_islands, s_id, t_id)[1] == cost
+            assert bidirectional(islands, s_id, t_id, lm_islands)[1] == cost
+    for label, (path, cost, pops, max_f) in (
+            ("Dijkstra", astar(roads, s, t)),
+            ("A* ALT", alt_astar(roads, lm, s, t)),
+            ("bidirectional Dijkstra", bidirectional(roads, s, t)),
+            ("bidirectional ALT", bidirectional(roads, s, t, lm))):
+        print(f"  {label:22s}: {' → '.join(roads.path_names(path))}, {cost:.0f} km, pops {pops}")
+
+    # unit step costs as in algorithmus.py: ALT table instead of h_steps
+    steps = from_edges((a, b, 1) for a in G for b in G[a] if a < b)
+    h_alt_steps = Landmarks.build(steps, k=3).table(goal, start)
+    for label, h in (("h_steps", h_steps), ("h_ALT (steps)", h_alt_steps)):
+        path, pops, max_f = astar_tree_no_cycles(start, goal, h)
+        print(f"  astar_tree_no_cycles with {label:13s}: {' → '.join(path)}, pops {pops}")
+
+    # Synthetic map: precompute once, then many point-to-point queries
+    side = 500
+    big, coords = synthetic_map(side)
+    t0 = time.perf_counter()
+    lm = Landmarks.build(big, k=8)
+    t1 = time.perf_counter()
+    path = os.path.join(tempfile.gettempdir(), "roads.alt")
+    lm.save(path)
+    lm = Landmarks.load(path, big)
+    print(f"\n{len(big)} nodes: 8 landmarks in {t1 - t0:.1f}s, "
+          f"table {os.path.getsize(path) / 2**20:.0f} MB (memory-mapped)")
+    rng = random.Random(2)
+    queries = [(rng.randrange(len(big)), rng.randrange(len(big))) for _ in range(20)]
+    engines = (
+        ("Dijkstra", lambda s, t: astar(big, s, t)),
+        ("A* air distance", lambda s, t: astar(big, s, t, lambda v: math.dist(coords[v], coords[t]))),
+        ("A* ALT", lambda s, t: alt_astar(big, lm, s, t)),
+        ("bidirectional Dijkstra", lambda s, t: bidirectional(big, s, t)),
+        ("bidirectional ALT", lambda s, t: bidirectional(big, s, t, lm)),
+    )
+    reference = None
+    for label, run in engines:
+        times, pops = [], []
+        costs = []
+        for s, t in queries:
+            t0 = time.perf_counter()
+            route, cost, n_pops, _ = run(s, t)
+            times.append(time.perf_counter() - t0)
+            pops.append(n_pops)
+            costs.append(cost)
+        if reference is None:
+            reference = costs
+        assert all(abs(a - b) < 1e-9 for a, b in zip(costs, reference))
+        print(f"  {label:22s}: median {statistics.median(times) * 1000:7.1f} ms, "
+              f"mean pops {statistics.mean(pops):9.0f}")
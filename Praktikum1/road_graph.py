@@ -0,0 +1,311 @@
+import csv
+import math
+import mmap
+import random
+import struct
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+
+# Weighted road graph in compressed-sparse-row (CSR) form
+#
+# Nodes are integers 0..n-1, names[i] is the city name and ids[name] the
+# reverse lookup. The neighbors of node i are targets[offsets[i]:offsets[i+1]]
+# with edge costs weights[...] at the same positions, sorted once by neighbor
+# name (the alphabetical tiebreak that algorithmus.py gets from sorted(G[node])).
+#
+# Sources: from_edges / load_csv (columns von,nach,km; undirected by default)
+# and a binary file (save / load) whose arrays are memory-mapped on load, so
+# a nationwide map starts without parsing.
+#
+# RoadGraph also behaves like the dict G in algorithmus.py (graph[name] gives
+# the neighbor names, graph.cost(a, b) the edge cost), so dfs_graph, bfs_graph
+# and astar_graph run on it unchanged.
+
+MAGIC = b"CSRG0001"
+
+class RoadGraph:
+    def __init__(self, names, offsets, targets, weights):
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets    # n+1 entries, 'q'
+        self.targets = targets    # m entries, 'i'
+        self.weights = weights    # m entries, 'd'
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def neighbors(self, i):
+        """(neighbor id, cost) pairs of node i."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    # dict-like interface by name (as G in algorithmus.py)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __getitem__(self, name):
+        i = self.ids[name]
+        return [self.names[j] for j in self.targets[self.offsets[i]:self.offsets[i + 1]]]
+
+    def cost(self, a, b):
+        for j, w in self.neighbors(self.ids[a]):
+            if self.names[j] == b:
+                return w
+        raise KeyError(f"no edge {a} - {b}")
+
+    def reversed(self):
+        """Graph with every edge turned around (for backward searches on directed maps)."""
+        n, m = len(self.names), len(self.targets)
+        offsets = array("q", [0]) * (n + 1)
+        for j in self.targets:
+            offsets[j + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        fill = array("q", offsets[:n])
+        targets, weights = array("i", [0]) * m, array("d", [0.0]) * m
+        for i in range(n):  # sources in id order, keeps neighbours sorted by name
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                j = self.targets[k]
+                targets[fill[j]] = i
+                weights[fill[j]] = self.weights[k]
+                fill[j] += 1
+        return RoadGraph(self.names, offsets, targets, weights)
+
+    def path_names(self, path):
+        return None if path is None else [self.names[i] for i in path]
+
+    # binary format: magic, n, m, then offsets, targets, weights, names (utf-8, "\n"-separated)
+
+    def save(self, path):
+        names = "\n".join(self.names).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(MAGIC + struct.pack("<qqq", len(self.names), len(self.targets), len(names)))
+            for arr, code in ((self.offsets, "q"), (self.targets, "i"), (self.weights, "d")):
+                f.write(arr.tobytes() if isinstance(arr, array) else array(code, arr).tobytes())
+                if len(arr) * arr.itemsize % 8:
+                    f.write(b"\0" * (8 - len(arr) * arr.itemsize % 8))  # keep the next array 8-byte aligned
+            f.write(names)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a file written by save(); arrays are views into the mapping (no copy)."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) < 32 or mm[:8] != MAGIC:
+            mm.close()
+            raise ValueError(f"{path} is not a road graph file")
+        n, m, name_bytes = struct.unpack_from("<qqq", mm, 8)
+        view = memoryview(mm)
+        pos = 32
+        arrays = []
+        for count, code, size in ((n + 1, "q", 8), (m, "i", 4), (m, "d", 8)):
+            arrays.append(view[pos:pos + count * size].cast(code))
+            pos += (count * size + 7) // 8 * 8
+        names = bytes(view[pos:pos + name_bytes]).decode("utf-8").split("\n") if n else []
+        graph = cls(names, *arrays)
+        graph._mmap = mm  # keep the mapping alive as long as the graph
+        return graph
+
+def from_edges(edges, directed=False):
+    """Build a RoadGraph from (name, name, cost) triples."""
+    ids = {}
+    src, dst, cost = array("i"), array("i"), array("d")
+    for a, b, w in edges:
+        ia = ids.setdefault(a, len(ids))
+        ib = ids.setdefault(b, len(ids))
+        src.append(ia); dst.append(ib); cost.append(float(w))
+        if not directed:
+            src.append(ib); dst.append(ia); cost.append(float(w))
+    names = [None] * len(ids)
+    for name, i in ids.items():
+        names[i] = name
+    # sort edges by (source, neighbor name) once, then count per source
+    rank = sorted(range(len(names)), key=names.__getitem__)
+    name_rank = array("i", [0]) * len(names)
+    for r, i in enumerate(rank):
+        name_rank[i] = r
+    order = sorted(range(len(src)), key=lambda e: (src[e], name_rank[dst[e]]))
+    offsets = array("q", [0]) * (len(names) + 1)
+    for s in src:
+        offsets[s + 1] += 1
+    for i in range(len(names)):
+        offsets[i + 1] += offsets[i]
+    targets = array("i", (dst[e] for e in order))
+    weights = array("d", (cost[e] for e in order))
+    return RoadGraph(names, offsets, targets, weights)
+
+def load_csv(path, directed=False):
+    """Edge list with header von,nach,km (further columns are ignored)."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return from_edges(((row[0], row[1], row[2]) for row in reader if row), directed)
+
+def synthetic_map(side, seed=1):
+    """
+    side x side random points (one per unit cell), each linked to its right
+    and lower neighbour with the air distance as cost. Nodes are named N0..;
+    returns (graph, coords) with coords[node id] = (x, y).
+    """
+    rng = random.Random(seed)
+    pts = [(r + rng.random(), c + rng.random()) for r in range(side) for c in range(side)]
+    def edges():
+        for r in range(side):
+            for c in range(side):
+                i = r * side + c
+                for j in ((i + 1) if c + 1 < side else None, (i + side) if r + 1 < side else None):
+                    if j is not None:
+                        yield f"N{i}", f"N{j}", math.dist(pts[i], pts[j])
+    graph = from_edges(edges())
+    return graph, [pts[int(name[1:])] for name in graph.names]
+
+# Searches on node ids with parent arrays (see the *_parents variants in algorithmus.py)
+
+def _path(parent, goal):
+    path = [goal]
+    while parent[path[-1]] >= 0:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+def dfs(graph, start, goal):
+    """Returns (path of ids, pops, max stack size); alphabetical order as dfs_graph."""
+    offsets, targets = graph.offsets, graph.targets
+    parent = array("i", [-1]) * len(graph)
+    seen = bytearray(len(graph))
+    seen[start] = 1
+    stack = [start]
+    max_ds, pops = 1, 0
+    while stack:
+        node = stack.pop()
+        pops += 1
+        if node == goal:
+            return _path(parent, goal), pops, max_ds
+        for k in range(offsets[node + 1] - 1, offsets[node] - 1, -1):  # reversed -> alphabetical pops
+            nb = targets[k]
+            if not seen[nb]:
+                seen[nb] = 1
+                parent[nb] = node
+                stack.append(nb)
+        max_ds = max(max_ds, len(stack))
+    return None, pops, max_ds
+
+def bfs(graph, start, goal):
+    """Returns (path of ids, pops, max queue size); fewest edges, ignores costs."""
+    offsets, targets = graph.offsets, graph.targets
+    parent = array("i", [-1]) * len(graph)
+    seen = bytearray(len(graph))
+    seen[start] = 1
+    q = deque([start])
+    max_q, pops = 1, 0
+    while q:
+        node = q.popleft()
+        pops += 1
+        if node == goal:
+            return _path(parent, goal), pops, max_q
+        for k in range(offsets[node], offsets[node + 1]):
+            nb = targets[k]
+            if not seen[nb]:
+                seen[nb] = 1
+                parent[nb] = node
+                q.append(nb)
+        max_q = max(max_q, len(q))
+    return None, pops, max_q
+
+def astar(graph, start, goal, h=None):
+    """
+    A* with real edge costs, closed set and lazy deletion. h: sequence or
+    function node id -> estimate (None = 0, i.e. Dijkstra).
+    Returns (path of ids, cost, pops, max frontier size).
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if h is None:
+        est = lambda i: 0.0
+    elif callable(h):
+        est = h
+    else:
+        est = h.__getitem__
+    n = len(graph)
+    parent = array("i", [-1]) * n
+    best_g = array("d", [math.inf]) * n
+    closed = bytearray(n)
+    best_g[start] = 0.0
+    counter = 0
+    frontier = [(est(start), counter, start)]
+    max_frontier, pops = 1, 0
+    while frontier:
+        f, _, node = heappop(frontier)
+        if closed[node]:
+            continue  # stale entry
+        closed[node] = 1
+        pops += 1
+        if node == goal:
+            return _path(parent, goal), best_g[goal], pops, max_frontier
+        g = best_g[node]
+        for k in range(offsets[node], offsets[node + 1]):
+            nb = targets[k]
+            g2 = g + weights[k]
+            if g2 < best_g[nb]:
+                best_g[nb] = g2
+                parent[nb] = node
+                closed[nb] = 0  # reopen (inconsistent heuristic)
+                counter += 1
+                heappush(frontier, (g2 + est(nb), counter, nb))
+        max_frontier = max(max_frontier, len(frontier))
+    return None, math.inf, pops, max_frontier
+
+# Demo
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from algorithmus import G, h_km, start, goal, dfs_graph, bfs_graph, astar_graph
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    roads = load_csv(os.path.join(here, "staedte_km.csv"))
+    assert {n: set(roads[n]) for n in roads} == G  # same map as G, now with distances
+    s, t = roads.ids[start], roads.ids[goal]
+
+    print("Cities with road distances (staedte_km.csv):")
+    print("  dfs_graph on RoadGraph:", " → ".join(dfs_graph(start, goal, roads)[0]))
+    print("  bfs_graph on RoadGraph:", " → ".join(bfs_graph(start, goal, roads)[0]))
+    path, cost, pops, max_f = astar(roads, s, t)
+    print(f"  Dijkstra (h = 0):  {' → '.join(roads.path_names(path))}, {cost:.0f} km, pops {pops}")
+    path, cost, pops, max_f = astar(roads, s, t, lambda i: h_km[roads.names[i]])
+    print(f"  A* with h_km:      {' → '.join(roads.path_names(path))}, {cost:.0f} km, pops {pops}")
+    path, pops, max_f = astar_graph(start, goal, h_km, roads, roads.cost)
+    print(f"  astar_graph(cost=roads.cost): {' → '.join(path)}, pops {pops}")
+    # is h_km admissible now? compare with the true distance to the goal
+    true = {n: astar(roads, roads.ids[n], t)[1] for n in roads}
+    over = [n for n in roads if h_km[n] > true[n]]
+    print("  h_km overestimates at:", ", ".join(f"{n} ({h_km[n]} > {true[n]:.0f})" for n in over) or "nowhere")
+
+    # Synthetic "nationwide" map
+    side = 500
+    t0 = time.perf_counter()
+    big, coords = synthetic_map(side)
+    t1 = time.perf_counter()
+    path = os.path.join(tempfile.gettempdir(), "roads.csrg")
+    big.save(path)
+    t2 = time.perf_counter()
+    mapped = RoadGraph.load(path)
+    t3 = time.perf_counter()
+    print(f"\n{len(big)} nodes, {big.edge_count} directed edges: build {t1 - t0:.1f}s, "
+          f"save {t2 - t1:.2f}s, mmap load {t3 - t2:.2f}s")
+    s, t = mapped.ids["N0"], mapped.ids[f"N{side * side - 1}"]
+    goal_pt = coords[t]
+    for label, h in (("Dijkstra", None), ("A* (air distance)", lambda i: math.dist(coords[i], goal_pt))):
+        t0 = time.perf_counter()
+        route, cost, pops, max_f = astar(mapped, s, t, h)
+        print(f"  {label:18s}: {len(route)} nodes on path, cost {cost:.1f}, pops {pops}, "
+              f"max frontier {max_f}, {time.perf_counter() - t0:.2f}s")
@@ -0,0 +1,394 @@
+import math
+import os
+import tempfile
+from array import array
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heappop
+
+from road_graph import RoadGraph, astar, dfs, bfs
+from landmarks import Landmarks, bidirectional
+
+# Batch route queries: many (start, goal, algorithm) requests against one map
+#
+# RouteService answers requests by city name and returns (path, cost) per
+# request, in request order:
+#   - requests with the same algorithm and start share one search tree: DFS,
+#     BFS and Dijkstra run one-to-many from the start until all requested
+#     goals are popped (parents do not depend on the goal, so the paths are
+#     the same as with single queries);
+#   - A* ("astar", ALT heuristic if landmarks are given) and "bidirectional"
+#     are goal-specific and run once per pair; on directed maps (directed=True
+#     or directed landmarks) the backward search runs on graph.reversed();
+#   - answers go into an LRU cache (key: algorithm, start, goal);
+#   - with workers > 0 the searches of a batch run in a process pool; the
+#     workers memory-map the saved graph (reversed graph, landmark) files
+#     instead of receiving the graph by pickle.
+#
+#   service = RouteService(load_csv("staedte_km.csv"))
+#   service.batch([("Würzburg", "München", "astar"), ("Würzburg", "Kassel", "bfs")])
+
+ALGORITHMS = ("dfs", "bfs", "dijkstra", "astar", "bidirectional")
+SHARED = ("dfs", "bfs", "dijkstra")  # goal-independent search trees
+
+class RouteCache:
+    """Query results with at most maxsize entries; the least recently used one is dropped."""
+
+    def __init__(self, maxsize=100000):
+        self.entries = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.entries)
+
+def path_cost(graph, edge, path):
+    """Cost of a path from search_tree: the weights of the edges the search actually took."""
+    if path is None:
+        return math.inf
+    total = 0.0
+    for v in path[1:]:
+        total += graph.weights[edge[v]]
+    return total
+
+def _chain(parent, goal):
+    path = [goal]
+    while parent[path[-1]] >= 0:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+def search_tree(graph, source, goals, algorithm):
+    """
+    One-to-many DFS / BFS / Dijkstra from source, stopped as soon as every
+    node in goals has been popped. Same expansion order as dfs, bfs and
+    astar(h=None) in road_graph.py. edge[v] is the CSR index of the edge
+    parent[v] -> v (parallel edges may have different costs).
+    Returns (parent array, edge array, set of reached goals, pops, max frontier size).
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    remaining = set(goals)
+    reached = set()
+    parent = array("i", [-1]) * len(graph)
+    edge = array("q", [-1]) * len(graph)
+    pops = 0
+    if algorithm == "dijkstra":
+        best_g = array("d", [math.inf]) * len(graph)
+        closed = bytearray(len(graph))
+        best_g[source] = 0.0
+        counter = 0
+        frontier = [(0.0, counter, source)]
+        max_frontier = 1
+        while frontier and remaining:
+            g, _, node = heappop(frontier)
+            if closed[node]:
+                continue
+            closed[node] = 1
+            pops += 1
+            if node in remaining:
+                remaining.discard(node); reached.add(node)
+            for k in range(offsets[node], offsets[node + 1]):
+                nb = targets[k]
+                g2 = g + weights[k]
+                if g2 < best_g[nb]:
+                    best_g[nb] = g2
+                    parent[nb] = node
+                    edge[nb] = k
+                    counter += 1
+                    heappush(frontier, (g2, counter, nb))
+            max_frontier = max(max_frontier, len(frontier))
+        return parent, edge, reached, pops, max_frontier
+    seen = bytearray(len(graph))
+    seen[source] = 1
+    if algorithm == "bfs":
+        frontier, take = deque([source]), deque.popleft
+        order = lambda node: range(offsets[node], offsets[node + 1])
+    elif algorithm == "dfs":
+        frontier, take = [source], list.pop
+        order = lambda node: range(offsets[node + 1] - 1, offsets[node] - 1, -1)
+    else:
+        raise ValueError(f"no search tree for {algorithm!r} (allowed: {', '.join(SHARED)})")
+    max_frontier = 1
+    while frontier and remaining:
+        node = take(frontier)
+        pops += 1
+        if node in remaining:
+            remaining.discard(node); reached.add(node)
+        for k in order(node):
+            nb = targets[k]
+            if not seen[nb]:
+                seen[nb] = 1
+                parent[nb] = node
+                edge[nb] = k
+                frontier.append(nb)
+        max_frontier = max(max_frontier, len(frontier))
+    return parent, edge, reached, pops, max_frontier
+
+def solve(graph, landmarks, algorithm, source, goals, reverse=None):
+    """
+    All goals for one (algorithm, source). reverse: reversed graph for the
+    backward half of "bidirectional" on directed maps.
+    Returns ([(path, cost), ...], pops).
+    """
+    if algorithm in SHARED:
+        parent, edge, reached, pops, _ = search_tree(graph, source, goals, algorithm)
+        answers = []
+        for t in goals:
+            path = _chain(parent, t) if t in reached else None
+            answers.append((path, path_cost(graph, edge, path)))
+        return answers, pops
+    answers, pops = [], 0
+    for t in goals:
+        if algorithm == "astar":
+            h = landmarks.to_target(t, source) if landmarks is not None else None
+            path, cost, n, _ = astar(graph, source, t, h)
+        elif algorithm == "bidirectional":
+            path, cost, n, _ = bidirectional(graph, source, t, landmarks, reverse)
+        else:
+            raise ValueError(f"unknown algorithm {algorithm!r} (allowed: {', '.join(ALGORITHMS)})")
+        answers.append((path, cost))
+        pops += n
+    return answers, pops
+
+# process pool: each worker maps the saved files once
+
+_worker = None  # (graph, landmarks, reversed graph) in the worker
+
+def _init_worker(graph_path, landmark_path, reverse_path):
+    global _worker
+    graph = RoadGraph.load(graph_path)
+    _worker = (graph, Landmarks.load(landmark_path, graph) if landmark_path else None,
+               RoadGraph.load(reverse_path) if reverse_path else None)
+
+def _run(task):
+    graph, landmarks, reverse = _worker
+    return solve(graph, landmarks, *task, reverse=reverse)
+
+class RouteService:
+    def __init__(self, graph, landmarks=None, cache_size=100000, workers=0, share=True, directed=False):
+        """
+        workers: processes for batch() (0 = serial, None = all cores).
+        share: False runs every request on its own (no shared search trees).
+        directed: the map has one-way edges (implied by directed landmarks);
+        "bidirectional" then searches backwards on graph.reversed().
+        """
+        self.graph = graph
+        self.landmarks = landmarks
+        directed = directed or (landmarks is not None and landmarks.directed)
+        self.reverse = graph.reversed() if directed else None
+        self.cache = RouteCache(cache_size)
+        self.workers = workers
+        self.share = share
+        self.stats = Counter()   # requests, searches, pops
+        self._pool = None
+        self._files = []
+
+    def _ids(self, name):
+        try:
+            return self.graph.ids[name]
+        except KeyError:
+            raise KeyError(f"unknown city {name!r}") from None
+
+    def query(self, start, goal, algorithm="astar"):
+        return self.batch([(start, goal, algorithm)])[0]
+
+    def batch(self, requests):
+        """requests: iterable of (start, goal, algorithm). Returns [(path of names, cost), ...]."""
+        keys = []
+        found = {}              # answers of this batch (the cache may evict them again)
+        groups = OrderedDict()  # (algorithm, source) -> goals still to search
+        for start, goal, algorithm in requests:
+            if algorithm not in ALGORITHMS:
+                raise ValueError(f"unknown algorithm {algorithm!r} (allowed: {', '.join(ALGORITHMS)})")
+            key = (algorithm, self._ids(start), self._ids(goal))
+            keys.append(key)
+            if key in found:
+                continue
+            answer = self.cache.get(key)
+            if answer is None:
+                groups.setdefault(key[:2], {})[key[2]] = None  # dict as ordered set
+            else:
+                found[key] = answer
+        tasks = []
+        for (algorithm, source), goals in groups.items():
+            if self.share or algorithm not in SHARED:
+                tasks.append((algorithm, source, list(goals)))
+            else:
+                tasks.extend((algorithm, source, [t]) for t in goals)
+        for (algorithm, source, goals), (answers, pops) in zip(tasks, self._map(tasks)):
+            for t, (path, cost) in zip(goals, answers):
+                answer = (None if path is None else tuple(path), cost)
+                found[(algorithm, source, t)] = answer
+                self.cache.put((algorithm, source, t), answer)
+            self.stats["searches"] += 1
+            self.stats["pops"] += pops
+        self.stats["requests"] += len(keys)
+        names = self.graph.names
+        results = []
+        for key in keys:
+            path, cost = found[key]
+            results.append((None if path is None else [names[i] for i in path], cost))
+        return results
+
+    def _map(self, tasks):
+        if self.workers == 0 or len(tasks) < 2:
+            return [solve(self.graph, self.landmarks, *task, reverse=self.reverse) for task in tasks]
+        if self._pool is None:
+            self._start_pool()
+        return self._pool.map(_run, tasks, chunksize=max(1, len(tasks) // (4 * self._pool_size)))
+
+    def _start_pool(self):
+        # graph, reversed graph and landmarks once to disk, the workers memory-map them
+        folder = tempfile.mkdtemp(prefix="routes-")
+        graph_path = os.path.join(folder, "graph.csrg")
+        self.graph.save(graph_path)
+        self._files = [graph_path]
+        reverse_path = None
+        if self.reverse is not None:
+            reverse_path = os.path.join(folder, "graph.rev.csrg")
+            self.reverse.save(reverse_path)
+            self._files.append(reverse_path)
+        landmark_path = None
+        if self.landmarks is not None:
+            landmark_path = os.path.join(folder, "graph.alt")
+            self.landmarks.save(landmark_path)
+            self._files.append(landmark_path)
+        self._pool_size = self.workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(self._pool_size, initializer=_init_worker,
+                                         initargs=(graph_path, landmark_path, reverse_path))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for path in self._files:
+            os.remove(path)
+        if self._files:
+            os.rmdir(os.path.dirname(self._files[0]))
+        self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Benchmark
+
+def benchmark(graph, pairs, engines):
+    """
+    engines: name -> function(graph, s, t) returning (path, ..., pops, max frontier)
+    like road_graph.dfs / bfs / astar. Returns one dict per engine with
+    queries per second, pops per query and the peak frontier size.
+    """
+    import time
+    rows = []
+    for name, run in engines.items():
+        pops, peak = 0, 0
+        t0 = time.perf_counter()
+        for s, t in pairs:
+            result = run(graph, s, t)
+            pops += result[-2]
+            peak = max(peak, result[-1])
+        elapsed = time.perf_counter() - t0
+        rows.append({"algorithm": name, "qps": len(pairs) / elapsed,
+                     "pops": pops / len(pairs), "peak_frontier": peak})
+    return rows
+
+def grid_graph(n):
+    """n x n grid with unit step costs (as the grid in algorithmus.py), nodes named "row,col"."""
+    from road_graph import from_edges
+    def edges():
+        for r in range(n):
+            for c in range(n):
+                if c + 1 < n: yield f"{r},{c}", f"{r},{c + 1}", 1
+                if r + 1 < n: yield f"{r},{c}", f"{r + 1},{c}", 1
+    return from_edges(edges())
+
+# Demo
+
+if __name__ == "__main__":
+    import random
+    import time
+    from road_graph import load_csv, from_edges, synthetic_map
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    roads = load_csv(os.path.join(here, "staedte_km.csv"))
+    with RouteService(roads, Landmarks.build(roads, k=3)) as service:
+        requests = [("Würzburg", "München", alg) for alg in ALGORITHMS] + [("Würzburg", "Kassel", "bfs")]
+        for (start, goal, alg), (path, cost) in zip(requests, service.batch(requests)):
+            print(f"{alg:13s} {start} → {goal}: {' → '.join(path)} ({cost:.0f} km)")
+        print("searches:", service.stats["searches"], "for", service.stats["requests"], "requests")
+
+    # parallel edges: the cost is that of the edge the search took, not the first one in the CSR
+    multi = from_edges([("a", "b", 10), ("a", "b", 1), ("b", "c", 2)])
+    with RouteService(multi) as service:
+        answers = service.batch([("a", "c", alg) for alg in ("dijkstra", "astar", "bidirectional")])
+        assert [cost for _, cost in answers] == [3.0] * 3
+
+    # one-way streets: bidirectional searches backwards on the reversed graph
+    rng = random.Random(5)
+    one_way = from_edges([(f"v{rng.randrange(300)}", f"v{rng.randrange(300)}", rng.randint(1, 20))
+                          for _ in range(1200)], directed=True)
+    pairs = [(rng.choice(one_way.names), rng.choice(one_way.names)) for _ in range(60)]
+    expected = [cost for _, cost in RouteService(one_way).batch([(s, t, "dijkstra") for s, t in pairs])]
+    for kwargs in ({"directed": True}, {"landmarks": Landmarks.build(one_way, k=4, directed=True)},
+                   {"directed": True, "workers": 2}):
+        with RouteService(one_way, **kwargs) as service:
+            for alg in ("astar", "bidirectional"):
+                assert [cost for _, cost in service.batch([(s, t, alg) for s, t in pairs])] == expected, (alg, kwargs)
+
+    rng = random.Random(3)
+    maps = [("grid 150x150", grid_graph(150)), ("road map 200x200", synthetic_map(200)[0])]
+    for label, graph in maps:
+        lm = Landmarks.build(graph, k=8)
+        pairs = [(rng.randrange(len(graph)), rng.randrange(len(graph))) for _ in range(50)]
+        print(f"\n{label}: {len(graph)} nodes, 50 random queries")
+        engines = {
+            "DFS": dfs,
+            "BFS": bfs,
+            "A* (h = 0)": astar,
+            "A* ALT": lambda g, s, t: astar(g, s, t, lm.to_target(t, s)),
+        }
+        for row in benchmark(graph, pairs, engines):
+            print(f"  {row['algorithm']:10s}: {row['qps']:8.1f} queries/s, {row['pops']:8.0f} pops/query, "
+                  f"peak frontier {row['peak_frontier']}")
+
+    # many-to-many on the road map: 10 depots x 40 customers
+    graph = maps[1][1]
+    names = graph.names
+    depots = rng.sample(names, 10)
+    customers = rng.sample(names, 40)
+    requests = [(d, c, "dijkstra") for d in depots for c in customers]
+    print(f"\n{len(requests)} Dijkstra requests (10 starts x 40 goals) on {len(graph)} nodes:")
+    reference = None
+    for label, kwargs in (("one search per request", {"share": False}),
+                          ("shared search trees", {}),
+                          ("shared trees, 2 processes", {"workers": 2})):
+        with RouteService(graph, **kwargs) as service:
+            t0 = time.perf_counter()
+            results = service.batch(requests)
+            t1 = time.perf_counter()
+            service.batch(requests)  # second time from the cache
+            t2 = time.perf_counter()
+        reference = reference or results
+        assert [c for _, c in results] == [c for _, c in reference]
+        print(f"  {label:26s}: {len(requests) / (t1 - t0):8.1f} queries/s "
+              f"({service.stats['searches']} searches, "
+              f"{service.stats['pops'] / len(requests):.0f} pops/request), "
+              f"cached: {len(requests) / (t2 - t1):,.0f} queries/s")
+    print(f"  ({os.cpu_count()} CPU core(s) available)")
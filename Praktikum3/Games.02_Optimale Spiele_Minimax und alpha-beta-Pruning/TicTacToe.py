@@ -50,8 +50,10 @@ def successors_left_to_right(board, player):
             moves.append((i, nb))
     return moves
 
+STATIC_ORDER = [4, 0, 2, 6, 8, 1, 3, 5, 7]  # Mitte, Ecken, Kanten
+
 def successors_ordered(board, player):
-    order = [4, 0, 2, 6, 8, 1, 3, 5, 7]  # Mitte, Ecken, Kanten
+    order = STATIC_ORDER
     moves = []
     for i in order:
         if board[i] == '':
@@ -60,8 +62,10 @@ def successors_ordered(board, player):
             moves.append((i, nb))
     return moves
 
-def successors(board, player):
-    return successors_ordered(board, player) if USE_ORDERED_SUCCESSORS else successors_left_to_right(board, player)
+def successors(board, player, ordered=None):
+    # ordered=None: globale Einstellung USE_ORDERED_SUCCESSORS
+    if ordered is None: ordered = USE_ORDERED_SUCCESSORS
+    return successors_ordered(board, player) if ordered else successors_left_to_right(board, player)
 
 # 1) Minimax
 
@@ -79,7 +83,11 @@ def min_value(board):
         v = min(v, max_value(s))
     return v
 
-def minimax(board):
+def minimax(board, tablebase=None):
+    # tablebase: optionale endgame.EndgameTable – dann nur nachschlagen, nicht suchen
+    if tablebase is not None:
+        hit = tablebase.lookup(board)
+        if hit is not None and hit[0] is not None: return hit
     best_val = -math.inf
     best_action = None
     for a, s in successors(board, 'X'):
@@ -108,7 +116,14 @@ def min_value_ab(board, alpha, beta):
         beta = min(beta, v)
     return v
 
-def alphabeta(board):
+def alphabeta(board, ordering=None, tablebase=None):
+    # ordering: siehe alphabeta_with_count (None = Vorlesungsvariante mit globaler Reihenfolge)
+    # tablebase: optionale endgame.EndgameTable wie bei minimax
+    if tablebase is not None:
+        hit = tablebase.lookup(board)
+        if hit is not None and hit[0] is not None: return hit
+    if ordering is not None:
+        return alphabeta_with_count(board, ordering=ordering)[:2]
     best_val = -math.inf
     best_action = None
     alpha, beta = -math.inf, math.inf
@@ -119,25 +134,158 @@ def alphabeta(board):
         alpha = max(alpha, v)
     return best_action, best_val
 
+# Transpositionstabelle mit Symmetrien
+#
+# Gleiche Stellungen (andere Zugreihenfolge) und ihre 8 Drehungen/Spiegelungen
+# werden nur einmal durchsucht. Schlüssel: kleinste symmetrische Variante des
+# Bretts plus Spieler am Zug. Bei Alpha-Beta ist ein Wert nur eine Schranke,
+# wenn die Suche abgeschnitten wurde (Flag LOWER/UPPER), sonst EXACT.
+
+def _rotate(perm):
+    # 90° im Uhrzeigersinn: neues Feld i kommt von altem Feld perm[j]
+    return tuple(perm[j] for j in (6, 3, 0, 7, 4, 1, 8, 5, 2))
+
+def _mirror(perm):
+    return tuple(perm[j] for j in (2, 1, 0, 5, 4, 3, 8, 7, 6))
+
+def _symmetries():
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms += [perm, _mirror(perm)]
+        perm = _rotate(perm)
+    return perms
+
+SYMMETRIES = _symmetries()  # symmetrisches Brett[i] = board[perm[i]]
+
+def canonical(board):
+    """Kleinste der 8 symmetrischen Varianten (als Tupel) und die Permutation dazu."""
+    return min((tuple(board[j] for j in perm), perm) for perm in SYMMETRIES)
+
+_DIGIT = {'': 0, 'X': 1, 'O': 2}
+
+def board_index(cells):
+    """Stellung als Zahl zur Basis 3 (Feld i = Ziffer i, '' = 0, X = 1, O = 2)."""
+    index = 0
+    for c in reversed(cells):
+        index = index * 3 + _DIGIT[c]
+    return index
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+class TranspositionTable:
+    """Speichert (Wert, Flag, bester Zug) pro kanonischer Stellung; zählt Treffer."""
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def key(self, board, player):
+        cells, perm = canonical(board)
+        return (cells, player), perm
+
+    def probe(self, key, alpha, beta):
+        """Rückgabe (Wert oder None, alpha, beta) – ein Wert heißt: Suche nicht nötig."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, alpha, beta
+        value, flag, _ = entry
+        if flag == LOWER:
+            alpha = max(alpha, value)
+        elif flag == UPPER:
+            beta = min(beta, value)
+        if flag == EXACT or alpha >= beta:
+            self.hits += 1
+            return value, alpha, beta
+        return None, alpha, beta
+
+    def store(self, key, perm, value, alpha, beta, move=None):
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        # Zug in kanonischen Koordinaten ablegen
+        self.entries[key] = (value, flag, None if move is None else perm.index(move))
+
+    def best_move(self, key, perm):
+        entry = self.entries.get(key)
+        if entry is None or entry[2] is None:
+            return None
+        return perm[entry[2]]
+
+# Dynamische Zugsortierung (pro Suche, kein globaler Zustand)
+#
+# Reihenfolge: bester Zug aus der Transpositionstabelle, dann Killerzüge
+# (haben auf derselben Tiefe schon einen Cutoff ausgelöst), dann nach
+# History-Wert des Spielers (Summe seiner Cutoffs, gewichtet mit dem Quadrat
+# der Resttiefe), zuletzt statisch Mitte/Ecken/Kanten.
+
+ORDERINGS = ("static", "left_to_right", "dynamic")
+
+class MoveOrdering:
+    def __init__(self, table=None):
+        self.table = table
+        self.killers = {}        # Tiefe (ply) -> bis zu 2 Züge
+        self.history = {'X': [0] * 9, 'O': [0] * 9}  # Spieler -> Bonus je Feld
+
+    def successors(self, board, player, ply, key=None, perm=None):
+        tt_move = self.table.best_move(key, perm) if self.table is not None and key is not None else None
+        killers = self.killers.get(ply, ())
+        history = self.history[player]
+        moves = [i for i in STATIC_ORDER if board[i] == '']
+        moves.sort(key=lambda i: (i != tt_move, i not in killers, -history[i]))  # stabil: sonst statisch
+        result = []
+        for i in moves:
+            nb = board.copy()
+            nb[i] = player
+            result.append((i, nb))
+        return result
+
+    def cutoff(self, move, ply, board, player):
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        remaining = board.count('')
+        self.history[player][move] += remaining * remaining
+
 # Zählvarianten für Aufgabe 3
 
-def minimax_with_count(board):
+def minimax_with_count(board, table=None):
+    # table: optionale TranspositionTable (Treffer stehen danach in table.hits)
     nodes = 0
     def MAX(b):
         nonlocal nodes
         nodes += 1
         if terminal_test(b): return utility(b)
-        v = -math.inf
-        for _, s in successors(b, 'X'):
-            v = max(v, MIN(s))
+        if table is not None:
+            key, perm = table.key(b, 'X')
+            hit, _, _ = table.probe(key, -math.inf, math.inf)
+            if hit is not None: return hit
+        v, best = -math.inf, None
+        for a, s in successors(b, 'X'):
+            w = MIN(s)
+            if w > v: v, best = w, a
+        if table is not None: table.store(key, perm, v, -math.inf, math.inf, best)
         return v
     def MIN(b):
         nonlocal nodes
         nodes += 1
         if terminal_test(b): return utility(b)
-        v = math.inf
-        for _, s in successors(b, 'O'):
-            v = min(v, MAX(s))
+        if table is not None:
+            key, perm = table.key(b, 'O')
+            hit, _, _ = table.probe(key, -math.inf, math.inf)
+            if hit is not None: return hit
+        v, best = math.inf, None
+        for a, s in successors(b, 'O'):
+            w = MAX(s)
+            if w < v: v, best = w, a
+        if table is not None: table.store(key, perm, v, -math.inf, math.inf, best)
         return v
     best_val = -math.inf
     best_action = None
@@ -147,38 +295,78 @@ def minimax_with_count(board):
             best_val, best_action = v, a
     return best_action, best_val, nodes
 
-def alphabeta_with_count(board):
+def alphabeta_with_count(board, table=None, ordering=None):
+    # table: optionale TranspositionTable (Treffer stehen danach in table.hits)
+    # ordering: None (globale Einstellung USE_ORDERED_SUCCESSORS), "static",
+    #           "left_to_right" oder "dynamic" (TT-Zug, Killerzüge, History)
+    if ordering is not None and ordering not in ORDERINGS:
+        raise ValueError(f"Unbekannte Zugsortierung: {ordering!r} (erlaubt: {ORDERINGS})")
+    dynamic = MoveOrdering(table) if ordering == "dynamic" else None
+    ordered = None if ordering is None else ordering != "left_to_right"
+    def children(b, player, ply, key=None, perm=None):
+        if dynamic is None: return successors(b, player, ordered)
+        return dynamic.successors(b, player, ply, key, perm)
     nodes = 0
-    def MAX(b, alpha, beta):
+    def MAX(b, alpha, beta, ply):
         nonlocal nodes
         nodes += 1
         if terminal_test(b): return utility(b)
-        v = -math.inf
-        for _, s in successors(b, 'X'):
-            v = max(v, MIN(s, alpha, beta))
-            if v >= beta: return v
+        key = perm = None
+        if table is not None:
+            key, perm = table.key(b, 'X')
+            hit, alpha, beta = table.probe(key, alpha, beta)
+            if hit is not None: return hit
+            window = (alpha, beta)
+        v, best = -math.inf, None
+        for a, s in children(b, 'X', ply, key, perm):
+            w = MIN(s, alpha, beta, ply + 1)
+            if w > v: v, best = w, a
+            if v >= beta:
+                if dynamic is not None: dynamic.cutoff(a, ply, b, 'X')
+                break
             alpha = max(alpha, v)
+        if table is not None: table.store(key, perm, v, *window, best)
         return v
-    def MIN(b, alpha, beta):
+    def MIN(b, alpha, beta, ply):
         nonlocal nodes
         nodes += 1
         if terminal_test(b): return utility(b)
-        v = math.inf
-        for _, s in successors(b, 'O'):
-            v = min(v, MAX(s, alpha, beta))
-            if v <= alpha: return v
+        key = perm = None
+        if table is not None:
+            key, perm = table.key(b, 'O')
+            hit, alpha, beta = table.probe(key, alpha, beta)
+            if hit is not None: return hit
+            window = (alpha, beta)
+        v, best = math.inf, None
+        for a, s in children(b, 'O', ply, key, perm):
+            w = MAX(s, alpha, beta, ply + 1)
+            if w < v: v, best = w, a
+            if v <= alpha:
+                if dynamic is not None: dynamic.cutoff(a, ply, b, 'O')
+                break
             beta = min(beta, v)
+        if table is not None: table.store(key, perm, v, *window, best)
         return v
     best_val = -math.inf
     best_action = None
     alpha, beta = -math.inf, math.inf
-    for a, s in successors(board, 'X'):
-        v = MIN(s, alpha, beta)
+    root_key = root_perm = None
+    if table is not None: root_key, root_perm = table.key(board, 'X')
+    for a, s in children(board, 'X', 0, root_key, root_perm):
+        v = MIN(s, alpha, beta, 1)
         if v > best_val:
             best_val, best_action = v, a
         alpha = max(alpha, v)
     return best_action, best_val, nodes
 
+def compare_orderings(board, with_table=False):
+    """Knoten von alphabeta_with_count je Zugsortierung (optional jeweils mit frischer TT)."""
+    result = {}
+    for ordering in ORDERINGS:
+        table = TranspositionTable() if with_table else None
+        result[ordering] = alphabeta_with_count(board, table, ordering)[2]
+    return result
+
 # Demo
 
 if __name__ == "__main__":
@@ -201,6 +389,17 @@ if __name__ == "__main__":
     print("Minimax:   move =", m_move, "value =", m_val, "nodes =", m_nodes)
     print("AlphaBeta: move =", a_move, "value =", a_val, "nodes =", a_nodes)
 
+    # Mit Transpositionstabelle (Symmetrien zusammengefasst)
+    m_tt, a_tt = TranspositionTable(), TranspositionTable()
+    mt_move, mt_val, mt_nodes = minimax_with_count(board, m_tt)
+    at_move, at_val, at_nodes = alphabeta_with_count(board, a_tt)
+    print("Minimax   + TT: move =", mt_move, "value =", mt_val, "nodes =", mt_nodes, "hits =", m_tt.hits)
+    print("AlphaBeta + TT: move =", at_move, "value =", at_val, "nodes =", at_nodes, "hits =", a_tt.hits)
+
+    # Zugsortierung im Vergleich (ohne und mit Transpositionstabelle)
+    print("\nKnoten je Zugsortierung:       ", compare_orderings(board))
+    print("Knoten je Zugsortierung + TT:  ", compare_orderings(board, with_table=True))
+
     # Beispielposition zum Test
     mid = [
         'X','O','X',
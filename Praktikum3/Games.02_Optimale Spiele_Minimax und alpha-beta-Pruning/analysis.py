@@ -0,0 +1,131 @@
+# Stapelanalyse vieler Stellungen mit dauerhaftem Such-Cache
+#
+# analyze_stream / analyze_batch bewerten beliebig viele Bretter nacheinander
+# und teilen sich dabei einen SearchCache: eine Transpositionstabelle mit
+# Größenbegrenzung (LRU), die über Aufrufe hinweg bestehen bleibt und auf
+# Platte gespeichert werden kann. Die Wurzelergebnisse landen als exakte
+# Einträge ebenfalls im Cache – symmetrische oder wiederholte Stellungen
+# werden so nur einmal gesucht (Knoten = 0 bei einem Treffer).
+
+import math
+import os
+import pickle
+from collections import OrderedDict
+
+from TicTacToe import (TranspositionTable, EXACT, terminal_test, utility,
+                       minimax_with_count, alphabeta_with_count)
+
+ALGORITHMS = {
+    "alphabeta": alphabeta_with_count,
+    "minimax": minimax_with_count,
+}
+
+class SearchCache(TranspositionTable):
+    """TranspositionTable mit höchstens maxsize Einträgen; der am längsten unbenutzte fliegt raus."""
+
+    def __init__(self, maxsize=100000):
+        super().__init__()
+        self.entries = OrderedDict()
+        self.maxsize = maxsize
+
+    def probe(self, key, alpha, beta):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        return super().probe(key, alpha, beta)
+
+    def store(self, key, perm, value, alpha, beta, move=None):
+        super().store(key, perm, value, alpha, beta, move)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def save(self, path):
+        # erst in eine Hilfsdatei, dann umbenennen – ein Abbruch hinterlässt keine halbe Datei
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((self.maxsize, list(self.entries.items())), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, maxsize=None):
+        """Cache aus save() laden; fehlt die Datei, gibt es einen leeren Cache."""
+        if not os.path.exists(path):
+            return cls(maxsize or 100000)
+        with open(path, "rb") as f:
+            saved_size, items = pickle.load(f)
+        cache = cls(maxsize or saved_size)
+        for key, entry in items[-cache.maxsize:]:
+            cache.entries[key] = entry
+        return cache
+
+def _swap(board):
+    return ['O' if c == 'X' else 'X' if c == 'O' else '' for c in board]
+
+def analyze(board, cache, algorithm="alphabeta"):
+    """
+    Eine Stellung bewerten. Rückgabe: (Zug, Wert, Knoten); Wert aus Sicht von X.
+    Ist O am Zug, wird mit vertauschten Farben gesucht und der Wert negiert.
+    Endstellungen: (None, utility, 0).
+    """
+    if terminal_test(board):
+        return None, utility(board), 0
+    sign = 1
+    if board.count('X') != board.count('O'):
+        board, sign = _swap(board), -1
+    key, perm = cache.key(board, 'X')
+    entry = cache.entries.get(key)
+    if entry is not None and entry[1] == EXACT and entry[2] is not None:
+        cache.probe(key, -math.inf, math.inf)  # Treffer zählen, LRU auffrischen
+        return perm[entry[2]], sign * entry[0], 0
+    move, value, nodes = ALGORITHMS[algorithm](board, cache)
+    cache.store(key, perm, value, -math.inf, math.inf, move)
+    return move, sign * value, nodes
+
+def analyze_stream(boards, cache=None, algorithm="alphabeta"):
+    """Generator: für jedes Brett aus boards (beliebiges Iterable) ein Ergebnis wie analyze()."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unbekannter Algorithmus: {algorithm!r} (erlaubt: {sorted(ALGORITHMS)})")
+    cache = SearchCache() if cache is None else cache
+    for board in boards:
+        yield analyze(board, cache, algorithm)
+
+def analyze_batch(boards, cache=None, algorithm="alphabeta"):
+    return list(analyze_stream(boards, cache, algorithm))
+
+# Demo
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+    from TicTacToe import SYMMETRIES
+
+    rng = random.Random(7)
+    boards = []
+    while len(boards) < 500:
+        b = [''] * 9
+        for k in range(rng.randrange(0, 5)):
+            b[rng.choice([i for i in range(9) if not b[i]])] = 'XO'[k % 2]
+        if not terminal_test(b):
+            perm = rng.choice(SYMMETRIES)  # symmetrische Varianten -> Treffer
+            boards.append([b[j] for j in perm])
+
+    t0 = time.perf_counter()
+    single = [alphabeta_with_count(b if b.count('X') == b.count('O') else _swap(b)) for b in boards]
+    t1 = time.perf_counter()
+    cache = SearchCache(maxsize=20000)
+    results = analyze_batch(boards, cache)
+    t2 = time.perf_counter()
+    assert [v for _, v, _ in results] == [(1 if b.count('X') == b.count('O') else -1) * s[1]
+                                         for b, s in zip(boards, single)]
+    print(f"{len(boards)} Stellungen einzeln:  {sum(s[2] for s in single)} Knoten, {t1 - t0:.3f}s")
+    print(f"{len(boards)} Stellungen im Stapel: {sum(r[2] for r in results)} Knoten, {t2 - t1:.3f}s, "
+          f"{len(cache)} Cache-Einträge, {cache.hits} Treffer")
+
+    path = os.path.join(tempfile.gettempdir(), "tictactoe_cache.pkl")
+    cache.save(path)
+    warm = SearchCache.load(path)
+    t0 = time.perf_counter()
+    again = analyze_batch(boards, warm)
+    print(f"nach Neustart (Cache geladen): {sum(r[2] for r in again)} Knoten, "
+          f"{time.perf_counter() - t0:.3f}s")
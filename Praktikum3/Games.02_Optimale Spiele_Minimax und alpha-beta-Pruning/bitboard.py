@@ -0,0 +1,162 @@
+# Tic Tac Toe auf Bitboards – Minimax und Alpha-Beta ohne Listen-Kopien
+#
+# Ein Zustand sind zwei 9-Bit-Zahlen: Bit i von x (bzw. o) ist gesetzt, wenn
+# auf Feld i ein X (bzw. O) steht. Ein Zug ist x | bit, Zurücknehmen passiert
+# durch Rückkehr aus der Rekursion; es wird kein Brett kopiert.
+
+import math
+
+import TicTacToe
+from TicTacToe import print_board
+
+FULL = (1 << 9) - 1
+
+LINES = [
+    (0,1,2),(3,4,5),(6,7,8),
+    (0,3,6),(1,4,7),(2,5,8),
+    (0,4,8),(2,4,6)
+]
+WIN_MASKS = [sum(1 << i for i in line) for line in LINES]
+
+# WINS[bits] ist True, wenn die Felder in bits eine Reihe enthalten (Nachschlagen statt 8 Vergleiche)
+WINS = [any(bits & m == m for m in WIN_MASKS) for bits in range(1 << 9)]
+
+ORDERED = [4, 0, 2, 6, 8, 1, 3, 5, 7]  # Mitte, Ecken, Kanten
+LEFT_TO_RIGHT = list(range(9))
+
+# Umwandlung zum Listenformat aus TicTacToe.py
+
+def from_list(board):
+    x = sum(1 << i for i, c in enumerate(board) if c == 'X')
+    o = sum(1 << i for i, c in enumerate(board) if c == 'O')
+    return x, o
+
+def to_list(x, o):
+    return ['X' if x >> i & 1 else 'O' if o >> i & 1 else '' for i in range(9)]
+
+def winner_bits(x, o):
+    if WINS[x]: return 'X'
+    if WINS[o]: return 'O'
+    return None
+
+def _order(ordered):
+    if ordered is None:
+        ordered = TicTacToe.USE_ORDERED_SUCCESSORS  # zur Laufzeit lesen, nicht beim Import kopieren
+    return [(i, 1 << i) for i in (ORDERED if ordered else LEFT_TO_RIGHT)]
+
+# 1) Minimax
+
+def minimax_bits(x, o, ordered=None):
+    """Minimax für X am Zug. Rückgabe: (Zug, Wert, Knoten) wie minimax_with_count."""
+    moves = _order(ordered)
+    nodes = 0
+    def MAX(x, o):
+        nonlocal nodes
+        nodes += 1
+        if WINS[x]: return 1
+        if WINS[o]: return -1
+        occupied = x | o
+        if occupied == FULL: return 0
+        v = -math.inf
+        for _, bit in moves:
+            if not occupied & bit:
+                w = MIN(x | bit, o)
+                if w > v: v = w
+        return v
+    def MIN(x, o):
+        nonlocal nodes
+        nodes += 1
+        if WINS[x]: return 1
+        if WINS[o]: return -1
+        occupied = x | o
+        if occupied == FULL: return 0
+        v = math.inf
+        for _, bit in moves:
+            if not occupied & bit:
+                w = MAX(x, o | bit)
+                if w < v: v = w
+        return v
+    best_val = -math.inf
+    best_action = None
+    for a, bit in moves:
+        if not (x | o) & bit:
+            v = MIN(x | bit, o)
+            if v > best_val:
+                best_val, best_action = v, a
+    return best_action, best_val, nodes
+
+# 2) Alpha-Beta-Pruning
+
+def alphabeta_bits(x, o, ordered=None):
+    """Alpha-Beta für X am Zug. Rückgabe: (Zug, Wert, Knoten) wie alphabeta_with_count."""
+    moves = _order(ordered)
+    nodes = 0
+    def MAX(x, o, alpha, beta):
+        nonlocal nodes
+        nodes += 1
+        if WINS[x]: return 1
+        if WINS[o]: return -1
+        occupied = x | o
+        if occupied == FULL: return 0
+        v = -math.inf
+        for _, bit in moves:
+            if not occupied & bit:
+                w = MIN(x | bit, o, alpha, beta)
+                if w > v:
+                    v = w
+                    if v >= beta: return v
+                    if v > alpha: alpha = v
+        return v
+    def MIN(x, o, alpha, beta):
+        nonlocal nodes
+        nodes += 1
+        if WINS[x]: return 1
+        if WINS[o]: return -1
+        occupied = x | o
+        if occupied == FULL: return 0
+        v = math.inf
+        for _, bit in moves:
+            if not occupied & bit:
+                w = MAX(x, o | bit, alpha, beta)
+                if w < v:
+                    v = w
+                    if v <= alpha: return v
+                    if v < beta: beta = v
+        return v
+    best_val = -math.inf
+    best_action = None
+    alpha, beta = -math.inf, math.inf
+    for a, bit in moves:
+        if not (x | o) & bit:
+            v = MIN(x | bit, o, alpha, beta)
+            if v > best_val:
+                best_val, best_action = v, a
+            alpha = max(alpha, v)
+    return best_action, best_val, nodes
+
+# Demo
+
+if __name__ == "__main__":
+    import time
+    from TicTacToe import minimax_with_count, alphabeta_with_count
+
+    board = [''] * 9
+    mid = [
+        'X','O','X',
+        '','O','',
+        '','',''
+    ]
+    for name, b in (("Startzustand", board), ("Beispielposition", mid)):
+        print(name + ":")
+        print_board(to_list(*from_list(b)))
+        for label, list_fn, bits_fn in (("Minimax:  ", minimax_with_count, minimax_bits),
+                                        ("AlphaBeta:", alphabeta_with_count, alphabeta_bits)):
+            t0 = time.perf_counter()
+            ref = list_fn(b)
+            t1 = time.perf_counter()
+            res = bits_fn(*from_list(b))
+            t2 = time.perf_counter()
+            assert res == ref
+            print(label, "move =", res[0], "value =", res[1], "nodes =", res[2],
+                  f"| Liste {t1 - t0:.3f}s, Bitboard {t2 - t1:.3f}s")
+        print()
@@ -0,0 +1,188 @@
+# Endspieltabelle – Tic Tac Toe einmal komplett lösen, danach nur nachschlagen
+#
+# build_table löst alle erreichbaren Stellungen (3x3: 5478) und schreibt pro
+# Stellung ein Byte mit Wert und bestem Zug in eine Datei. Index ist die
+# Basis-3-Zahl des Bretts ('' = 0, 'X' = 1, 'O' = 2, Feld i hat Gewicht 3^i) –
+# eine perfekte Hashfunktion, jede Stellung hat ihren eigenen Platz.
+# EndgameTable bildet die Datei per mmap in den Speicher ab; ein Nachschlagen
+# ist ein Bytezugriff, unabhängig von der Dateigröße.
+#
+# Dasselbe Format dient für größere m,n,k-Bretter als Endspieldatenbank: dort
+# werden nur Stellungen mit höchstens max_empty freien Feldern gespeichert, und
+# mnk.alphabeta_depth schlägt nach, sobald so wenige Felder frei sind.
+#
+# Datei: 8 Byte Kopf (b"EGTB", m, n, k, max_empty) und 3^(m*n) Einträge.
+# Eintrag: 0 = nicht gespeichert, sonst 1 + Zug*3 + (Wert+1) mit Zug 16 = keiner
+# (Endstellung; 16 ist auf keinem erlaubten Brett ein Feld, höchstens 1+16*3+2 = 51). Wert aus Sicht von X wie utility(), Zug für den Spieler am Zug.
+
+import mmap
+import os
+
+import TicTacToe
+from TicTacToe import board_index
+
+MAGIC = b"EGTB"
+HEADER = 8
+ALL = 255      # max_empty im Kopf: alle Stellungen gespeichert
+MAX_CELLS = 16  # 3^16 Byte = 43 MB; größere Bretter passen nicht in dieses Format
+NO_MOVE = MAX_CELLS  # kein Feldindex, auch nicht auf 4x4
+
+class TicTacToeRules:
+    """Die Regeln aus TicTacToe.py mit derselben Schnittstelle wie mnk.MNKGame."""
+    m = n = k = 3
+    size = 9
+    order = TicTacToe.STATIC_ORDER  # gleiche Reihenfolge wie minimax -> gleicher Zug bei Gleichstand
+
+    def to_move(self, board):
+        return 'X' if board.count('X') == board.count('O') else 'O'
+
+    def terminal_test(self, board):
+        return TicTacToe.terminal_test(board)
+
+    def utility(self, board):
+        return TicTacToe.utility(board)
+
+def solve(game, roots=None):
+    """
+    Alle von roots (Standard: leeres Brett) erreichbaren Stellungen lösen.
+    Rückgabe: Dict Index -> (Zug, Wert, freie Felder).
+    """
+    solved = {}
+
+    def value(board):
+        index = board_index(board)
+        entry = solved.get(index)
+        if entry is not None:
+            return entry[1]
+        empty = board.count('')
+        if game.terminal_test(board):
+            solved[index] = (None, game.utility(board), empty)
+            return solved[index][1]
+        player = game.to_move(board)
+        maximize = player == 'X'
+        best_val, best_action = None, None
+        for i in game.order:
+            if board[i]:
+                continue
+            board[i] = player
+            v = value(board)
+            board[i] = ''
+            if best_val is None or (v > best_val if maximize else v < best_val):
+                best_val, best_action = v, i
+        solved[index] = (best_action, best_val, empty)
+        return best_val
+
+    for root in roots or [[''] * game.size]:
+        value(list(root))
+    return solved
+
+def build_table(path, game=None, max_empty=None, roots=None):
+    """Tabelle lösen und nach path schreiben. Rückgabe: Anzahl gespeicherter Stellungen."""
+    game = game or TicTacToeRules()
+    cells = game.m * game.n
+    if cells > MAX_CELLS:
+        raise ValueError(f"Brett mit {cells} Feldern zu groß (höchstens {MAX_CELLS})")
+    limit = cells if max_empty is None else max_empty
+    data = bytearray(3 ** cells)
+    stored = 0
+    for index, (move, value, empty) in solve(game, roots).items():
+        if empty <= limit:
+            data[index] = 1 + (NO_MOVE if move is None else move) * 3 + value + 1
+            stored += 1
+    with open(path, "wb") as f:
+        f.write(MAGIC + bytes([game.m, game.n, game.k, ALL if max_empty is None else max_empty]))
+        f.write(data)
+    return stored
+
+class EndgameTable:
+    """Liest eine Tabelle aus build_table per mmap (nur lesend, mehrere Prozesse teilen die Seiten)."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mm[:4] != MAGIC:
+            self.mm.close()
+            raise ValueError(f"{path} ist keine Endspieltabelle")
+        self.m, self.n, self.k, max_empty = self.mm[4:HEADER]
+        self.max_empty = self.m * self.n if max_empty == ALL else max_empty
+
+    def lookup(self, board):
+        """(Zug, Wert) oder None, wenn die Stellung nicht gespeichert ist."""
+        if len(board) != self.m * self.n:
+            raise ValueError(f"Brett mit {len(board)} Feldern, Tabelle ist für {self.m}x{self.n}")
+        if board.count('') > self.max_empty:
+            return None
+        code = self.mm[HEADER + board_index(board)]
+        if not code:
+            return None
+        move, value = divmod(code - 1, 3)
+        return (None if move == NO_MOVE else move), value - 1
+
+    def close(self):
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def load_or_build(path, game=None, max_empty=None, roots=None):
+    if not os.path.exists(path):
+        build_table(path, game, max_empty, roots)
+    return EndgameTable(path)
+
+# Demo
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+    from mnk import MNKGame, iterative_deepening
+
+    path = os.path.join(tempfile.gettempdir(), "tictactoe_3x3.egtb")
+    t0 = time.perf_counter()
+    stored = build_table(path)
+    print(f"3x3: {stored} Stellungen gelöst in {time.perf_counter() - t0:.2f}s, "
+          f"Datei {os.path.getsize(path)} Byte")
+
+    mid = [
+        'X','O','X',
+        '','O','',
+        '','',''
+    ]
+    with EndgameTable(path) as table:
+        for b in ([''] * 9, mid):
+            t0 = time.perf_counter()
+            ref = TicTacToe.minimax(b)
+            t1 = time.perf_counter()
+            res = TicTacToe.minimax(b, tablebase=table)
+            t2 = time.perf_counter()
+            assert res == ref
+            print("minimax:", ref, f"{t1 - t0:.4f}s | mit Tabelle:", res, f"{t2 - t1:.6f}s")
+
+    # 4x4x4 als Endspieldatenbank: Stellungen mit höchstens 8 freien Feldern
+    game = MNKGame(4, 4, 4)
+    rng = random.Random(1)
+    board = game.initial()
+    while board.count('') > 10:
+        board[rng.choice([i for i in range(game.size) if not board[i]])] = game.to_move(board)
+    path = os.path.join(tempfile.gettempdir(), "mnk_4x4x4.egtb")
+    t0 = time.perf_counter()
+    stored = build_table(path, game, max_empty=8, roots=[board])
+    print(f"\n4x4x4: {stored} Stellungen mit <= 8 freien Feldern in {time.perf_counter() - t0:.2f}s")
+    game.print_board(board)
+    with EndgameTable(path) as table:
+        # jede gespeicherte Stellung liefert Zug und Wert aus solve() zurück (auch Züge auf Feld >= 9)
+        for index, (move, value, empty) in solve(game, [board]).items():
+            if empty <= 8:
+                cells = []
+                for _ in range(game.size):
+                    index, digit = divmod(index, 3)
+                    cells.append(('', 'X', 'O')[digit])
+                assert table.lookup(cells) == (move, value)
+        for label, tb in (("ohne Tabelle", None), ("mit Tabelle ", table)):
+            t0 = time.perf_counter()
+            move, value, depth, nodes = iterative_deepening(game, board, tablebase=tb)
+            print(f"{label}: Zug {move}, Wert {value}, Tiefe {depth}, {nodes} Knoten, "
+                  f"{time.perf_counter() - t0:.2f}s")
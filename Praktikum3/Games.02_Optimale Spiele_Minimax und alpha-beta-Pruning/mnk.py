@@ -0,0 +1,255 @@
+# m,n,k-Spiele – Tic Tac Toe verallgemeinert
+#
+# Brett mit m Spalten und n Zeilen (Liste der Länge m*n wie in TicTacToe.py,
+# Index = Zeile*m + Spalte); wer zuerst k Steine in einer Reihe hat, gewinnt.
+# Tic Tac Toe ist MNKGame(3, 3, 3), Gomoku etwa MNKGame(15, 15, 5).
+#
+# Für größere Bretter sucht iterative_deepening mit Alpha-Beta bis zu einer
+# Tiefengrenze und bewertet Blätter mit einer Bewertungsfunktion. Mit einem
+# Zeitbudget wird der beste Zug der letzten vollständig durchsuchten Tiefe
+# zurückgegeben.
+
+import math
+import time
+
+WIN = 1  # Nutzen wie utility() in TicTacToe.py: +1 X gewinnt, -1 O gewinnt, 0 unentschieden
+
+class MNKGame:
+    def __init__(self, m=3, n=3, k=3, radius=None):
+        # radius: nur Felder in diesem Abstand zu vorhandenen Steinen als Züge
+        # betrachten (None = alle freien Felder; sinnvoll für große Bretter)
+        self.m, self.n, self.k = m, n, k
+        self.size = m * n
+        self.radius = radius
+        center_r, center_c = (n - 1) / 2, (m - 1) / 2
+        # statische Zugreihenfolge: von der Mitte nach außen (wie successors_ordered)
+        self.order = sorted(range(self.size),
+                            key=lambda i: (max(abs(i // m - center_r), abs(i % m - center_c)),
+                                           abs(i // m - center_r) + abs(i % m - center_c), i))
+        # alle Fenster aus k Feldern in einer Reihe (für Bewertung und Gewinnprüfung)
+        self.lines = []
+        for r in range(n):
+            for c in range(m):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_r, end_c = r + (k - 1) * dr, c + (k - 1) * dc
+                    if 0 <= end_r < n and 0 <= end_c < m:
+                        self.lines.append(tuple((r + j * dr) * m + c + j * dc for j in range(k)))
+
+    def initial(self):
+        return [''] * self.size
+
+    def to_move(self, board):
+        return 'X' if board.count('X') == board.count('O') else 'O'
+
+    def wins_at(self, board, i):
+        """Hat der Stein auf Feld i eine Reihe der Länge k? Nur Richtungen durch i – O(k)."""
+        player = board[i]
+        if not player:
+            return False
+        m, n, k = self.m, self.n, self.k
+        r, c = divmod(i, m)
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            count = 1
+            for sign in (1, -1):
+                rr, cc = r + sign * dr, c + sign * dc
+                while 0 <= rr < n and 0 <= cc < m and board[rr * m + cc] == player:
+                    count += 1
+                    rr, cc = rr + sign * dr, cc + sign * dc
+            if count >= k:
+                return True
+        return False
+
+    def winner(self, board):
+        for line in self.lines:
+            first = board[line[0]]
+            if first and all(board[j] == first for j in line):
+                return first
+        return None
+
+    def terminal_test(self, board):
+        return self.winner(board) is not None or all(board)
+
+    def utility(self, board):
+        w = self.winner(board)
+        if w == 'X': return WIN
+        if w == 'O': return -WIN
+        return 0
+
+    def moves(self, board):
+        empty = [i for i in self.order if not board[i]]
+        if self.radius is None or len(empty) == self.size:
+            return empty
+        m, radius = self.m, self.radius
+        near = []
+        for i in empty:
+            r, c = divmod(i, m)
+            if any(board[rr * m + cc]
+                   for rr in range(max(0, r - radius), min(self.n, r + radius + 1))
+                   for cc in range(max(0, c - radius), min(m, c + radius + 1))):
+                near.append(i)
+        return near or empty
+
+    def print_board(self, board):
+        for r in range(self.n):
+            print(' '.join(x if x else '.' for x in board[r * self.m:(r + 1) * self.m]))
+        print()
+
+# Bewertungsfunktionen: (game, board) -> Wert aus Sicht von X, echt zwischen -1 und 1
+
+def zero_evaluation(game, board):
+    return 0
+
+def line_evaluation(game, board):
+    """Offene Fenster zählen: je mehr eigene Steine in einem Fenster ohne Gegnerstein, desto besser."""
+    score = 0
+    for line in game.lines:
+        x = o = 0
+        for j in line:
+            cell = board[j]
+            if cell == 'X': x += 1
+            elif cell == 'O': o += 1
+        if x and not o: score += 4 ** x
+        elif o and not x: score -= 4 ** o
+    return score / (abs(score) + 4 ** game.k)
+
+# Alpha-Beta mit Tiefengrenze
+
+class _Timeout(Exception):
+    pass
+
+def alphabeta_depth(game, board, depth, evaluate=line_evaluation, deadline=None, first=None, stats=None,
+                    tablebase=None):
+    """
+    Alpha-Beta bis zur Tiefe depth für den Spieler am Zug.
+    Rückgabe: (Zug, Wert). first: Zug, der an der Wurzel zuerst probiert wird.
+    Bei Überschreiten von deadline (time.perf_counter) wird _Timeout ausgelöst.
+    Gesucht wird auf einer Kopie des Bretts (Züge setzen und zurücknehmen).
+    tablebase: optionale endgame.EndgameTable; ab tablebase.max_empty freien
+    Feldern wird der exakte Wert nachgeschlagen statt weitergesucht.
+    """
+    board = list(board)
+    nodes = 0
+
+    def value(player, depth, alpha, beta, empty):
+        nonlocal nodes
+        nodes += 1
+        if deadline is not None and time.perf_counter() > deadline:
+            raise _Timeout  # jeder Knoten: evaluate kann auf großen Brettern teuer sein
+        if tablebase is not None and empty <= tablebase.max_empty:
+            hit = tablebase.lookup(board)
+            if hit is not None:
+                return hit[1]
+        if depth == 0:
+            v = evaluate(game, board)
+            if deadline is not None and time.perf_counter() > deadline:
+                raise _Timeout
+            return v
+        maximize = player == 'X'
+        other = 'O' if maximize else 'X'
+        v = -math.inf if maximize else math.inf
+        for i in game.moves(board):
+            board[i] = player
+            if game.wins_at(board, i):
+                w = WIN if maximize else -WIN
+            elif empty == 1:
+                w = 0
+            else:
+                w = value(other, depth - 1, alpha, beta, empty - 1)
+            board[i] = ''
+            if maximize:
+                if w > v: v = w
+                if v >= beta: return v
+                alpha = max(alpha, v)
+            else:
+                if w < v: v = w
+                if v <= alpha: return v
+                beta = min(beta, v)
+        return v
+
+    player = game.to_move(board)
+    maximize = player == 'X'
+    moves = game.moves(board)
+    if first in moves:
+        moves.remove(first)
+        moves.insert(0, first)
+    best_val = -math.inf if maximize else math.inf
+    best_action = None
+    alpha, beta = -math.inf, math.inf
+    empty = board.count('')
+    try:
+        for a in moves:
+            board[a] = player
+            if game.wins_at(board, a):
+                v = WIN if maximize else -WIN
+            elif empty == 1:
+                v = 0
+            else:
+                v = value('O' if maximize else 'X', depth - 1, alpha, beta, empty - 1)
+            board[a] = ''
+            if (v > best_val) if maximize else (v < best_val):
+                best_val, best_action = v, a
+            if maximize:
+                alpha = max(alpha, v)
+            else:
+                beta = min(beta, v)
+    finally:
+        if stats is not None:
+            stats["nodes"] = stats.get("nodes", 0) + nodes
+    return best_action, best_val
+
+def iterative_deepening(game, board, max_depth=None, time_budget=None, evaluate=line_evaluation,
+                        tablebase=None):
+    """
+    Tiefe 1, 2, ... bis max_depth (None = bis Spielende) oder bis das Zeitbudget
+    (Sekunden) aufgebraucht ist. Der beste Zug einer Tiefe wird in der nächsten
+    zuerst probiert. Rückgabe: (Zug, Wert, erreichte Tiefe, Knoten) – Zug und
+    Wert stammen aus der letzten vollständig durchsuchten Tiefe. tablebase:
+    siehe alphabeta_depth.
+    """
+    if game.terminal_test(board):
+        return None, game.utility(board), 0, 0
+    limit = board.count('') if max_depth is None else min(max_depth, board.count(''))
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    stats = {"nodes": 0}
+    best_action, best_val, reached = game.moves(board)[0], None, 0
+    for depth in range(1, limit + 1):
+        try:
+            action, val = alphabeta_depth(game, board, depth, evaluate, deadline, best_action, stats,
+                                          tablebase)
+        except _Timeout:
+            if best_val is None:
+                # nicht einmal Tiefe 1 geschafft: Ersatzzug statisch bewerten
+                player = game.to_move(board)
+                after = list(board)
+                after[best_action] = player
+                if game.wins_at(after, best_action):
+                    best_val = WIN if player == 'X' else -WIN
+                else:
+                    best_val = evaluate(game, after)
+            break
+        best_action, best_val, reached = action, val, depth
+        if abs(val) == WIN:
+            break  # Sieg oder Niederlage sicher – tiefer suchen ändert nichts
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+    return best_action, best_val, reached, stats["nodes"]
+
+# Demo
+
+if __name__ == "__main__":
+    from TicTacToe import alphabeta
+
+    ttt = MNKGame(3, 3, 3)
+    board = ttt.initial()
+    print("Tic Tac Toe (3,3,3), volle Tiefe:", iterative_deepening(ttt, board, evaluate=zero_evaluation))
+    print("Zum Vergleich alphabeta():       ", alphabeta(board))
+
+    for m, n, k, radius in ((4, 4, 4, None), (7, 6, 4, None), (15, 15, 5, 1)):
+        game = MNKGame(m, n, k, radius)
+        board = game.initial()
+        board[game.order[0]] = 'X'
+        move, value, depth, nodes = iterative_deepening(game, board, time_budget=1.0)
+        print(f"\n({m},{n},{k}) nach X in der Mitte, 1s Budget: O wählt Feld {move}, "
+              f"Wert {value:.3f}, Tiefe {depth}, {nodes} Knoten")
+        board[move] = 'O'
+        game.print_board(board)
@@ -0,0 +1,201 @@
+# Parallele Suche für Tic Tac Toe – Wurzelaufteilung und Lazy SMP
+#
+# root_split: Die Züge an der Wurzel werden auf einen Prozess-Pool verteilt.
+# Bei Alpha-Beta teilen sich die Prozesse alpha über einen Wert im gemeinsamen
+# Speicher (multiprocessing.Value): wer fertig ist, hebt alpha an, spätere
+# Züge werden mit dem engeren Fenster gesucht.
+#
+# lazy_smp: Mehrere Prozesse durchsuchen dieselbe Stellung komplett, jeder mit
+# einer anderen Zugsortierung, und teilen sich eine Transpositionstabelle im
+# gemeinsamen Speicher (multiprocessing.Array). Das Ergebnis des ersten
+# fertigen Prozesses zählt, die anderen werden beendet. Sterben alle Prozesse
+# ohne Ergebnis (Absturz, OOM-Kill), gibt es einen RuntimeError statt zu hängen.
+#
+# Beide liefern denselben Wert wie die serielle Suche. Bei 3x3 ist die Suche
+# so kurz, dass das Starten der Prozesse überwiegt – die Demo zeigt die Zeiten.
+
+import math
+import multiprocessing as mp
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+
+from TicTacToe import (successors, min_value, min_value_ab, canonical, board_index, alphabeta_with_count,
+                       EXACT, LOWER, UPPER, ORDERINGS)
+
+STRATEGIES = ("root_split", "lazy_smp")
+ALGORITHMS = ("alphabeta", "minimax")
+
+# 1) Wurzelaufteilung
+
+_alpha = None  # gemeinsames alpha im Worker-Prozess (siehe _init_worker)
+
+def _init_worker(alpha):
+    global _alpha
+    _alpha = alpha
+
+def _root_move(algorithm, a, s):
+    if algorithm == "minimax":
+        return a, min_value(s)
+    # Nutzen sind ganzzahlig: mit alpha - 0.5 werden gleich gute Züge noch exakt
+    # bewertet, damit bei Gleichstand wie seriell der erste Zug gewinnt.
+    v = min_value_ab(s, _alpha.value - 0.5, math.inf)
+    with _alpha.get_lock():
+        if v > _alpha.value:
+            _alpha.value = v
+    return a, v
+
+def root_split(board, algorithm="alphabeta", workers=None):
+    """Wurzelzüge parallel bewerten. Rückgabe: (Zug, Wert) wie minimax/alphabeta."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unbekannter Algorithmus: {algorithm!r} (erlaubt: {ALGORITHMS})")
+    moves = successors(board, 'X')
+    if not moves:
+        return None, -math.inf
+    alpha = mp.Value('d', -math.inf)
+    workers = min(workers or os.cpu_count() or 1, len(moves))
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(alpha,)) as pool:
+        # Reihenfolge der Ergebnisse = Reihenfolge der Züge (wichtig bei Gleichstand)
+        results = list(pool.map(_root_move, [algorithm] * len(moves), *zip(*moves)))
+    best_val = -math.inf
+    best_action = None
+    for a, v in results:
+        if v > best_val:
+            best_val, best_action = v, a
+    return best_action, best_val
+
+# 2) Lazy SMP mit gemeinsamer Transpositionstabelle
+#
+# Index: Basis-3-Zahl der kanonischen Stellung ('' = 0, 'X' = 1, 'O' = 2), der
+# Spieler am Zug folgt aus der Anzahl der Steine. Ein Eintrag ist ein Byte:
+# 0 = leer, sonst 1 + Zug*9 + Flag*3 + (Wert+1) mit Zug 9 = keiner. Ein Byte
+# wird immer ganz geschrieben, daher reicht die Tabelle ohne Lock.
+
+SIZE = 3 ** 9
+NO_MOVE = 9
+
+class SharedTable:
+    """TranspositionTable (gleiche Schnittstelle) auf einem gemeinsamen Array."""
+
+    def __init__(self, array=None):
+        self.array = mp.Array('b', SIZE, lock=False) if array is None else array
+        self.hits = 0
+
+    def __len__(self):
+        return sum(1 for e in self.array if e)
+
+    def key(self, board, player):
+        cells, perm = canonical(board)
+        return board_index(cells), perm
+
+    def _entry(self, key):
+        code = self.array[key]
+        if not code:
+            return None
+        move, rest = divmod(code - 1, 9)
+        flag, value = divmod(rest, 3)
+        return value - 1, flag, None if move == NO_MOVE else move
+
+    def probe(self, key, alpha, beta):
+        entry = self._entry(key)
+        if entry is None:
+            return None, alpha, beta
+        value, flag, _ = entry
+        if flag == LOWER:
+            alpha = max(alpha, value)
+        elif flag == UPPER:
+            beta = min(beta, value)
+        if flag == EXACT or alpha >= beta:
+            self.hits += 1
+            return value, alpha, beta
+        return None, alpha, beta
+
+    def store(self, key, perm, value, alpha, beta, move=None):
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        move = NO_MOVE if move is None else perm.index(move)
+        self.array[key] = 1 + move * 9 + flag * 3 + int(value) + 1
+
+    def best_move(self, key, perm):
+        entry = self._entry(key)
+        if entry is None or entry[2] is None:
+            return None
+        return perm[entry[2]]
+
+def _lazy_worker(board, array, ordering, worker, results):
+    move, value, nodes = alphabeta_with_count(board, SharedTable(array), ordering)
+    results.put((worker, move, value, nodes))
+
+def lazy_smp(board, workers=None, orderings=ORDERINGS):
+    """
+    Alle Prozesse suchen die ganze Stellung, Prozess i mit orderings[i % len].
+    Rückgabe: (Zug, Wert, Knoten, Zugsortierung) des ersten fertigen Prozesses.
+    RuntimeError, wenn alle Prozesse ohne Ergebnis beendet sind.
+    """
+    workers = workers or min(os.cpu_count() or 1, len(orderings))
+    array = mp.Array('b', SIZE, lock=False)
+    results = mp.Queue()
+    procs = [mp.Process(target=_lazy_worker,
+                        args=(board, array, orderings[i % len(orderings)], i, results))
+             for i in range(workers)]
+    for p in procs:
+        p.start()
+    try:
+        while True:
+            alive = any(p.is_alive() for p in procs)
+            try:
+                # nach dem Ende aller Prozesse kann ein Ergebnis noch in der Queue unterwegs sein
+                worker, move, value, nodes = results.get(timeout=0.1 if alive else 1.0)
+                break
+            except queue.Empty:
+                if not alive:
+                    raise RuntimeError("lazy_smp: alle Prozesse ohne Ergebnis beendet (Exitcodes "
+                                       f"{[p.exitcode for p in procs]})") from None
+    finally:
+        for p in procs:
+            p.terminate()
+            p.join()
+    return move, value, nodes, orderings[worker % len(orderings)]
+
+def parallel_search(board, strategy="root_split", workers=None, algorithm="alphabeta"):
+    """Einstieg für beide Strategien. Rückgabe: (Zug, Wert) wie alphabeta."""
+    if strategy == "root_split":
+        return root_split(board, algorithm, workers)
+    if strategy == "lazy_smp":
+        if algorithm != "alphabeta":
+            raise ValueError("lazy_smp gibt es nur für alphabeta")
+        return lazy_smp(board, workers)[:2]
+    raise ValueError(f"Unbekannte Strategie: {strategy!r} (erlaubt: {STRATEGIES})")
+
+# Demo
+
+if __name__ == "__main__":
+    import time
+    from TicTacToe import print_board, minimax, alphabeta
+
+    board = [''] * 9
+    mid = [
+        'X','O','X',
+        '','O','',
+        '','',''
+    ]
+    for name, b in (("Startzustand", board), ("Beispielposition", mid)):
+        print(name + ":")
+        print_board(b)
+        for label, serial, parallel in (
+                ("Minimax   root_split:", minimax, lambda b: root_split(b, "minimax")),
+                ("AlphaBeta root_split:", alphabeta, lambda b: root_split(b)),
+                ("AlphaBeta lazy_smp:  ", alphabeta, lambda b: lazy_smp(b)[:2])):
+            t0 = time.perf_counter()
+            ref = serial(b)
+            t1 = time.perf_counter()
+            res = parallel(b)
+            t2 = time.perf_counter()
+            assert res[1] == ref[1]
+            print(label, "move =", res[0], "value =", res[1],
+                  f"| seriell {t1 - t0:.3f}s, parallel {t2 - t1:.3f}s")
+        print()